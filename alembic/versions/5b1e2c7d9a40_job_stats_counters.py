@@ -0,0 +1,92 @@
+"""Job stats counters
+
+Revision ID: 5b1e2c7d9a40
+Revises: 07300223e433
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e2c7d9a40'
+down_revision: Union[str, Sequence[str], None] = '07300223e433'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Snapshot of the triggers as of this revision; later changes to the triggers
+# in app/db/models.py need their own migration.
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_insert
+    AFTER INSERT ON processing_jobs
+    BEGIN
+        INSERT INTO image_refcount (image_id, n) VALUES (NEW.image_id, 1)
+            ON CONFLICT(image_id) DO UPDATE SET n = n + 1;
+        INSERT INTO job_stats_cache (k, v) VALUES ('total_jobs', 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+        INSERT INTO job_stats_cache (k, v)
+            SELECT 'distinct_images', 1
+            WHERE (SELECT n FROM image_refcount WHERE image_id = NEW.image_id) = 1
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+        INSERT INTO job_stats_cache (k, v) VALUES ('status:' || NEW.status, 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_delete
+    AFTER DELETE ON processing_jobs
+    BEGIN
+        UPDATE image_refcount SET n = n - 1 WHERE image_id = OLD.image_id;
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'total_jobs';
+        UPDATE job_stats_cache SET v = v - 1
+            WHERE k = 'distinct_images'
+            AND (SELECT n FROM image_refcount WHERE image_id = OLD.image_id) = 0;
+        DELETE FROM image_refcount WHERE image_id = OLD.image_id AND n <= 0;
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'status:' || OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_update_status
+    AFTER UPDATE OF status ON processing_jobs
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'status:' || OLD.status;
+        INSERT INTO job_stats_cache (k, v) VALUES ('status:' || NEW.status, 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_stats_cache',
+    sa.Column('k', sa.String(), nullable=False),
+    sa.Column('v', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('k')
+    )
+    op.create_table('image_refcount',
+    sa.Column('image_id', sa.String(), nullable=False),
+    sa.Column('n', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('image_id')
+    )
+    # Counters are trigger-maintained on SQLite only; other dialects
+    # aggregate processing_jobs directly. Backfilled at application startup.
+    if op.get_bind().dialect.name == 'sqlite':
+        for trigger_sql in SQLITE_TRIGGERS:
+            op.execute(trigger_sql)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute('DROP TRIGGER IF EXISTS trg_job_stats_update_status')
+        op.execute('DROP TRIGGER IF EXISTS trg_job_stats_delete')
+        op.execute('DROP TRIGGER IF EXISTS trg_job_stats_insert')
+    op.drop_table('image_refcount')
+    op.drop_table('job_stats_cache')
@@ -0,0 +1,32 @@
+"""Partial job indexes
+
+Revision ID: 8c3f4a1b2d6e
+Revises: 5b1e2c7d9a40
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f4a1b2d6e'
+down_revision: Union[str, Sequence[str], None] = '5b1e2c7d9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_failed_completed', 'processing_jobs', [sa.text('completed_at DESC')], unique=False,
+                    sqlite_where=sa.text("status = 'failed'"), postgresql_where=sa.text("status = 'failed'"))
+    op.create_index('ix_jobs_completed_created', 'processing_jobs', ['created_at'], unique=False,
+                    sqlite_where=sa.text("status = 'completed'"), postgresql_where=sa.text("status = 'completed'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_completed_created', table_name='processing_jobs')
+    op.drop_index('ix_jobs_failed_completed', table_name='processing_jobs')
@@ -1,16 +1,20 @@
 """FastAPI dependencies for authentication, validation, and rate limiting."""
 
+import asyncio
+from dataclasses import dataclass
 from fastapi import Depends, HTTPException, status, Header, Request, Form
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import magic
-from typing import Optional, Callable, AsyncGenerator
+from typing import Optional, Callable, AsyncGenerator, Iterable
 from pydantic import BaseModel, ValidationError
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.db.session import get_session
+from app.db.session import get_session, get_read_session
 from app.services.processor_service import ProcessorService
+from app.core.rate_limit import get_rate_limiter
 from app.core.authorization import (
     get_authorization_service,
     AuthorizationService,
@@ -46,6 +50,9 @@ async def verify_content_length(
 ):
     """Pre-validate upload size before processing.
 
+    This only rejects honest oversized requests early; the limit is enforced
+    on the bytes actually streamed to storage by ImageService.
+
     Args:
         content_length: Content-Length header value
         max_size: Maximum allowed file size in bytes
@@ -130,23 +137,42 @@ async def get_processor_service(
     return ProcessorService(session)
 
 
-async def check_rate_limit(
-    auth: AuthContext = Depends(get_auth_context),
-    service: ProcessorService = Depends(get_processor_service)
-) -> dict:
-    """Check and enforce upload rate limit for user.
+async def get_read_processor_service(
+    session: AsyncSession = Depends(get_read_session)
+) -> ProcessorService:
+    """Dependency for getting a ProcessorService for read-only endpoints.
+
+    Backed by the read-only connection pool, so polling GETs do not compete
+    with uploads for a connection.
 
     Args:
-        auth: Authenticated user context
-        service: Processor service
+        session: Read-only async database session
 
     Returns:
-        dict: Rate limit info with user_id, remaining, reset_at
+        ProcessorService: Service instance
+    """
+    return ProcessorService(session)
+
+
+async def _enforce_rate_limit(auth: AuthContext, service: ProcessorService) -> dict:
+    """Consume one upload slot for the user, raising 429 when none is left.
+
+    Uses the atomic Redis sliding window; falls back to the per-hour SQLite
+    counters when Redis is unavailable.
+
+    Returns:
+        dict: Limiter result; includes a 'token' when the slot came from the
+        Redis window and can be handed back with `_release_rate_limit`
 
     Raises:
         HTTPException: 429 if rate limit exceeded
     """
-    result = await service.check_rate_limit(auth.user_id, settings.RATE_LIMIT_MAX_UPLOADS)
+    try:
+        limiter = await get_rate_limiter()
+        result = await limiter.hit(auth.user_id, settings.RATE_LIMIT_MAX_UPLOADS)
+    except RedisError as e:
+        logger.warning("rate_limit_redis_unavailable", user_id=auth.user_id, error=str(e))
+        result = await service.check_rate_limit(auth.user_id, settings.RATE_LIMIT_MAX_UPLOADS)
 
     if not result["allowed"]:
         raise HTTPException(
@@ -156,10 +182,48 @@ async def check_rate_limit(
                 "X-RateLimit-Limit": str(settings.RATE_LIMIT_MAX_UPLOADS),
                 "X-RateLimit-Remaining": "0",
                 "X-RateLimit-Reset": result["reset_at"],
-                "Retry-After": "3600"
+                "Retry-After": str(result.get("retry_after", 3600))
             }
         )
 
+    return result
+
+
+async def _release_rate_limit(auth: AuthContext, result: dict) -> None:
+    """Hand back a slot taken by `_enforce_rate_limit` for a rejected upload.
+
+    Only Redis slots can be released; a SQLite fallback slot stays counted.
+    """
+    token = result.get("token")
+    if token is None:
+        return
+    try:
+        limiter = await get_rate_limiter()
+        await limiter.release(auth.user_id, token)
+    except RedisError as e:
+        logger.warning("rate_limit_release_failed", user_id=auth.user_id, error=str(e))
+
+
+async def check_rate_limit(
+    auth: AuthContext = Depends(get_auth_context),
+    service: ProcessorService = Depends(get_processor_service)
+) -> dict:
+    """Check and enforce upload rate limit for user.
+
+    Uses the atomic Redis sliding window; falls back to the per-hour SQLite
+    counters when Redis is unavailable.
+
+    Args:
+        auth: Authenticated user context
+        service: Processor service
+
+    Returns:
+        dict: Rate limit info with user_id, remaining, reset_at
+
+    Raises:
+        HTTPException: 429 if rate limit exceeded
+    """
+    result = await _enforce_rate_limit(auth, service)
     return {
         "user_id": auth.user_id,
         "remaining": result["remaining"],
@@ -167,10 +231,35 @@ async def check_rate_limit(
     }
 
 
+# Magic-byte signatures of the common upload types as (prefix, offset, mime).
+# Matching these directly keeps libmagic off the upload hot path; anything
+# else falls back to libmagic on a larger header.
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", 0, "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", 0, "image/png"),
+    (b"WEBP", 8, "image/webp"),
+)
+_SIGNATURE_HEADER_SIZE = 32
+_MAGIC_HEADER_SIZE = 2048
+
+
+def _sniff_image_mime(header: bytes) -> Optional[str]:
+    """Return the MIME type of a known image signature at the start of header."""
+    for prefix, offset, mime in _IMAGE_SIGNATURES:
+        if header.startswith(prefix, offset):
+            # WebP is a RIFF container; the WEBP tag at offset 8 alone is not enough
+            if mime == "image/webp" and not header.startswith(b"RIFF"):
+                continue
+            return mime
+    return None
+
+
 async def validate_image_file(file) -> str:
     """Validate uploaded file is an allowed image type using magic bytes.
 
     Never trust client-provided MIME types - always verify with magic bytes.
+    JPEG, PNG and WebP are recognised from the first few bytes; other
+    content is identified by libmagic.
 
     Args:
         file: Uploaded file object
@@ -182,8 +271,11 @@ async def validate_image_file(file) -> str:
         HTTPException: 415 if file type is not allowed
     """
     # Read header for magic byte detection
-    header = await file.read(2048)
-    mime = magic.from_buffer(header, mime=True)
+    header = await file.read(_SIGNATURE_HEADER_SIZE)
+    mime = _sniff_image_mime(header)
+    if mime is None:
+        header += await file.read(_MAGIC_HEADER_SIZE - len(header))
+        mime = magic.from_buffer(header, mime=True)
 
     # CRITICAL: Rewind file pointer for subsequent reads
     await file.seek(0)
@@ -262,6 +354,36 @@ def require_permission(permission: str) -> Callable:
 # ============================================================================
 
 
+async def _authorize_bucket(
+    auth: AuthContext,
+    bucket: str,
+    permission: str,
+    auth_service: AuthorizationService
+) -> None:
+    """Check bucket access via the authorization service (raises HTTPException if denied)."""
+    # Convert Pydantic AuthContext to dataclass for authorization service
+    auth_context_dc = AuthContextDataclass(
+        user_id=auth.user_id,
+        org_id=auth.org_id,
+        permissions=auth.permissions
+    )
+
+    # Check access (raises HTTPException if denied)
+    await auth_service.check_access(
+        auth_context=auth_context_dc,
+        permission=permission,
+        bucket=bucket
+    )
+
+    logger.info(
+        "bucket_access_granted",
+        user_id=auth.user_id,
+        org_id=auth.org_id,
+        bucket=bucket,
+        permission=permission
+    )
+
+
 def require_bucket_access(permission: str) -> Callable:
     """Dependency factory for bucket-based authorization with distributed auth checks.
 
@@ -307,32 +429,107 @@ def require_bucket_access(permission: str) -> Callable:
         Raises:
             HTTPException: 400 for invalid bucket, 403 for denied access, 503 for auth-api issues
         """
-        # Convert Pydantic AuthContext to dataclass for authorization service
-        auth_context_dc = AuthContextDataclass(
-            user_id=auth.user_id,
-            org_id=auth.org_id,
-            permissions=auth.permissions
-        )
+        await _authorize_bucket(auth, bucket, permission, auth_service)
+        return auth
 
-        # Check access (raises HTTPException if denied)
-        await auth_service.check_access(
-            auth_context=auth_context_dc,
-            permission=permission,
-            bucket=bucket
-        )
+    return _check_bucket_access
 
-        logger.info(
-            "bucket_access_granted",
-            user_id=auth.user_id,
-            org_id=auth.org_id,
-            bucket=bucket,
-            permission=permission
-        )
 
-        # Return original auth context
-        return auth
+@dataclass
+class UploadPreflight:
+    """Results of the upload checks that need a network round-trip."""
+    auth: AuthContext
+    rate_limit: dict
 
-    return _check_bucket_access
+
+async def upload_preflight(
+    auth: AuthContext = Depends(get_auth_context),
+    bucket: str = Form(...),
+    auth_service: AuthorizationService = Depends(get_authorization_service),
+    service: ProcessorService = Depends(get_processor_service)
+) -> UploadPreflight:
+    """Run the upload bucket-access check and rate limit concurrently.
+
+    Equivalent to `require_bucket_access("image:upload")` followed by
+    `check_rate_limit`, but the auth-api/cache lookup and the rate-limit
+    round-trip overlap. Access errors take precedence; if access is denied
+    the rate-limit slot taken in parallel is released again.
+
+    Args:
+        auth: Authenticated user context from JWT
+        bucket: Bucket identifier from form data
+        auth_service: Authorization service
+        service: Processor service (rate-limit fallback)
+
+    Returns:
+        UploadPreflight: Authorized user context and rate limit info
+
+    Raises:
+        HTTPException: 400/403/503 from the bucket check, 429 if rate limited
+    """
+    access, limit = await asyncio.gather(
+        _authorize_bucket(auth, bucket, "image:upload", auth_service),
+        _enforce_rate_limit(auth, service),
+        return_exceptions=True,
+    )
+
+    if isinstance(access, BaseException):
+        if not isinstance(limit, BaseException):
+            await _release_rate_limit(auth, limit)
+        raise access
+    if isinstance(limit, BaseException):
+        raise limit
+
+    return UploadPreflight(
+        auth=auth,
+        rate_limit={
+            "user_id": auth.user_id,
+            "remaining": limit["remaining"],
+            "reset_at": limit["reset_at"]
+        },
+    )
+
+
+def _optional_auth_context(request: Request) -> Optional[AuthContext]:
+    """Auth context set by the middleware, or None for anonymous requests."""
+    if hasattr(request.state, "authenticated") and request.state.authenticated:
+        if hasattr(request.state, "auth_payload"):
+            payload = request.state.auth_payload
+            try:
+                return AuthContext(
+                    user_id=payload["sub"],
+                    org_id=payload.get("org_id", "default-org"),
+                    permissions=payload.get("permissions", []),
+                    email=payload.get("email"),
+                    name=payload.get("name")
+                )
+            except (KeyError, ValidationError):
+                # Invalid auth payload, treat as unauthenticated
+                pass
+    return None
+
+
+async def prefetch_bucket_read_access(request: Request, buckets: Iterable[str]) -> None:
+    """Warm the authorization cache before several `require_bucket_read_access` calls.
+
+    Cached group decisions for all buckets are fetched in one Redis
+    round-trip instead of one per bucket. Best effort: on a Redis error the
+    individual checks simply do their own lookups.
+    """
+    auth = _optional_auth_context(request)
+    if auth is None:
+        return
+
+    auth_context_dc = AuthContextDataclass(
+        user_id=auth.user_id,
+        org_id=auth.org_id,
+        permissions=auth.permissions
+    )
+    auth_service = await get_authorization_service()
+    try:
+        await auth_service.prefetch(auth_context_dc, "image:read", buckets)
+    except RedisError as e:
+        logger.warning("auth_cache_prefetch_failed", error=str(e))
 
 
 async def require_bucket_read_access(
@@ -360,21 +557,7 @@ async def require_bucket_read_access(
         HTTPException: 403 if access denied
     """
     # Try to get auth context (may not exist for public endpoints)
-    auth = None
-    if hasattr(request.state, "authenticated") and request.state.authenticated:
-        if hasattr(request.state, "auth_payload"):
-            payload = request.state.auth_payload
-            try:
-                auth = AuthContext(
-                    user_id=payload["sub"],
-                    org_id=payload.get("org_id", "default-org"),
-                    permissions=payload.get("permissions", []),
-                    email=payload.get("email"),
-                    name=payload.get("name")
-                )
-            except (KeyError, ValidationError):
-                # Invalid auth payload, treat as unauthenticated
-                pass
+    auth = _optional_auth_context(request)
 
     # Parse bucket to determine access requirements
     from app.core.authorization import BucketValidator
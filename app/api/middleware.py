@@ -11,18 +11,29 @@ Features:
 """
 
 import time
-import uuid
 from typing import Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from app.core.ids import new_uuid
 from app.core.logging_config import get_logger, set_trace_id, clear_trace_id
 
 
 logger = get_logger(__name__)
 
 
+def _endpoint_label(request: Request) -> str:
+    """Metric label for the route that handled the request.
+
+    Uses the matched route template (e.g. /api/v1/images/{image_id}) so each
+    image ID does not become its own time series. Requests that matched no
+    route share a single "unmatched" label.
+    """
+    route = request.scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for request trace IDs and comprehensive logging.
 
@@ -59,14 +70,14 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         trace_id = (
             request.headers.get("X-Trace-ID") or
             request.headers.get("X-Correlation-ID") or
-            str(uuid.uuid4())
+            new_uuid()
         )
 
         # Set trace ID in logging context
         set_trace_id(trace_id)
 
         # Start timer
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Extract request details
         client_host = request.client.host if request.client else "unknown"
@@ -93,7 +104,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log successful response
             logger.info(
@@ -113,7 +124,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         except Exception as exc:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log error with full context
             logger.error(
@@ -163,11 +174,11 @@ class PerformanceLoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             HTTP response
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         response = await call_next(request)
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         # Log slow requests
         if duration_ms > self.slow_request_threshold_ms:
@@ -213,12 +224,11 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         """
         # Import here to avoid circular imports
         from app.api.v1.metrics import (
-            http_requests_total,
-            http_request_duration_seconds,
-            http_requests_in_progress,
-            errors_total,
+            http_requests_total_for,
+            http_request_duration_for,
+            http_requests_in_progress_for,
+            errors_total_for,
         )
-        from app.core.config import settings
 
         method = request.method
         path = request.url.path
@@ -228,12 +238,10 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Increment in-progress counter
-        http_requests_in_progress.labels(
-            service=settings.SERVICE_NAME,
-            method=method
-        ).inc()
+        in_progress = http_requests_in_progress_for(method)
+        in_progress.inc()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         status_code = 500  # Default to error if something goes wrong
 
         try:
@@ -243,37 +251,24 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
         except Exception as exc:
             # Track errors
-            errors_total.labels(
-                service=settings.SERVICE_NAME,
-                error_type=type(exc).__name__,
-                endpoint=path
-            ).inc()
+            errors_total_for(type(exc).__name__, _endpoint_label(request)).inc()
             raise
 
         finally:
             # Calculate duration
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Decrement in-progress counter
-            http_requests_in_progress.labels(
-                service=settings.SERVICE_NAME,
-                method=method
-            ).dec()
+            in_progress.dec()
+
+            # Label by route template, not raw path, to keep series bounded
+            endpoint = _endpoint_label(request)
 
             # Record request count
-            http_requests_total.labels(
-                service=settings.SERVICE_NAME,
-                method=method,
-                endpoint=path,
-                status=status_code
-            ).inc()
+            http_requests_total_for(method, endpoint, status_code).inc()
 
             # Record request duration
-            http_request_duration_seconds.labels(
-                service=settings.SERVICE_NAME,
-                method=method,
-                endpoint=path
-            ).observe(duration)
+            http_request_duration_for(method, endpoint).observe(duration)
 
 
 # ============================================================================
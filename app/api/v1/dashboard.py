@@ -1,10 +1,11 @@
 """Technical dashboard API for system monitoring and troubleshooting."""
 
 import aiosqlite
+import hashlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import HTMLResponse
 from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +15,8 @@ import os
 from app.db.session import get_session
 from app.db.models import ProcessingJob, ImageUploadEvent, UploadRateLimit
 from app.core.config import settings
+from app.repositories.job_repository import JobRepository
+from app.repositories.job_stats_repository import JobStatsRepository
 from app.core.logging_config import get_logger
 from app.tasks.celery_app import celery_app
 
@@ -197,43 +200,18 @@ async def get_processing_metrics(session: AsyncSession) -> Dict[str, Any]:
         dict: Processing metrics
     """
     try:
-        # Jobs by status
-        stmt = select(ProcessingJob.status, func.count(ProcessingJob.job_id)).group_by(ProcessingJob.status)
-        result = await session.execute(stmt)
-        jobs_by_status = {row[0]: row[1] for row in result.all()}
-
-        # Helper to calculate metrics for a timeframe
-        async def calc_metrics(cutoff_time):
-            stmt = select(ProcessingJob).where(ProcessingJob.created_at > cutoff_time)
-            result = await session.execute(stmt)
-            jobs = result.scalars().all()
-
-            total = len(jobs)
-            completed = sum(1 for j in jobs if j.status == 'completed')
-            failed = sum(1 for j in jobs if j.status == 'failed')
-
-            durations = []
-            for j in jobs:
-                if j.status == 'completed' and j.completed_at and j.created_at:
-                     # ensure aware datetimes
-                    start = j.created_at
-                    end = j.completed_at
-                    if start.tzinfo is None: start = start.replace(tzinfo=timezone.utc)
-                    if end.tzinfo is None: end = end.replace(tzinfo=timezone.utc)
-                    durations.append((end - start).total_seconds())
-
-            avg_seconds = round(sum(durations) / len(durations), 2) if durations else None
-
-            return {
-                "total": total,
-                "completed": completed,
-                "failed": failed,
-                "avg_processing_time_seconds": avg_seconds
-            }
+        # Jobs by status (trigger-maintained counters)
+        stats_repo = JobStatsRepository(session)
+        jobs_by_status = (await stats_repo.get_counters())["status"]
 
+        # Totals and average processing time for both windows in one query
         now = datetime.now(timezone.utc)
-        last_hour = await calc_metrics(now - timedelta(hours=1))
-        last_24h = await calc_metrics(now - timedelta(hours=24))
+        windows = await stats_repo.get_window_metrics({
+            "last_hour": now - timedelta(hours=1),
+            "last_24h": now - timedelta(hours=24),
+        })
+        last_hour = windows["last_hour"]
+        last_24h = windows["last_24h"]
 
         # Recent jobs (last 10)
         stmt_recent = select(ProcessingJob).order_by(ProcessingJob.created_at.desc()).limit(10)
@@ -242,19 +220,13 @@ async def get_processing_metrics(session: AsyncSession) -> Dict[str, Any]:
 
         recent_jobs = []
         for row in rows:
+            # Timestamps load as aware UTC datetimes (UTCDateTime)
             proc_time = None
             if row.completed_at and row.created_at:
-                # ensure aware datetimes
-                start = row.created_at
-                end = row.completed_at
-                if start.tzinfo is None: start = start.replace(tzinfo=timezone.utc)
-                if end.tzinfo is None: end = end.replace(tzinfo=timezone.utc)
-                proc_time = (end - start).total_seconds()
+                proc_time = (row.completed_at - row.created_at).total_seconds()
             elif row.created_at:
                 # if not completed, time since creation
-                start = row.created_at
-                if start.tzinfo is None: start = start.replace(tzinfo=timezone.utc)
-                proc_time = (now - start).total_seconds()
+                proc_time = (now - row.created_at).total_seconds()
 
             recent_jobs.append({
                 "job_id": row.job_id,
@@ -383,47 +355,21 @@ async def get_error_info(session: AsyncSession) -> Dict[str, Any]:
         dict: Error metrics
     """
     try:
-        # Recent failures (last 10)
-        stmt_recent = select(ProcessingJob).where(
-            ProcessingJob.status == 'failed'
-        ).order_by(ProcessingJob.completed_at.desc()).limit(10)
-
-        result_recent = await session.execute(stmt_recent)
-        rows = result_recent.scalars().all()
+        repo = JobRepository(session)
 
         recent_failures = [
             {
-                "job_id": row.job_id,
-                "image_id": row.image_id,
-                "error": row.last_error,
-                "attempts": row.attempt_count,
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "failed_at": row.completed_at.isoformat() if row.completed_at else None
+                "job_id": job_id,
+                "image_id": image_id,
+                "error": error,
+                "attempts": attempts,
+                "created_at": created_at.isoformat() if created_at else None,
+                "failed_at": failed_at.isoformat() if failed_at else None
             }
-            for row in rows
+            async for job_id, image_id, error, attempts, created_at, failed_at
+            in repo.iter_recent_failures(limit=10)
         ]
-
-        # Error summary
-        # This logic mimics the SQL SUM(CASE...) logic in python to be DB agnostic or require complex SQL expression
-        # Using simple counts for now
-
-        cutoff_1h = datetime.now(timezone.utc) - timedelta(hours=1)
-        cutoff_24h = datetime.now(timezone.utc) - timedelta(hours=24)
-
-        stmt_1h = select(func.count()).where(ProcessingJob.status == 'failed', ProcessingJob.created_at > cutoff_1h)
-        count_1h = (await session.execute(stmt_1h)).scalar() or 0
-
-        stmt_24h = select(func.count()).where(ProcessingJob.status == 'failed', ProcessingJob.created_at > cutoff_24h)
-        count_24h = (await session.execute(stmt_24h)).scalar() or 0
-
-        stmt_total = select(func.count()).where(ProcessingJob.status == 'failed')
-        count_total = (await session.execute(stmt_total)).scalar() or 0
-
-        error_summary = {
-            "last_hour": count_1h,
-            "last_24h": count_24h,
-            "total": count_total
-        }
+        error_summary = await repo.get_failure_summary()
 
         return {
             "recent_failures": recent_failures,
@@ -551,18 +497,10 @@ async def get_dashboard_data(session: AsyncSession = Depends(get_session)):
     }
 
 
-@router.get("/", response_class=HTMLResponse)
-async def dashboard_ui():
-    """Serve interactive HTML dashboard for system monitoring.
-
-    Returns:
-        HTMLResponse: Dashboard interface with auto-refresh
-    """
-    # ... (HTML content is same as before, just omitting for brevity if allowed, but must keep it valid)
-    # I'll assume the HTML content is static and doesn't need changes, so I'll keep it.
-    # Wait, I need to provide the full content or I break the file.
-
-    html_content = """
+# Static dashboard page. Encoded and fingerprinted once at import so a request
+# only hands a prebuilt body to the server; the ETag lets browsers revalidate
+# with a bodyless 304.
+_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -1120,7 +1058,7 @@ async def dashboard_ui():
                                 </tr>
                             </thead>
                             <tbody>
-                                ${errors.recent_failures.slice(0, 10).map(job => `
+                                ${errors.recent_failures.map(job => `
                                     <tr>
                                         <td><code>${job.job_id.substring(0, 8)}...</code></td>
                                         <td><code>${job.image_id.substring(0, 8)}...</code></td>
@@ -1171,7 +1109,32 @@ async def dashboard_ui():
     </script>
 </body>
 </html>
+"""
+_DASHBOARD_BYTES = _DASHBOARD_HTML.encode("utf-8")
+_DASHBOARD_ETAG = f'"{hashlib.sha256(_DASHBOARD_BYTES).hexdigest()[:32]}"'
+_DASHBOARD_HEADERS = {
+    "Cache-Control": "public, max-age=60",
+    "ETag": _DASHBOARD_ETAG,
+}
+
+
+@router.get("/", response_class=HTMLResponse)
+async def dashboard_ui(request: Request):
+    """Serve interactive HTML dashboard for system monitoring.
+
+    Args:
+        request: HTTP request (checked for If-None-Match)
+
+    Returns:
+        Response: Precomputed dashboard page, or 304 if the client copy is current
     """
-    return HTMLResponse(content=html_content)
+    if request.headers.get("if-none-match") == _DASHBOARD_ETAG:
+        return Response(status_code=304, headers=_DASHBOARD_HEADERS)
+
+    return Response(
+        content=_DASHBOARD_BYTES,
+        media_type="text/html",
+        headers=_DASHBOARD_HEADERS
+    )
 
 # Updated: 2025-11-18 22:01 UTC - Production-ready code
@@ -1,19 +1,64 @@
 """Health and monitoring API endpoints."""
 
-from fastapi import APIRouter, Depends
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import select, func, text
+from typing import AsyncIterator, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
-from app.db.models import ProcessingJob
+from app.db.session import AsyncSessionLocal, get_session
+from app.repositories.job_repository import JobRepository
+from app.repositories.job_stats_repository import JobStatsRepository
+from app.core.authorization import get_redis_pool
+from app.core.cache import SingleFlight, TTLCache, cached_utc_timestamp
 from app.core.config import settings
 from app.core.logging_config import get_logger
 from app.tasks.celery_app import celery_app
 
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/api/v1/health", tags=["health"])
+# Payloads are returned as ORJSONResponse instances directly: orjson encodes
+# them (including datetime values) in C, and returning a Response skips
+# FastAPI's pure-Python jsonable_encoder pass.
+router = APIRouter(prefix="/api/v1/health", tags=["health"], default_response_class=ORJSONResponse)
+
+# Configuration-derived parts of the health payloads never change at runtime,
+# so build them once and merge in the dynamic fields per request.
+_STATIC_HEALTH = {
+    "status": "healthy",
+    "service": settings.SERVICE_NAME,
+    "version": settings.VERSION,
+}
+
+_STATIC_AUTH_HEALTH = {
+    "jwt_validation": {
+        "mode": "HS256 Shared Secret",
+        "issuer": settings.AUTH_API_ISSUER_URL,
+        "audience": settings.AUTH_API_AUDIENCE,
+        "algorithm": settings.JWT_ALGORITHM,
+    },
+    "authorization": {
+        "enabled": True,
+        "cache_enabled": settings.AUTH_CACHE_ENABLED,
+        "cache_ttl_allowed_seconds": settings.AUTH_CACHE_TTL_ALLOWED,
+        "cache_ttl_denied_seconds": settings.AUTH_CACHE_TTL_DENIED,
+        "cache_ttl_by_permission_seconds": settings.AUTH_CACHE_TTL_BY_PERMISSION,
+        "fail_mode": "closed" if not settings.AUTH_FAIL_OPEN else "open",
+    },
+}
+
+_STATIC_CIRCUIT_BREAKER = {
+    "enabled": settings.CIRCUIT_BREAKER_ENABLED,
+    "threshold": settings.CIRCUIT_BREAKER_THRESHOLD,
+    "timeout_seconds": settings.CIRCUIT_BREAKER_TIMEOUT,
+}
 
 
 @router.get("/")
@@ -26,95 +71,109 @@ async def health_check():
     Returns:
         dict: Health status with service info and timestamp
     """
-    return {
-        "status": "healthy",
-        "service": settings.SERVICE_NAME,
-        "version": settings.VERSION,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    return ORJSONResponse({**_STATIC_HEALTH, "timestamp": cached_utc_timestamp()})
 
 
-@router.get("/stats")
-async def get_statistics(session: AsyncSession = Depends(get_session)):
-    """Get detailed processing statistics.
+# Monitoring payloads are memoized briefly so frequent pollers share one
+# round of database aggregations and Celery/auth-api calls.
+_stats_cache = TTLCache(min_ttl=5, max_ttl=15)
 
-    Provides insights into:
-    - Job status breakdown
-    - 24-hour performance metrics
-    - Storage statistics
-    - Celery worker status
 
-    Args:
-        session: Database session
+_HEALTHZ_BODY = b'{"ok":true}'
+
+
+@router.get("/healthz")
+async def liveness_probe():
+    """Liveness probe for load balancers and orchestrators.
+
+    Returns a precomputed static body without touching the database,
+    Celery or auth-api. Use this as the probe target; `/stats` and `/auth`
+    are expensive introspection endpoints and must not be polled for
+    liveness.
 
     Returns:
-        dict: Comprehensive statistics
+        Response: {"ok": true}
     """
-    # Status breakdown
-    stmt = select(ProcessingJob.status, func.count(ProcessingJob.job_id)).group_by(ProcessingJob.status)
-    result = await session.execute(stmt)
-    status_counts = {row[0]: row[1] for row in result.all()}
-
-    # Performance metrics (last 24 hours)
-    # SQLAlchemy doesn't have a generic 'julianday' function for all dialects.
-    # We should use python calculation or dialect specific sql.
-    # Since we use asyncpg (Postgres) or aiosqlite (SQLite), we need to be careful.
-    # However, we can fetch the records and calculate in python if dataset is small,
-    # or write compatible SQL.
-
-    # For SQLite: julianday(completed_at) - julianday(created_at)
-    # For Postgres: extract(epoch from (completed_at - created_at))
-
-    # Let's try to be generic by fetching completed jobs in last 24h
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
 
-    stmt = select(ProcessingJob).where(
-        ProcessingJob.status == 'completed',
-        ProcessingJob.created_at > cutoff
-    )
-    result = await session.execute(stmt)
-    jobs = result.scalars().all()
 
-    total_completed_24h = len(jobs)
-    total_duration = 0.0
+@router.get("/stats")
+async def get_statistics():
+    """Get detailed processing statistics.
 
-    for job in jobs:
-        if job.completed_at and job.created_at:
-            # ensure timezones match or are aware
-            start = job.created_at
-            end = job.completed_at
-            if start.tzinfo is None: start = start.replace(tzinfo=timezone.utc)
-            if end.tzinfo is None: end = end.replace(tzinfo=timezone.utc)
+    Expensive; do not use for liveness probes (see `/healthz`).
+    Results are cached in-process for 5-15 seconds depending on how long
+    they took to compute. The refresh is shared by concurrent callers, so
+    it opens its own session rather than borrowing one request's.
 
-            total_duration += (end - start).total_seconds()
+    Returns:
+        ORJSONResponse: Comprehensive statistics with Cache-Control set
+    """
+    payload, ttl = await _stats_cache.get_or_compute("stats", _get_shared_statistics)
+    return ORJSONResponse(payload, headers={"Cache-Control": f"max-age={ttl}"})
 
-    avg_seconds = round(total_duration / total_completed_24h, 2) if total_completed_24h > 0 else None
 
-    performance = {
-        "completed_24h": total_completed_24h,
-        "avg_processing_time_seconds": avg_seconds
-    }
+# Shared (L2) cache for /stats in the Redis cache instance, so API replicas
+# reuse each other's aggregates. Entries stay fresh for STATS_SHARED_TTL
+# seconds and are kept for STATS_STALE_TTL so a stale copy can be served
+# while the database is unreachable.
+STATS_SHARED_KEY = "health:stats:v1"
+STATS_SHARED_TTL = 10
+STATS_STALE_TTL = 300
 
-    # Storage statistics
-    # Count unique images
-    stmt_images = select(func.count(func.distinct(ProcessingJob.image_id)))
-    total_images = (await session.execute(stmt_images)).scalar() or 0
 
-    stmt_jobs = select(func.count(ProcessingJob.job_id))
-    total_jobs = (await session.execute(stmt_jobs)).scalar() or 0
+async def _get_shared_statistics() -> dict:
+    """Get statistics via the Redis L2 cache, computing them on a miss.
 
-    storage = {
-        "total_images": total_images,
-        "total_jobs": total_jobs
-    }
+    Redis failures fall back to computing locally; database failures fall
+    back to the last (stale) shared copy when one exists.
+    """
+    redis_client = None
+    cached = None
+    try:
+        redis_client = await get_redis_pool()
+        raw = await redis_client.get(STATS_SHARED_KEY)
+        cached = orjson.loads(raw) if raw else None
+    except RedisError as e:
+        logger.warning("stats_shared_cache_unavailable", error=str(e))
+        redis_client = None
+
+    if cached and time.time() - cached["generated_at"] < STATS_SHARED_TTL:
+        return cached["payload"]
 
-    # Celery queue health
+    try:
+        payload = await _collect_statistics()
+    except SQLAlchemyError as e:
+        if not cached:
+            raise
+        logger.warning("stats_serving_stale", error=str(e), generated_at=cached["generated_at"])
+        return {**cached["payload"], "stale": True}
+
+    if redis_client is not None:
+        try:
+            await redis_client.set(
+                STATS_SHARED_KEY,
+                orjson.dumps({"generated_at": time.time(), "payload": payload}),
+                ex=STATS_STALE_TTL,
+            )
+        except RedisError as e:
+            logger.warning("stats_shared_cache_write_failed", error=str(e))
+
+    return payload
+
+
+def _fetch_celery_stats() -> dict:
+    """Inspect active Celery workers and tasks.
+
+    Blocking broker round-trip (up to the 2s inspect timeout); only called
+    through `refresh_celery_stats`, which runs it in a worker thread.
+    """
     try:
         # Use timeout to prevent blocking
         inspect = celery_app.control.inspect(timeout=2.0)
         active_tasks = inspect.active()
 
-        celery_stats = {
+        return {
             "active_workers": len(active_tasks) if active_tasks else 0,
             "active_tasks": sum(len(tasks) for tasks in active_tasks.values()) if active_tasks else 0
         }
@@ -126,25 +185,165 @@ async def get_statistics(session: AsyncSession = Depends(get_session)):
             error=str(e),
         )
 
-        celery_stats = {
+        return {
             "active_workers": 0,
             "active_tasks": 0,
             "error": f"Could not connect to Celery: {type(e).__name__}"
         }
 
+
+# Latest Celery inspection as (monotonic timestamp, stats), kept current by
+# celery_stats_refresher so /stats never waits on a broker round-trip.
+_celery_snapshot: Optional[Tuple[float, dict]] = None
+_celery_refresh: Optional[asyncio.Future] = None
+
+# Dedicated thread for inspections: serializes them and keeps a slow broker
+# round-trip from holding up the default executor on loop shutdown.
+_celery_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="celery-inspect")
+
+
+async def _do_refresh_celery_stats() -> dict:
+    global _celery_snapshot
+    loop = asyncio.get_running_loop()
+    celery_stats = await loop.run_in_executor(_celery_executor, _fetch_celery_stats)
+    _celery_snapshot = (time.monotonic(), celery_stats)
+    return celery_stats
+
+
+async def refresh_celery_stats() -> dict:
+    """Inspect Celery off the event loop and store the result.
+
+    Concurrent callers share a single in-flight inspection.
+    """
+    global _celery_refresh
+    if (
+        _celery_refresh is None
+        or _celery_refresh.done()
+        or _celery_refresh.get_loop() is not asyncio.get_running_loop()
+    ):
+        _celery_refresh = asyncio.ensure_future(_do_refresh_celery_stats())
+    return await asyncio.shield(_celery_refresh)
+
+
+async def celery_stats_refresher(interval: float) -> None:
+    """Background loop refreshing the Celery snapshot every `interval` seconds.
+
+    Started from the application lifespan and cancelled on shutdown.
+    """
+    while True:
+        try:
+            await refresh_celery_stats()
+        except Exception as e:
+            logger.warning("celery_stats_refresh_failed", error=str(e))
+        await asyncio.sleep(interval)
+
+
+async def get_celery_stats() -> dict:
+    """Return the latest Celery snapshot, inspecting inline only if none exists."""
+    if _celery_snapshot is None:
+        celery_stats = await refresh_celery_stats()
+        age = 0.0
+    else:
+        checked_at, celery_stats = _celery_snapshot
+        age = time.monotonic() - checked_at
+
+    return {**celery_stats, "age_seconds": round(age, 1)}
+
+
+async def _collect_statistics() -> dict:
+    """Collect detailed processing statistics.
+
+    Provides insights into:
+    - Job status breakdown
+    - 24-hour performance metrics
+    - Storage statistics
+    - Celery worker status
+
+    Returns:
+        dict: Comprehensive statistics
+    """
+    # The database snapshot and the Celery inspection are independent, so
+    # run them concurrently. Celery normally comes from the background
+    # refresher and returns immediately.
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    async with AsyncSessionLocal() as session:
+        counters, celery_stats = await asyncio.gather(
+            JobStatsRepository(session).get_stats_snapshot(completed_since=cutoff),
+            get_celery_stats(),
+        )
+    status_counts = counters["status"]
+
+    performance = {
+        "completed_24h": counters["completed"],
+        "avg_processing_time_seconds": counters["avg_processing_time_seconds"]
+    }
+
+    # Storage statistics
+    storage = {
+        "total_images": counters["distinct_images"],
+        "total_jobs": counters["total_jobs"]
+    }
+
     return {
         "status_breakdown": status_counts,
         "performance_24h": performance,
         "storage": storage,
         "celery": celery_stats,
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": datetime.now(timezone.utc)
+    }
+
+
+def _serialize_failed_job(row: tuple) -> dict:
+    """Serialize a failed job row from `JobRepository.iter_recent_failures`."""
+    job_id, image_id, error, attempts, created_at, failed_at = row
+    return {
+        "job_id": job_id,
+        "image_id": image_id,
+        "error": error,
+        "attempts": attempts,
+        "created_at": created_at,
+        "failed_at": failed_at
     }
 
 
+# Overlapping failed-job reads with the same parameters share one query.
+# The shared query outlives whichever request started it, so the loaders
+# open their own session instead of closing over a request's.
+_failed_reads = SingleFlight()
+
+
+async def _load_recent_failures(limit: int) -> list:
+    async with AsyncSessionLocal() as session:
+        repo = JobRepository(session)
+        return [_serialize_failed_job(job) async for job in repo.iter_recent_failures(limit=limit)]
+
+
+async def _load_failure_summary() -> dict:
+    async with AsyncSessionLocal() as session:
+        return await JobRepository(session).get_failure_summary()
+
+
+# Above this many rows /failed streams its JSON array instead of building it
+_FAILED_STREAM_THRESHOLD = 100
+
+
+async def _stream_failed_jobs(session: AsyncSession, limit: int) -> AsyncIterator[bytes]:
+    """Encode the /failed payload incrementally, one row at a time."""
+    yield b'{"failed_jobs":['
+    total = 0
+    async for job in JobRepository(session).iter_recent_failures(limit=limit):
+        yield (b"," if total else b"") + orjson.dumps(_serialize_failed_job(job))
+        total += 1
+    yield b'],"total":' + str(total).encode() + b"}"
+
+
 @router.get("/failed")
 async def get_failed_jobs(limit: int = 50, session: AsyncSession = Depends(get_session)):
     """Get recent failed jobs for debugging.
 
+    Large limits are streamed as the same JSON document so memory stays
+    bounded regardless of how many rows are requested.
+
     Args:
         limit: Maximum number of failed jobs to return (default: 50)
         session: Database session
@@ -152,29 +351,71 @@ async def get_failed_jobs(limit: int = 50, session: AsyncSession = Depends(get_s
     Returns:
         dict: List of failed jobs with error details
     """
-    stmt = select(ProcessingJob).where(
-        ProcessingJob.status == 'failed'
-    ).order_by(
-        ProcessingJob.completed_at.desc()
-    ).limit(limit)
+    if limit > _FAILED_STREAM_THRESHOLD:
+        return StreamingResponse(_stream_failed_jobs(session, limit), media_type="application/json")
 
-    result = await session.execute(stmt)
-    jobs = result.scalars().all()
+    jobs = await _failed_reads.do(("recent", limit), lambda: _load_recent_failures(limit))
 
-    return {
-        "failed_jobs": [
-            {
-                "job_id": job.job_id,
-                "image_id": job.image_id,
-                "error": job.last_error,
-                "attempts": job.attempt_count,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "failed_at": job.completed_at.isoformat() if job.completed_at else None
-            }
-            for job in jobs
-        ],
+    return ORJSONResponse({
+        "failed_jobs": jobs,
         "total": len(jobs)
-    }
+    })
+
+
+@router.get("/failed/summary")
+async def get_failed_summary():
+    """Get failed job counts without any row detail.
+
+    Returns:
+        dict: Failure counts for the last hour, last 24h and overall
+    """
+    summary = await _failed_reads.do("summary", _load_failure_summary)
+    return ORJSONResponse(summary)
+
+
+@router.get("/failed/recent")
+async def get_recent_failed_jobs(limit: int = Query(10, ge=1, le=100)):
+    """Get detail rows for the most recent failed jobs.
+
+    Args:
+        limit: Maximum number of failed jobs to return (default: 10)
+
+    Returns:
+        dict: List of failed jobs with error details
+    """
+    jobs = await _failed_reads.do(("recent", limit), lambda: _load_recent_failures(limit))
+
+    return ORJSONResponse({
+        "failed_jobs": jobs,
+        "count": len(jobs)
+    })
+
+
+# Shared keep-alive client for auth-api probes, so repeated health checks
+# reuse the pooled connection instead of a fresh TCP/TLS handshake each time.
+_health_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_health_http_client() -> httpx.AsyncClient:
+    global _health_http_client
+    if _health_http_client is None or _health_http_client.is_closed:
+        _health_http_client = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _health_http_client
+
+
+async def close_health_http_client() -> None:
+    """Close the shared health-check HTTP client (application shutdown)."""
+    global _health_http_client
+    if _health_http_client is not None:
+        await _health_http_client.aclose()
+        _health_http_client = None
+
+
+# Last auth-api probe as (monotonic timestamp, healthy, error)
+_last_auth_api_probe: Optional[Tuple[float, bool, Optional[str]]] = None
 
 
 @router.get("/auth")
@@ -182,12 +423,19 @@ async def authorization_health_check():
     """Distributed Authorization System health check.
 
     Checks JWT validation, auth-api connectivity, circuit breaker status,
-    and authorization cache health.
+    and authorization cache health. Expensive; do not use for liveness
+    probes (see `/healthz`). Results are cached in-process for 5-15
+    seconds so probes don't hammer auth-api.
 
     Returns:
-        dict: Authorization system status and configuration
+        ORJSONResponse: Authorization system status and configuration
     """
-    import httpx
+    payload, ttl = await _stats_cache.get_or_compute("auth", _check_authorization_health)
+    return ORJSONResponse(payload, headers={"Cache-Control": f"max-age={ttl}"})
+
+
+async def _check_authorization_health() -> dict:
+    """Check auth-api connectivity and circuit breaker state."""
     from app.core.authorization import get_authorization_service
 
     # Get authorization service instance
@@ -202,47 +450,42 @@ async def authorization_health_check():
     except Exception as e:
         logger.warning("circuit_breaker_health_check_failed", error=str(e))
 
-    # Check auth-api connectivity
-    auth_api_healthy = False
-    auth_api_error = None
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.AUTH_API_URL}/health")
+    # Check auth-api connectivity. While the breaker is open auth-api is
+    # known to be failing, so report the last probe result instead of
+    # waiting out another HTTP timeout on every health check.
+    global _last_auth_api_probe
+    if cb_state == "open" and _last_auth_api_probe is not None:
+        probed_at, auth_api_healthy, auth_api_error = _last_auth_api_probe
+        probe = {"skipped": True, "age_seconds": round(time.monotonic() - probed_at, 1)}
+    else:
+        auth_api_healthy = False
+        auth_api_error = None
+        try:
+            response = await _get_health_http_client().get(f"{settings.AUTH_API_URL}/health")
             auth_api_healthy = response.status_code == 200
-    except Exception as e:
-        auth_api_error = str(e)
-        logger.warning("auth_api_health_check_failed", error=auth_api_error)
+        except Exception as e:
+            auth_api_error = str(e)
+            logger.warning("auth_api_health_check_failed", error=auth_api_error)
+        _last_auth_api_probe = (time.monotonic(), auth_api_healthy, auth_api_error)
+        probe = {"skipped": False, "age_seconds": 0.0}
 
     # Overall health status
-    overall_healthy = auth_api_healthy and cb_state == "closed"
+    overall_healthy = auth_api_healthy and cb_state in ("closed", "disabled")
 
     # Build response
     return {
         "status": "healthy" if overall_healthy else "degraded",
-        "jwt_validation": {
-            "mode": "HS256 Shared Secret",
-            "issuer": settings.AUTH_API_ISSUER_URL,
-            "audience": settings.AUTH_API_AUDIENCE,
-            "algorithm": settings.JWT_ALGORITHM,
-        },
-        "authorization": {
-            "enabled": True,
-            "cache_enabled": settings.AUTH_CACHE_ENABLED,
-            "cache_ttl_allowed_seconds": settings.AUTH_CACHE_TTL_ALLOWED,
-            "cache_ttl_denied_seconds": settings.AUTH_CACHE_TTL_DENIED,
-            "fail_mode": "closed" if not settings.AUTH_FAIL_OPEN else "open",
-        },
+        **_STATIC_AUTH_HEALTH,
         "circuit_breaker": {
-            "enabled": settings.CIRCUIT_BREAKER_ENABLED,
+            **_STATIC_CIRCUIT_BREAKER,
             "state": cb_state,
             "failure_count": cb_failure_count,
-            "threshold": settings.CIRCUIT_BREAKER_THRESHOLD,
-            "timeout_seconds": settings.CIRCUIT_BREAKER_TIMEOUT,
         },
         "auth_api": {
             "url": settings.AUTH_API_URL,
             "status": "healthy" if auth_api_healthy else "down",
             "error": auth_api_error,
+            "probe": probe,
         },
-        "timestamp": datetime.now(timezone.utc).isoformat()
+        "timestamp": datetime.now(timezone.utc)
     }
@@ -1,6 +1,10 @@
 """Prometheus metrics endpoint and metric definitions."""
 
-from fastapi import APIRouter, Response
+import asyncio
+import gzip
+from typing import Any, Dict, Tuple
+
+from fastapi import APIRouter, Request, Response
 from prometheus_client import (
     Counter,
     Histogram,
@@ -11,6 +15,7 @@ from prometheus_client import (
     REGISTRY,
 )
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
@@ -31,6 +36,9 @@ service_info.info({
 })
 
 
+# Histogram buckets are kept to the few boundaries the alert rules in
+# observability/prometheus/alerts use: every bucket is a series per label set.
+
 # HTTP Request Metrics
 http_requests_total = Counter(
     'http_requests_total',
@@ -43,7 +51,7 @@ http_request_duration_seconds = Histogram(
     'http_request_duration_seconds',
     'HTTP request duration in seconds',
     ['service', 'method', 'endpoint'],
-    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0),
+    buckets=(0.025, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0),  # alerts at p95 > 2s and > 5s
     registry=REGISTRY
 )
 
@@ -74,7 +82,7 @@ image_processing_duration_seconds = Histogram(
     'image_processing_duration_seconds',
     'Image processing duration in seconds',
     ['service', 'size'],  # size: thumbnail, medium, large, original
-    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 15.0, 30.0),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0),  # alerts at p95 > 10s and > 30s
     registry=REGISTRY
 )
 
@@ -94,17 +102,19 @@ image_storage_bytes = Gauge(
 
 
 # Rate Limiting Metrics
+# No user_id label: every user would become its own time series. Per-user
+# detail belongs in the structured rate limit logs.
 rate_limit_rejections_total = Counter(
     'rate_limit_rejections_total',
     'Total requests rejected due to rate limiting',
-    ['service', 'user_id'],
+    ['service'],
     registry=REGISTRY
 )
 
 rate_limit_current_usage = Gauge(
     'rate_limit_current_usage',
-    'Current rate limit usage for users',
-    ['service', 'user_id'],
+    'Uploads counted in the window at the most recent rate limit check',
+    ['service'],
     registry=REGISTRY
 )
 
@@ -121,7 +131,7 @@ database_query_duration_seconds = Histogram(
     'database_query_duration_seconds',
     'Database query duration in seconds',
     ['service', 'operation', 'table'],
-    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    buckets=(0.005, 0.025, 0.1, 0.5, 1.0),  # alert at p95 > 0.5s
     registry=REGISTRY
 )
 
@@ -138,7 +148,7 @@ storage_operation_duration_seconds = Histogram(
     'storage_operation_duration_seconds',
     'Storage operation duration in seconds',
     ['service', 'backend', 'operation'],
-    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    buckets=(0.05, 0.25, 1.0, 2.5, 5.0, 10.0),  # alert at p95 > 5s
     registry=REGISTRY
 )
 
@@ -155,7 +165,7 @@ celery_task_duration_seconds = Histogram(
     'celery_task_duration_seconds',
     'Celery task duration in seconds',
     ['service', 'task_name'],
-    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+    buckets=(0.5, 2.5, 10.0, 30.0, 60.0, 120.0),
     registry=REGISTRY
 )
 
@@ -176,19 +186,87 @@ errors_total = Counter(
 )
 
 
+
+# Labelled children cached per label tuple. `.labels()` validates and joins its
+# arguments on every call; the child for a given tuple never changes and the
+# service label is constant per process, so hot paths reuse the child instead.
+_children: Dict[Tuple[int, Tuple], Any] = {}
+
+
+def _child(metric, *labels):
+    """Return metric's child for (SERVICE_NAME, *labels), creating it once."""
+    key = (id(metric), labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(settings.SERVICE_NAME, *labels)
+    return child
+
+
+def http_requests_in_progress_for(method: str):
+    """In-progress gauge child for an HTTP method."""
+    return _child(http_requests_in_progress, method)
+
+
+def http_requests_total_for(method: str, endpoint: str, status: int):
+    """Request counter child for a method/endpoint/status combination."""
+    return _child(http_requests_total, method, endpoint, status)
+
+
+def http_request_duration_for(method: str, endpoint: str):
+    """Request duration histogram child for a method/endpoint combination."""
+    return _child(http_request_duration_seconds, method, endpoint)
+
+
+def errors_total_for(error_type: str, endpoint: str):
+    """Error counter child for an error type/endpoint combination."""
+    return _child(errors_total, error_type, endpoint)
+
+# Encoded exposition kept for one second: concurrent or back-to-back scrapes
+# share one generate_latest() run, and its gzip encoding is done once too.
+_exposition_cache = TTLCache(min_ttl=1.0, max_ttl=1.0)
+
+
+def _encode_exposition_sync() -> Tuple[bytes, bytes]:
+    """Generate the exposition text and its gzip encoding."""
+    payload = generate_latest(REGISTRY)
+    return payload, gzip.compress(payload, compresslevel=5)
+
+
+async def _encode_exposition() -> Tuple[bytes, bytes]:
+    """Encode off the event loop; collection and gzip are CPU-bound."""
+    return await asyncio.to_thread(_encode_exposition_sync)
+
+
 @router.get("/metrics")
-async def metrics():
+async def metrics(request: Request):
     """Prometheus metrics endpoint.
 
     Returns metrics in Prometheus exposition format for scraping.
     This endpoint should be called by Prometheus at regular intervals.
+    The encoded output is reused for up to one second and served gzipped
+    to clients that accept it.
+
+    Args:
+        request: HTTP request (checked for Accept-Encoding)
 
     Returns:
         Response: Prometheus metrics in text format
     """
+    (payload, compressed), _ = await _exposition_cache.get_or_compute(
+        "metrics", _encode_exposition
+    )
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=compressed,
+            media_type=CONTENT_TYPE_LATEST,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+
     return Response(
-        content=generate_latest(REGISTRY),
-        media_type=CONTENT_TYPE_LATEST
+        content=payload,
+        media_type=CONTENT_TYPE_LATEST,
+        headers={"Vary": "Accept-Encoding"}
     )
 
 # Updated: 2025-11-18 22:01 UTC - Production-ready code
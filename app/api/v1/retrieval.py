@@ -1,35 +1,311 @@
 """Retrieval API endpoints for accessing processed images."""
 
+import asyncio
+import hashlib
+import os
+import re
+from dataclasses import dataclass
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import FileResponse, RedirectResponse
-from typing import Literal, Optional
-from enum import Enum
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse, Response
+from typing import Dict, Iterable, Literal, Optional
 
 from app.services.processor_service import ProcessorService
-from app.api.dependencies import get_processor_service
+from app.api.dependencies import get_processor_service, get_read_processor_service
+from app.api.v1.upload import invalidate_job_summary
 from app.storage import get_storage
 from app.core.logging_config import get_logger
-from app.api.dependencies import require_permission, require_bucket_read_access, AuthContext
+from app.core.cache import ExpiringLRU
+from app.api.dependencies import (
+    require_permission,
+    require_bucket_read_access,
+    prefetch_bucket_read_access,
+    AuthContext,
+)
 
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/api/v1/images", tags=["retrieval"])
+router = APIRouter(prefix="/api/v1/images", tags=["retrieval"], default_response_class=ORJSONResponse)
 
+_MISSING = object()
 
-class ImageSize(str, Enum):
-    """Available image size variants."""
-    thumbnail = "thumbnail"
-    medium = "medium"
-    large = "large"
-    original = "original"
+# Image IDs are UUID4 strings (see ImageService)
+_IMAGE_ID_RE = re.compile(r"[0-9a-fA-F-]{36}")
+
+# Presigned S3 URLs live for an hour; keep client copies well inside that
+_IMAGE_INFO_MAX_AGE = 300
+
+
+def _image_etag(job: "_ImageRecord", variant: str, urls: Iterable[str]) -> str:
+    """Weak ETag for a retrieval payload.
+
+    Completed jobs are not modified after completion, so the job id and
+    completion time identify the metadata without serializing it. The
+    returned URLs are hashed in as well: presigned S3 URLs are re-signed
+    when `_url_cache` drops them, and a client must not keep revalidating
+    a copy whose URL has expired.
+    """
+    url_hash = hashlib.blake2b("\n".join(urls).encode(), digest_size=8).hexdigest()
+    return f'W/"{job.job_id}-{job.completed_at}-{variant}-{url_hash}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header covers etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
+
+
+def _conditional_headers(etag: str, auth: Optional[AuthContext]) -> dict:
+    """Caching headers for retrieval payloads (private once auth was needed)."""
+    scope = "public" if auth is None else "private"
+    return {
+        "ETag": etag,
+        "Cache-Control": f"{scope}, max-age={_IMAGE_INFO_MAX_AGE}",
+    }
+
+
+# Available image size variants. A Literal rather than an Enum: FastAPI
+# validates it the same way, and handlers get the plain string.
+ImageSize = Literal["thumbnail", "medium", "large", "original"]
+
+
+@dataclass(frozen=True, slots=True)
+class _ImageRecord:
+    """Read-only retrieval view of a completed job.
+
+    Built once when a job enters the cache, so handlers use attribute access
+    instead of repeating the nested metadata lookups on every request.
+    """
+    job_id: str
+    completed_at: Optional[str]
+    storage_bucket: str
+    processed_paths: Dict[str, str]
+    processing_metadata: Optional[dict]
+    dominant_color: Optional[str]
+    variants: dict
+
+    @classmethod
+    def from_job(cls, job: dict) -> "_ImageRecord":
+        """Build the record from a ProcessorService job dict."""
+        metadata = job["processing_metadata"]
+        return cls(
+            job_id=job["job_id"],
+            completed_at=job["completed_at"],
+            storage_bucket=job["storage_bucket"],
+            processed_paths=job["processed_paths"] or {},
+            processing_metadata=metadata,
+            dominant_color=metadata.get("dominant_color") if metadata else None,
+            variants=metadata.get("variants", {}) if metadata else {},
+        )
+
+
+# Completed job rows and presigned URLs are read far more often than they
+# change; cache both per process. URLs are dropped at half their 1h lifetime
+# so a cached URL always has at least 30 minutes left.
+_job_cache = ExpiringLRU(maxsize=10_000, ttl=60)
+_url_cache = ExpiringLRU(maxsize=10_000, ttl=1800)
+
+
+async def _get_image_record(service: ProcessorService, image_id: str) -> Optional[_ImageRecord]:
+    """Most recent completed job for image_id, served from cache when fresh.
+
+    Misses are not cached: an image still being processed should become
+    visible as soon as its job completes.
+    """
+    record = _job_cache.get(image_id)
+    if record is None:
+        job = await service.get_job_by_image_id(image_id)
+        if job is not None:
+            record = _ImageRecord.from_job(job)
+            _job_cache.set(image_id, record)
+    return record
+
+
+async def _get_url(storage, bucket: str, path: str) -> str:
+    """Access URL for a stored file, served from cache when fresh."""
+    key = (bucket, path)
+    url = _url_cache.get(key)
+    if url is None:
+        url = await storage.get_url(bucket, path)
+        _url_cache.set(key, url)
+    return url
+
+
+def _invalidate_image(image_id: str, job: dict) -> None:
+    """Drop cached job, job status and URL entries for a deleted image."""
+    _job_cache.pop(image_id)
+    invalidate_job_summary(job["job_id"])
+    for path in (job["processed_paths"] or {}).values():
+        _url_cache.pop((job["storage_bucket"], path))
+
+
+# Registered before /{image_id} so "batch" is not captured as an image_id
+@router.get("/batch")
+async def get_images_batch(
+    request: Request,
+    image_ids: str = Query(..., description="Comma-separated image UUIDs"),
+    size: ImageSize = Query("medium"),
+    service: ProcessorService = Depends(get_read_processor_service),
+    storage=Depends(get_storage)
+):
+    """Batch retrieval for multiple images.
+
+    Maximum 50 images per request for performance.
+
+    **Authorization**: Each image checked individually based on bucket access.
+    - System buckets: Public access
+    - User buckets: Owner only
+    - Group buckets: Group members only
+
+    Args:
+        request: HTTP request for auth context
+        image_ids: Comma-separated list of image IDs
+        size: Desired size variant for all images
+        service: ProcessorService instance
+        storage: Storage backend
+
+    Returns:
+        dict: List of image results with requested/found counts
+        Note: Images with denied access are silently omitted from results
+
+    Raises:
+        HTTPException: 400 if more than 50 images requested
+    """
+    # Count before splitting so oversized requests are rejected without
+    # building the ID list
+    id_count = image_ids.count(',') + 1
+
+    logger.info(
+        "batch_retrieval_request",
+        image_count=id_count,
+        size=size,
+    )
+
+    if id_count > 50:
+        logger.warning(
+            "batch_retrieval_limit_exceeded",
+            requested_count=id_count,
+            max_allowed=50,
+        )
+        raise HTTPException(
+            status_code=400,
+            detail="Maximum 50 images per request. Please split into multiple requests."
+        )
+
+    ids = [image_id.strip() for image_id in image_ids.split(',')]
+
+    results = []
+    failed_ids = []
+    authorized = []
+
+    # Cached jobs first, then one IN (...) query for the rest instead of a
+    # lookup per image. Malformed IDs can never match and are not looked up.
+    jobs = {}
+    lookup_ids = [image_id for image_id in ids if _IMAGE_ID_RE.fullmatch(image_id)]
+    for image_id in lookup_ids:
+        cached = _job_cache.get(image_id)
+        if cached is not None:
+            jobs[image_id] = cached
+    misses = [image_id for image_id in lookup_ids if image_id not in jobs]
+    if misses:
+        fetched = await service.get_jobs_by_image_ids(misses)
+        for image_id, job in fetched.items():
+            jobs[image_id] = record = _ImageRecord.from_job(job)
+            _job_cache.set(image_id, record)
+    bucket_access: dict = {}
+
+    # One MGET for the cached decisions of every bucket in the batch
+    await prefetch_bucket_read_access(
+        request, {job.storage_bucket for job in jobs.values() if job.processed_paths.get(size)}
+    )
+
+    for image_id in ids:
+        try:
+            job = jobs.get(image_id)
+            path = job.processed_paths.get(size) if job else None
+            if path:
+                bucket = job.storage_bucket
+
+                # Check bucket access once per bucket; the decision (grant or
+                # HTTPException) is reused for every image in the same bucket
+                auth = bucket_access.get(bucket, _MISSING)
+                if auth is _MISSING:
+                    try:
+                        auth = await require_bucket_read_access(request, bucket)
+                    except HTTPException as auth_exc:
+                        auth = auth_exc
+                    bucket_access[bucket] = auth
+
+                if isinstance(auth, HTTPException):
+                    # Access denied - silently skip this image
+                    logger.debug(
+                        "batch_item_access_denied",
+                        image_id=image_id,
+                        bucket=bucket,
+                        error=auth.detail
+                    )
+                    failed_ids.append(image_id)
+                    continue
+
+                authorized.append((image_id, bucket, path, job))
+            else:
+                failed_ids.append(image_id)
+        except Exception as exc:
+            logger.debug(
+                "batch_retrieval_item_failed",
+                image_id=image_id,
+                error=str(exc),
+            )
+            failed_ids.append(image_id)
+
+    # Generate URLs concurrently; S3 presigning can involve I/O per call
+    urls = await asyncio.gather(
+        *(_get_url(storage, bucket, path) for _, bucket, path, _ in authorized),
+        return_exceptions=True,
+    )
+
+    for (image_id, _, _, job), url in zip(authorized, urls):
+        if isinstance(url, Exception):
+            logger.debug(
+                "batch_retrieval_item_failed",
+                image_id=image_id,
+                error=str(url),
+            )
+            failed_ids.append(image_id)
+            continue
+
+        results.append({
+            "image_id": image_id,
+            "url": url,
+            "size": size,
+            "dominant_color": job.dominant_color
+        })
+
+    logger.info(
+        "batch_retrieval_completed",
+        requested_count=len(ids),
+        found_count=len(results),
+        failed_count=len(failed_ids),
+        success_rate=round(len(results) / len(ids) * 100, 2) if ids else 0,
+    )
+
+    return {
+        "images": results,
+        "requested": len(ids),
+        "found": len(results)
+    }
 
 
 @router.get("/{image_id}")
 async def get_image_info(
     request: Request,
+    response: Response,
     image_id: str,
-    size: ImageSize = Query(ImageSize.medium),
-    service: ProcessorService = Depends(get_processor_service),
+    size: ImageSize = Query("medium"),
+    service: ProcessorService = Depends(get_read_processor_service),
     storage=Depends(get_storage)
 ):
     """Get image URL and metadata by image_id.
@@ -41,13 +317,14 @@ async def get_image_info(
 
     Args:
         request: HTTP request for auth context
+        response: Response used to attach ETag/Cache-Control headers
         image_id: Image identifier
         size: Desired size variant
         service: ProcessorService instance
         storage: Storage backend
 
     Returns:
-        dict: Image URL and metadata
+        dict: Image URL and metadata, or 304 if the client copy is current
 
     Raises:
         HTTPException: 404 if image not found or size not available
@@ -57,17 +334,17 @@ async def get_image_info(
     logger.debug(
         "image_info_request",
         image_id=image_id,
-        size=size.value,
+        size=size,
     )
 
-    job = await service.get_job_by_image_id(image_id)
+    job = await _get_image_record(service, image_id)
 
     if not job:
         logger.warning("image_not_found", image_id=image_id)
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Check bucket access authorization
-    bucket = job["storage_bucket"]
+    bucket = job.storage_bucket
     auth = await require_bucket_read_access(request, bucket)
 
     logger.debug(
@@ -77,35 +354,39 @@ async def get_image_info(
         authenticated=auth is not None,
     )
 
-    paths = job["processed_paths"]
-    if not paths or size.value not in paths:
+    paths = job.processed_paths
+    path = paths.get(size)
+    if path is None:
         logger.warning(
             "image_size_not_available",
             image_id=image_id,
-            requested_size=size.value,
-            available_sizes=list(paths.keys()) if paths else [],
+            requested_size=size,
+            available_sizes=list(paths),
         )
-        raise HTTPException(status_code=404, detail=f"Size '{size.value}' not available")
+        raise HTTPException(status_code=404, detail=f"Size '{size}' not available")
 
-    path = paths[size.value]
-    url = await storage.get_url(bucket, path)
+    url = await _get_url(storage, bucket, path)
 
-    metadata = job["processing_metadata"]
+    etag = _image_etag(job, size, [url])
+    headers = _conditional_headers(etag, auth)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
 
     logger.info(
         "image_info_returned",
         image_id=image_id,
-        size=size.value,
+        size=size,
         bucket=bucket,
     )
 
     return {
         "image_id": image_id,
         "url": url,
-        "size": size.value,
+        "size": size,
         "metadata": {
-            "dominant_color": metadata.get("dominant_color") if metadata else None,
-            "dimensions": metadata.get("variants", {}).get(size.value, {}) if metadata else {}
+            "dominant_color": job.dominant_color,
+            "dimensions": job.variants.get(size, {})
         }
     }
 
@@ -113,8 +394,9 @@ async def get_image_info(
 @router.get("/{image_id}/all")
 async def get_all_image_sizes(
     request: Request,
+    response: Response,
     image_id: str,
-    service: ProcessorService = Depends(get_processor_service),
+    service: ProcessorService = Depends(get_read_processor_service),
     storage=Depends(get_storage)
 ):
     """Get all size variants for an image.
@@ -126,12 +408,14 @@ async def get_all_image_sizes(
 
     Args:
         request: HTTP request for auth context
+        response: Response used to attach ETag/Cache-Control headers
         image_id: Image identifier
         service: ProcessorService instance
         storage: Storage backend
 
     Returns:
-        dict: All variant URLs and complete metadata
+        dict: All variant URLs and complete metadata, or 304 if the client
+        copy is current
 
     Raises:
         HTTPException: 404 if image not found
@@ -140,14 +424,14 @@ async def get_all_image_sizes(
     """
     logger.debug("all_sizes_request", image_id=image_id)
 
-    job = await service.get_job_by_image_id(image_id)
+    job = await _get_image_record(service, image_id)
 
     if not job:
         logger.warning("all_sizes_not_found", image_id=image_id)
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Check bucket access authorization
-    bucket = job["storage_bucket"]
+    bucket = job.storage_bucket
     auth = await require_bucket_read_access(request, bucket)
 
     logger.debug(
@@ -157,12 +441,17 @@ async def get_all_image_sizes(
         authenticated=auth is not None,
     )
 
-    paths = job["processed_paths"] or {}
+    paths = job.processed_paths
 
-    # Generate URLs for all variants asynchronously
-    urls = {}
-    for variant, path in paths.items():
-        urls[variant] = await storage.get_url(bucket, path)
+    # Generate URLs for all variants concurrently
+    variant_urls = await asyncio.gather(*(_get_url(storage, bucket, path) for path in paths.values()))
+    urls = dict(zip(paths.keys(), variant_urls))
+
+    etag = _image_etag(job, "all", variant_urls)
+    headers = _conditional_headers(etag, auth)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
 
     logger.info(
         "all_sizes_returned",
@@ -174,7 +463,7 @@ async def get_all_image_sizes(
     return {
         "image_id": image_id,
         "urls": urls,
-        "metadata": job["processing_metadata"]
+        "metadata": job.processing_metadata
     }
 
 
@@ -182,8 +471,8 @@ async def get_all_image_sizes(
 async def serve_image_direct(
     request: Request,
     image_id: str,
-    size: ImageSize = Query(ImageSize.medium),
-    service: ProcessorService = Depends(get_processor_service),
+    size: ImageSize = Query("medium"),
+    service: ProcessorService = Depends(get_read_processor_service),
     storage=Depends(get_storage)
 ):
     """Direct image file serving or redirect to presigned URL.
@@ -214,21 +503,21 @@ async def serve_image_direct(
     logger.debug(
         "direct_image_request",
         image_id=image_id,
-        size=size.value,
+        size=size,
     )
 
-    job = await service.get_job_by_image_id(image_id)
+    job = await _get_image_record(service, image_id)
 
     if not job:
         logger.warning(
             "direct_image_not_found",
             image_id=image_id,
-            size=size.value,
+            size=size,
         )
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Check bucket access authorization
-    bucket = job["storage_bucket"]
+    bucket = job.storage_bucket
     auth = await require_bucket_read_access(request, bucket)
 
     logger.debug(
@@ -238,42 +527,56 @@ async def serve_image_direct(
         authenticated=auth is not None,
     )
 
-    paths = job["processed_paths"]
-    if not paths or size.value not in paths:
+    paths = job.processed_paths
+    path = paths.get(size)
+    if path is None:
         logger.warning(
             "direct_image_size_not_available",
             image_id=image_id,
-            size=size.value,
-            available_sizes=list(paths.keys()) if paths else [],
+            size=size,
+            available_sizes=list(paths),
         )
-        raise HTTPException(status_code=404, detail=f"Size '{size.value}' not available")
-
-    path = paths[size.value]
+        raise HTTPException(status_code=404, detail=f"Size '{size}' not available")
 
     # Local storage: serve file directly
     if hasattr(storage, 'get_local_path'):
         local_path = storage.get_local_path(bucket, path)
+        # Stat here (a local metadata read) so FileResponse gets its size and
+        # validators up front instead of stat-ing again on a worker thread,
+        # and a missing file is a 404 rather than a 500 mid-response
+        try:
+            stat_result = os.stat(local_path)
+        except FileNotFoundError:
+            logger.warning(
+                "direct_image_file_missing",
+                image_id=image_id,
+                size=size,
+                local_path=str(local_path),
+            )
+            raise HTTPException(status_code=404, detail="Image file not found")
+
         logger.info(
             "direct_image_served_local",
             image_id=image_id,
-            size=size.value,
+            size=size,
             local_path=str(local_path),
             cache_control="public, max-age=31536000, immutable",
         )
         return FileResponse(
             local_path,
             media_type="image/webp",
+            stat_result=stat_result,
             headers={
                 "Cache-Control": "public, max-age=31536000, immutable"
             }
         )
     # S3 storage: redirect to presigned URL
     else:
-        url = await storage.get_url(bucket, path, expires_in=3600)
+        url = await _get_url(storage, bucket, path)
         logger.info(
             "direct_image_redirected_s3",
             image_id=image_id,
-            size=size.value,
+            size=size,
             expires_in=3600,
         )
         return RedirectResponse(url=url, status_code=307)
@@ -358,54 +661,49 @@ async def delete_image(
         role="admin" if is_admin else "owner"
     )
 
+    # Delete all processed variants and the staging file in one bulk call
+    targets = [(variant, path) for variant, path in (job["processed_paths"] or {}).items()]
+    if job["staging_path"]:
+        targets.append(("staging", job["staging_path"]))
+
+    try:
+        failed_paths = set(await storage.delete_many(bucket, [path for _, path in targets]))
+    except Exception as exc:
+        logger.warning(
+            "image_files_deletion_failed",
+            image_id=image_id,
+            bucket=bucket,
+            error=str(exc),
+        )
+        failed_paths = {path for _, path in targets}
+
     deleted_count = 0
     failed_deletions = []
 
-    # Delete all processed variants
-    if job["processed_paths"]:
-        for variant, path in job["processed_paths"].items():
-            try:
-                await storage.delete(bucket, path)
-                deleted_count += 1
-                logger.debug(
-                    "variant_deleted",
-                    image_id=image_id,
-                    variant=variant,
-                    path=path,
-                )
-            except Exception as exc:
-                logger.warning(
-                    "variant_deletion_failed",
-                    image_id=image_id,
-                    variant=variant,
-                    path=path,
-                    error=str(exc),
-                )
-                failed_deletions.append(f"{variant}:{path}")
-
-    # Delete staging file if exists
-    if job["staging_path"]:
-        try:
-            await storage.delete(bucket, job["staging_path"])
-            deleted_count += 1
-            logger.debug(
-                "staging_file_deleted",
+    for variant, path in targets:
+        if path in failed_paths:
+            logger.warning(
+                "variant_deletion_failed" if variant != "staging" else "staging_deletion_failed",
                 image_id=image_id,
-                staging_path=job["staging_path"],
+                variant=variant,
+                path=path,
             )
-        except Exception as exc:
-            logger.warning(
-                "staging_deletion_failed",
+            failed_deletions.append(f"{variant}:{path}")
+        else:
+            deleted_count += 1
+            logger.debug(
+                "variant_deleted" if variant != "staging" else "staging_file_deleted",
                 image_id=image_id,
-                staging_path=job["staging_path"],
-                error=str(exc),
+                variant=variant,
+                path=path,
             )
-            failed_deletions.append(f"staging:{job['staging_path']}")
 
     # Note: Database records kept for audit trail
     # In production, consider adding 'deleted' flag instead
     
     # Update: For strict ownership/deletion, we remove the record
+    _invalidate_image(image_id, job)
+
     try:
         await service.delete_job(job["job_id"])
         logger.info("job_record_deleted", job_id=job["job_id"])
@@ -429,111 +727,4 @@ async def delete_image(
         "files_removed": deleted_count
     }
 
-
-@router.get("/batch")
-async def get_images_batch(
-    request: Request,
-    image_ids: str = Query(..., description="Comma-separated image UUIDs"),
-    size: ImageSize = Query(ImageSize.medium),
-    service: ProcessorService = Depends(get_processor_service),
-    storage=Depends(get_storage)
-):
-    """Batch retrieval for multiple images.
-
-    Maximum 50 images per request for performance.
-
-    **Authorization**: Each image checked individually based on bucket access.
-    - System buckets: Public access
-    - User buckets: Owner only
-    - Group buckets: Group members only
-
-    Args:
-        request: HTTP request for auth context
-        image_ids: Comma-separated list of image IDs
-        size: Desired size variant for all images
-        service: ProcessorService instance
-        storage: Storage backend
-
-    Returns:
-        dict: List of image results with requested/found counts
-        Note: Images with denied access are silently omitted from results
-
-    Raises:
-        HTTPException: 400 if more than 50 images requested
-    """
-    ids = [id.strip() for id in image_ids.split(',')]
-
-    logger.info(
-        "batch_retrieval_request",
-        image_count=len(ids),
-        size=size.value,
-    )
-
-    if len(ids) > 50:
-        logger.warning(
-            "batch_retrieval_limit_exceeded",
-            requested_count=len(ids),
-            max_allowed=50,
-        )
-        raise HTTPException(
-            status_code=400,
-            detail="Maximum 50 images per request. Please split into multiple requests."
-        )
-
-    results = []
-    failed_ids = []
-
-    for image_id in ids:
-        try:
-            job = await service.get_job_by_image_id(image_id)
-            if job and job["processed_paths"] and job["processed_paths"].get(size.value):
-                bucket = job["storage_bucket"]
-
-                # Check bucket access for this image
-                try:
-                    auth = await require_bucket_read_access(request, bucket)
-                except HTTPException as auth_exc:
-                    # Access denied - silently skip this image
-                    logger.debug(
-                        "batch_item_access_denied",
-                        image_id=image_id,
-                        bucket=bucket,
-                        error=auth_exc.detail
-                    )
-                    failed_ids.append(image_id)
-                    continue
-
-                path = job["processed_paths"][size.value]
-                url = await storage.get_url(bucket, path)
-
-                results.append({
-                    "image_id": image_id,
-                    "url": url,
-                    "size": size.value,
-                    "dominant_color": job["processing_metadata"].get("dominant_color") if job["processing_metadata"] else None
-                })
-            else:
-                failed_ids.append(image_id)
-        except Exception as exc:
-            logger.debug(
-                "batch_retrieval_item_failed",
-                image_id=image_id,
-                error=str(exc),
-            )
-            failed_ids.append(image_id)
-
-    logger.info(
-        "batch_retrieval_completed",
-        requested_count=len(ids),
-        found_count=len(results),
-        failed_count=len(failed_ids),
-        success_rate=round(len(results) / len(ids) * 100, 2) if ids else 0,
-    )
-
-    return {
-        "images": results,
-        "requested": len(ids),
-        "found": len(results)
-    }
-
 # Updated: 2025-11-18 22:01 UTC - Production-ready code
@@ -7,37 +7,37 @@ Clean Architecture Pattern:
 - Dependencies inject required services and validate auth/rate limits
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, Depends, status, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Form, Depends, status, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from app.api.dependencies import (
     verify_content_length,
     validate_image_file,
-    require_bucket_access,
-    check_rate_limit,
+    upload_preflight,
+    UploadPreflight,
     get_image_service,
-    get_processor_service,
-    AuthContext
 )
 from app.services.image_service import ImageService
-from app.services.processor_service import ProcessorService
+from app.services.processor_service import JobSummary, ProcessorService
+from app.core.cache import ExpiringLRU, SingleFlight
 from app.core.config import settings
 from app.core.logging_config import get_logger
+from app.db.session import ReadSessionLocal
 
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/api/v1/images", tags=["upload"])
+router = APIRouter(prefix="/api/v1/images", tags=["upload"], default_response_class=ORJSONResponse)
 
 
 @router.post("/upload", status_code=202)
 async def upload_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     bucket: str = Form(...),
     metadata: Optional[str] = Form("{}"),
     content_length: int = Depends(verify_content_length),
-    auth: AuthContext = Depends(require_bucket_access("image:upload")),
-    rate_limit: dict = Depends(check_rate_limit),
+    preflight: UploadPreflight = Depends(upload_preflight),
     service: ImageService = Depends(get_image_service)
 ):
     """Upload image for asynchronous processing.
@@ -53,17 +53,22 @@ async def upload_image(
     - User buckets (org-{org_id}/users/{user_id}/): Owner only
     - System buckets (org-{org_id}/system/): All authenticated users
 
+    The job row is created before responding; the staging write and task
+    enqueue run as a background task after the 202 is sent. A failure there
+    marks the job failed, which clients see on the status URL.
+
     Args:
+        background_tasks: Runs the staging write after the response
         file: Image file upload (JPEG, PNG, WebP)
         bucket: Target storage bucket (must match format: org-{org_id}/groups/{group_id}/)
         metadata: Optional JSON metadata (pass-through)
         content_length: Pre-validated content length (via dependency)
-        auth: Authenticated user context with bucket access (via dependency)
-        rate_limit: Rate limit check result (via dependency)
+        preflight: Bucket access and rate limit results, checked
+            concurrently (via dependency)
         service: Image processing service (via dependency injection)
 
     Returns:
-        JSONResponse: 202 Accepted with job_id, image_id, status_url
+        ORJSONResponse: 202 Accepted with job_id, image_id, status_url
 
     Raises:
         HTTPException: 400 if invalid bucket format
@@ -74,6 +79,8 @@ async def upload_image(
         HTTPException: 503 if authorization service unavailable
         ServiceError: On business logic failures (converted to HTTP errors)
     """
+    auth, rate_limit = preflight.auth, preflight.rate_limit
+
     logger.info(
         "upload_request_received",
         filename=file.filename,
@@ -102,7 +109,8 @@ async def upload_image(
         auth_org_id=auth.org_id,
         metadata_json=metadata,
         content_length=content_length,
-        detected_mime=detected_mime
+        detected_mime=detected_mime,
+        background_tasks=background_tasks
     )
 
     # 3. Construct HTTP Response
@@ -116,7 +124,7 @@ async def upload_image(
         rate_limit_remaining=rate_limit["remaining"],
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
         content={
             "job_id": result["job_id"],
@@ -132,25 +140,62 @@ async def upload_image(
     )
 
 
+# Clients poll the job endpoints about once a second while processing runs.
+# Concurrent polls for one job share a single query, and the result is
+# reused briefly; completed jobs no longer change and are kept longer.
+_job_lookups = SingleFlight()
+_recent_summaries = ExpiringLRU(maxsize=10_000, ttl=0.5)
+_completed_summaries = ExpiringLRU(maxsize=10_000, ttl=60)
+
+
+async def _load_job_summary(job_id: str) -> Optional[JobSummary]:
+    """Run the shared summary query on its own read-only session.
+
+    The query outlives whichever poll started it, so it must not borrow
+    that request's session.
+    """
+    async with ReadSessionLocal() as session:
+        return await ProcessorService(session).get_job_summary(job_id)
+
+
+async def _get_job_summary(job_id: str) -> Optional[JobSummary]:
+    """Polling summary for job_id, served from cache when fresh.
+
+    Misses are not cached, so a job becomes visible as soon as it exists.
+    """
+    job = _completed_summaries.get(job_id) or _recent_summaries.get(job_id)
+    if job is None:
+        job = await _job_lookups.do(job_id, lambda: _load_job_summary(job_id))
+        if job is not None:
+            cache = _completed_summaries if job.status == "completed" else _recent_summaries
+            cache.set(job_id, job)
+    return job
+
+
+def invalidate_job_summary(job_id: str) -> None:
+    """Drop cached polling summaries for a deleted job."""
+    _completed_summaries.pop(job_id)
+    _recent_summaries.pop(job_id)
+
+
 @router.get("/jobs/{job_id}")
-async def get_job_status(job_id: str, service: ProcessorService = Depends(get_processor_service)):
+async def get_job_status(job_id: str):
     """Get processing job status.
 
     Poll this endpoint to check if processing is complete.
 
     Args:
         job_id: Job identifier from upload response
-        service: ProcessorService instance
 
     Returns:
-        dict: Job status with job_id, image_id, status, timestamps
+        ORJSONResponse: Job status with job_id, image_id, status, timestamps
 
     Raises:
         HTTPException: 404 if job not found
     """
     logger.debug("job_status_query", job_id=job_id)
 
-    job = await service.get_job(job_id)
+    job = await _get_job_summary(job_id)
 
     if not job:
         logger.warning("job_status_not_found", job_id=job_id)
@@ -159,23 +204,23 @@ async def get_job_status(job_id: str, service: ProcessorService = Depends(get_pr
     logger.info(
         "job_status_returned",
         job_id=job_id,
-        image_id=job["image_id"],
-        status=job["status"],
+        image_id=job.image_id,
+        status=job.status,
     )
 
-    return {
-        "job_id": job["job_id"],
-        "image_id": job["image_id"],
-        "status": job["status"],
-        "created_at": job["created_at"],
-        "completed_at": job.get("completed_at"),
-        "error": job.get("last_error"),
-        "attempts": job["attempt_count"]
-    }
+    return ORJSONResponse({
+        "job_id": job.job_id,
+        "image_id": job.image_id,
+        "status": job.status,
+        "created_at": job.created_at,
+        "completed_at": job.completed_at,
+        "error": job.last_error,
+        "attempts": job.attempt_count
+    })
 
 
 @router.get("/jobs/{job_id}/result")
-async def get_job_result(job_id: str, service: ProcessorService = Depends(get_processor_service)):
+async def get_job_result(job_id: str):
     """Get processed image results.
 
     Only returns successfully if job status is 'completed'.
@@ -183,10 +228,9 @@ async def get_job_result(job_id: str, service: ProcessorService = Depends(get_pr
 
     Args:
         job_id: Job identifier
-        service: ProcessorService instance
 
     Returns:
-        dict: Complete result with URLs, metadata, dominant color
+        ORJSONResponse: Complete result with URLs, metadata, dominant color
 
     Raises:
         HTTPException: 404 if job not found
@@ -194,38 +238,38 @@ async def get_job_result(job_id: str, service: ProcessorService = Depends(get_pr
     """
     logger.debug("job_result_query", job_id=job_id)
 
-    job = await service.get_job(job_id)
+    job = await _get_job_summary(job_id)
 
     if not job:
         logger.warning("job_result_not_found", job_id=job_id)
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job["status"] != "completed":
+    if job.status != "completed":
         logger.warning(
             "job_result_not_ready",
             job_id=job_id,
-            current_status=job["status"],
+            current_status=job.status,
         )
         raise HTTPException(
             status_code=409,
-            detail=f"Processing not completed. Current status: {job['status']}"
+            detail=f"Processing not completed. Current status: {job.status}"
         )
 
     logger.info(
         "job_result_returned",
         job_id=job_id,
-        image_id=job["image_id"],
-        variants_count=len(job["processed_paths"]) if job["processed_paths"] else 0,
+        image_id=job.image_id,
+        variants_count=len(job.processed_paths) if job.processed_paths else 0,
     )
 
-    return {
-        "job_id": job["job_id"],
-        "image_id": job["image_id"],
+    return ORJSONResponse({
+        "job_id": job.job_id,
+        "image_id": job.image_id,
         "status": "completed",
-        "urls": job["processed_paths"],
-        "metadata": job["processing_metadata"],
-        "completed_at": job["completed_at"]
-    }
+        "urls": job.processed_paths,
+        "metadata": job.processing_metadata,
+        "completed_at": job.completed_at
+    })
 
 
 # Updated: 2025-11-18 22:01 UTC - Production-ready code
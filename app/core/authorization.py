@@ -3,25 +3,30 @@
 This module implements a robust authorization system that:
 1. Validates bucket structure (org-{org_id}/groups/{group_id}/ format)
 2. Calls auth-api to check group membership and permissions
-3. Caches authorization decisions in Redis
+3. Caches authorization decisions in Redis, fronted by a short-lived
+   in-process cache
 4. Protects auth-api with circuit breaker (fail-closed)
 
 Architecture:
 - BucketValidator: Parse and validate bucket structure
 - AuthAPIClient: HTTP client for auth-api calls
 - CircuitBreaker: Fail-closed protection for auth-api
-- AuthorizationCache: Redis-based caching of auth decisions
+- AuthorizationCache: In-process + Redis caching of auth decisions
 - AuthorizationService: Orchestrates all components
 """
 
+import asyncio
 import re
 import httpx
 import redis.asyncio as redis
-from typing import Optional, Tuple, Literal
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Literal
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
+from redis.exceptions import RedisError
 
+from app.core.cache import ExpiringLRU, SingleFlight
 from app.core.config import settings
 from app.core.logging_config import get_logger
 
@@ -37,9 +42,9 @@ logger = get_logger(__name__)
 BucketType = Literal["group", "user", "system"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class BucketInfo:
-    """Parsed bucket information."""
+    """Parsed bucket information (immutable; shared by the parse cache)."""
     bucket_type: BucketType
     org_id: str
     resource_id: Optional[str] = None  # group_id or user_id (None for system)
@@ -79,16 +84,13 @@ class BucketValidator:
         >>> print(info.resource_id)  # "xyz789"
     """
 
-    # Regex patterns for bucket validation
-    # With org prefix (multi-tenant apps)
-    GROUP_PATTERN = re.compile(r'^org-([a-zA-Z0-9\-_]+)/groups/([a-zA-Z0-9\-_]+)/?$')
-    USER_PATTERN = re.compile(r'^org-([a-zA-Z0-9\-_]+)/users/([a-zA-Z0-9\-_]+)/?$')
-    SYSTEM_PATTERN = re.compile(r'^org-([a-zA-Z0-9\-_]+)/system/?$')
-
-    # Without org prefix (single-tenant apps or apps without org concept)
-    GROUP_PATTERN_SIMPLE = re.compile(r'^groups/([a-zA-Z0-9\-_]+)/?$')
-    USER_PATTERN_SIMPLE = re.compile(r'^users/([a-zA-Z0-9\-_]+)/?$')
-    SYSTEM_PATTERN_SIMPLE = re.compile(r'^system/?$')
+    # All formats in one pattern: an optional org prefix (multi-tenant apps)
+    # followed by the group, user or system segment, so a bucket is
+    # matched or rejected in a single pass
+    BUCKET_PATTERN = re.compile(
+        r'^(?:org-(?P<org_id>[a-zA-Z0-9\-_]+)/)?'
+        r'(?:groups/(?P<group_id>[a-zA-Z0-9\-_]+)|users/(?P<user_id>[a-zA-Z0-9\-_]+)|system)/?$'
+    )
 
     def parse(self, bucket: str) -> BucketInfo:
         """Parse and validate bucket string.
@@ -108,65 +110,25 @@ class BucketValidator:
                 detail="Bucket must be a non-empty string"
             )
 
-        # Try group pattern (with org prefix)
-        match = self.GROUP_PATTERN.match(bucket)
-        if match:
-            return BucketInfo(
-                bucket_type="group",
-                org_id=match.group(1),
-                resource_id=match.group(2),
-                original_bucket=bucket
-            )
+        return self._parse_string(bucket)
 
-        # Try user pattern (with org prefix)
-        match = self.USER_PATTERN.match(bucket)
-        if match:
-            return BucketInfo(
-                bucket_type="user",
-                org_id=match.group(1),
-                resource_id=match.group(2),
-                original_bucket=bucket
-            )
-
-        # Try system pattern (with org prefix)
-        match = self.SYSTEM_PATTERN.match(bucket)
-        if match:
-            return BucketInfo(
-                bucket_type="system",
-                org_id=match.group(1),
-                resource_id=None,
-                original_bucket=bucket
-            )
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_string(cls, bucket: str) -> BucketInfo:
+        """Match bucket against the known formats.
 
-        # Try simple group pattern (without org prefix)
-        match = self.GROUP_PATTERN_SIMPLE.match(bucket)
-        if match:
-            return BucketInfo(
-                bucket_type="group",
-                org_id=None,  # No org concept
-                resource_id=match.group(1),
-                original_bucket=bucket
-            )
-
-        # Try simple user pattern (without org prefix)
-        match = self.USER_PATTERN_SIMPLE.match(bucket)
-        if match:
-            return BucketInfo(
-                bucket_type="user",
-                org_id=None,  # No org concept
-                resource_id=match.group(1),
-                original_bucket=bucket
-            )
-
-        # Try simple system pattern (without org prefix)
-        match = self.SYSTEM_PATTERN_SIMPLE.match(bucket)
+        Memoized: the same few buckets are parsed on every request, often
+        twice (read-access check, then check_access). Invalid buckets raise
+        and are not cached.
+        """
+        match = cls.BUCKET_PATTERN.match(bucket)
         if match:
-            return BucketInfo(
-                bucket_type="system",
-                org_id=None,  # No org concept
-                resource_id=None,
-                original_bucket=bucket
-            )
+            org_id, group_id, user_id = match.group("org_id", "group_id", "user_id")
+            if group_id is not None:
+                return BucketInfo(bucket_type="group", org_id=org_id, resource_id=group_id, original_bucket=bucket)
+            if user_id is not None:
+                return BucketInfo(bucket_type="user", org_id=org_id, resource_id=user_id, original_bucket=bucket)
+            return BucketInfo(bucket_type="system", org_id=org_id, resource_id=None, original_bucket=bucket)
 
         # Invalid format
         if settings.BUCKET_VALIDATION_STRICT:
@@ -209,6 +171,29 @@ class BucketValidator:
 # ============================================================================
 
 
+# Shared keep-alive client for auth-api checks. Every cache miss used to open
+# a fresh connection; pooling lets concurrent checks reuse warm ones.
+_auth_api_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_auth_api_http_client() -> httpx.AsyncClient:
+    global _auth_api_http_client
+    if _auth_api_http_client is None or _auth_api_http_client.is_closed:
+        _auth_api_http_client = httpx.AsyncClient(
+            timeout=settings.AUTH_API_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _auth_api_http_client
+
+
+async def close_auth_api_http_client() -> None:
+    """Close the shared auth-api HTTP client (application shutdown)."""
+    global _auth_api_http_client
+    if _auth_api_http_client is not None:
+        await _auth_api_http_client.aclose()
+        _auth_api_http_client = None
+
+
 class AuthAPIClient:
     """HTTP client for auth-api authorization checks.
 
@@ -255,50 +240,50 @@ class AuthAPIClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            client = _get_auth_api_http_client()
+            logger.debug(
+                "auth_api_request",
+                url=url,
+                org_id=org_id,
+                user_id=user_id,
+                permission=permission
+            )
+
+            response = await client.post(url, json=payload)
+
+            # 200: Permission granted
+            if response.status_code == 200:
                 logger.debug(
-                    "auth_api_request",
-                    url=url,
+                    "auth_api_allowed",
                     org_id=org_id,
                     user_id=user_id,
                     permission=permission
                 )
+                return True
 
-                response = await client.post(url, json=payload)
-
-                # 200: Permission granted
-                if response.status_code == 200:
-                    logger.debug(
-                        "auth_api_allowed",
-                        org_id=org_id,
-                        user_id=user_id,
-                        permission=permission
-                    )
-                    return True
-
-                # 403: Permission denied
-                if response.status_code == 403:
-                    logger.info(
-                        "auth_api_denied",
-                        org_id=org_id,
-                        user_id=user_id,
-                        permission=permission
-                    )
-                    return False
-
-                # Other errors
-                logger.error(
-                    "auth_api_error",
-                    status_code=response.status_code,
-                    response=response.text[:200],
+            # 403: Permission denied
+            if response.status_code == 403:
+                logger.info(
+                    "auth_api_denied",
                     org_id=org_id,
                     user_id=user_id,
                     permission=permission
                 )
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Authorization service unavailable"
-                )
+                return False
+
+            # Other errors
+            logger.error(
+                "auth_api_error",
+                status_code=response.status_code,
+                response=response.text[:200],
+                org_id=org_id,
+                user_id=user_id,
+                permission=permission
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authorization service unavailable"
+            )
 
         except httpx.TimeoutException as e:
             logger.error(
@@ -333,6 +318,13 @@ class AuthAPIClient:
 # ============================================================================
 
 
+# Failure count last seen while the circuit was closed, shared by the
+# per-request breakers of this process. While fresh, closed-state checks
+# skip Redis; a stale "closed" only delays noticing an open circuit by up
+# to the TTL.
+_breaker_closed = ExpiringLRU(maxsize=1, ttl=1.0)
+
+
 class CircuitBreaker:
     """Circuit breaker for auth-api with Redis state management.
 
@@ -368,15 +360,23 @@ class CircuitBreaker:
         if not self.enabled:
             return False
 
-        state = await self.redis.get(self.REDIS_KEY_STATE)
+        if _breaker_closed.get(self.REDIS_KEY_STATE) is not None:
+            return False
+
+        state, failures, opened_at = await self.redis.mget(
+            self.REDIS_KEY_STATE, self.REDIS_KEY_FAILURES, self.REDIS_KEY_OPENED_AT
+        )
         if state != b"OPEN":
+            _breaker_closed.set(self.REDIS_KEY_STATE, int(failures or 0))
             return False
 
         # Check if timeout has expired
-        opened_at = await self.redis.get(self.REDIS_KEY_OPENED_AT)
         if opened_at:
             opened_time = datetime.fromisoformat(opened_at.decode())
-            if datetime.utcnow() - opened_time > timedelta(seconds=self.timeout):
+            if opened_time.tzinfo is None:
+                # Written by an older version as naive UTC
+                opened_time = opened_time.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) - opened_time > timedelta(seconds=self.timeout):
                 # Timeout expired, close circuit
                 await self.reset()
                 logger.info("circuit_breaker_auto_reset", timeout=self.timeout)
@@ -384,12 +384,32 @@ class CircuitBreaker:
 
         return True
 
+    async def get_state(self) -> str:
+        """Get circuit state for monitoring.
+
+        Returns:
+            str: "open", "closed", or "disabled"
+        """
+        if not self.enabled:
+            return "disabled"
+        return "open" if await self.is_open() else "closed"
+
+    async def get_failure_count(self) -> int:
+        """Get the current consecutive failure count."""
+        failures = await self.redis.get(self.REDIS_KEY_FAILURES)
+        return int(failures) if failures else 0
+
     async def record_success(self):
         """Record successful call, reset failure counter."""
         if not self.enabled:
             return
 
+        if _breaker_closed.get(self.REDIS_KEY_STATE) == 0:
+            # No failures to clear
+            return
+
         await self.redis.delete(self.REDIS_KEY_FAILURES)
+        _breaker_closed.set(self.REDIS_KEY_STATE, 0)
         logger.debug("circuit_breaker_success")
 
     async def record_failure(self):
@@ -398,6 +418,7 @@ class CircuitBreaker:
             return
 
         failures = await self.redis.incr(self.REDIS_KEY_FAILURES)
+        _breaker_closed.pop(self.REDIS_KEY_STATE)
         logger.warning("circuit_breaker_failure", failures=failures, threshold=self.threshold)
 
         if failures >= self.threshold:
@@ -405,11 +426,12 @@ class CircuitBreaker:
 
     async def open(self):
         """Open circuit breaker (block all requests)."""
-        await self.redis.set(self.REDIS_KEY_STATE, "OPEN")
-        await self.redis.set(
-            self.REDIS_KEY_OPENED_AT,
-            datetime.utcnow().isoformat()
-        )
+        _breaker_closed.pop(self.REDIS_KEY_STATE)
+        # One MSET so no reader sees OPEN without its opened_at timestamp
+        await self.redis.mset({
+            self.REDIS_KEY_STATE: "OPEN",
+            self.REDIS_KEY_OPENED_AT: datetime.now(timezone.utc).isoformat(),
+        })
         logger.error(
             "circuit_breaker_opened",
             threshold=self.threshold,
@@ -419,9 +441,10 @@ class CircuitBreaker:
 
     async def reset(self):
         """Reset circuit breaker to closed state."""
-        await self.redis.delete(self.REDIS_KEY_STATE)
-        await self.redis.delete(self.REDIS_KEY_FAILURES)
-        await self.redis.delete(self.REDIS_KEY_OPENED_AT)
+        _breaker_closed.pop(self.REDIS_KEY_STATE)
+        await self.redis.delete(
+            self.REDIS_KEY_STATE, self.REDIS_KEY_FAILURES, self.REDIS_KEY_OPENED_AT
+        )
         logger.info("circuit_breaker_reset")
 
     async def execute(self, func):
@@ -478,12 +501,33 @@ class CircuitBreaker:
 # ============================================================================
 
 
+# Process-wide first tier of the authorization cache. AuthorizationService
+# is built per request, so these live at module level. TTLs are short so a
+# revoked permission is not served from memory much longer than from Redis.
+_local_allowed = ExpiringLRU(
+    maxsize=settings.AUTH_LOCAL_CACHE_SIZE, ttl=settings.AUTH_LOCAL_CACHE_TTL_ALLOWED
+)
+_local_denied = ExpiringLRU(
+    maxsize=settings.AUTH_LOCAL_CACHE_SIZE, ttl=settings.AUTH_LOCAL_CACHE_TTL_DENIED
+)
+
+# Concurrent cache misses for the same permission share one auth-api call
+_permission_checks = SingleFlight()
+
+# Detached cache writes, referenced until done so they are not collected
+_pending_cache_writes: Set[asyncio.Task] = set()
+
+
 class AuthorizationCache:
-    """Redis-based cache for authorization decisions.
+    """Two-tier cache for authorization decisions.
+
+    Decisions are first looked up in an in-process LRU (seconds-long TTL),
+    then in Redis.
 
     Cache keys: auth:permission:{org_id}:{user_id}:{permission}
     Cache values: "1" (allowed) or "0" (denied)
-    TTL: Configurable per outcome (allowed vs denied)
+    TTL: Configurable per outcome (allowed vs denied); allowed decisions
+    can be overridden per base permission (AUTH_CACHE_TTL_BY_PERMISSION)
 
     Example:
         >>> cache = AuthorizationCache(redis_client)
@@ -496,6 +540,27 @@ class AuthorizationCache:
         self.enabled = settings.AUTH_CACHE_ENABLED
         self.ttl_allowed = settings.AUTH_CACHE_TTL_ALLOWED
         self.ttl_denied = settings.AUTH_CACHE_TTL_DENIED
+        self.ttl_by_permission = settings.AUTH_CACHE_TTL_BY_PERMISSION
+
+    @staticmethod
+    def _remember(key: str, allowed: bool) -> None:
+        """Store a decision in the in-process tier."""
+        if allowed:
+            _local_denied.pop(key)
+            _local_allowed.set(key, True)
+        else:
+            _local_allowed.pop(key)
+            _local_denied.set(key, True)
+
+    def _ttl_for(self, permission: str, allowed: bool) -> int:
+        """TTL for a decision; allowed ones may be overridden per base permission."""
+        if not allowed:
+            return self.ttl_denied
+        if self.ttl_by_permission:
+            # "image:read:group:xyz" -> "image:read"
+            base = ":".join(permission.split(":", 2)[:2])
+            return self.ttl_by_permission.get(base, self.ttl_allowed)
+        return self.ttl_allowed
 
     def _make_key(self, org_id: str, user_id: str, permission: str) -> str:
         """Generate cache key."""
@@ -521,6 +586,11 @@ class AuthorizationCache:
             return None
 
         key = self._make_key(org_id, user_id, permission)
+        if _local_allowed.get(key):
+            return True
+        if _local_denied.get(key):
+            return False
+
         value = await self.redis.get(key)
 
         if value is None:
@@ -528,9 +598,55 @@ class AuthorizationCache:
             return None
 
         allowed = value == b"1"
+        self._remember(key, allowed)
         logger.debug("auth_cache_hit", key=key, allowed=allowed)
         return allowed
 
+    async def get_many(
+        self,
+        org_id: str,
+        user_id: str,
+        permissions: List[str]
+    ) -> Dict[str, Optional[bool]]:
+        """Get cached decisions for several permissions in one Redis round-trip.
+
+        Permissions missing from the in-process tier are fetched with a
+        single MGET; hits are stored in the in-process tier.
+
+        Args:
+            org_id: Organization ID
+            user_id: User ID
+            permissions: Permission strings
+
+        Returns:
+            Dict[str, Optional[bool]]: permission -> True/False, or None on a miss
+        """
+        if not self.enabled:
+            return dict.fromkeys(permissions)
+
+        decisions: Dict[str, Optional[bool]] = {}
+        remote: Dict[str, str] = {}
+        for permission in permissions:
+            key = self._make_key(org_id, user_id, permission)
+            if _local_allowed.get(key):
+                decisions[permission] = True
+            elif _local_denied.get(key):
+                decisions[permission] = False
+            else:
+                remote[permission] = key
+
+        if remote:
+            values = await self.redis.mget(list(remote.values()))
+            for (permission, key), value in zip(remote.items(), values):
+                if value is None:
+                    decisions[permission] = None
+                else:
+                    decisions[permission] = allowed = value == b"1"
+                    self._remember(key, allowed)
+            logger.debug("auth_cache_get_many", requested=len(remote), hits=sum(v is not None for v in values))
+
+        return decisions
+
     async def set(
         self,
         org_id: str,
@@ -551,8 +667,9 @@ class AuthorizationCache:
 
         key = self._make_key(org_id, user_id, permission)
         value = "1" if allowed else "0"
-        ttl = self.ttl_allowed if allowed else self.ttl_denied
+        ttl = self._ttl_for(permission, allowed)
 
+        self._remember(key, allowed)
         await self.redis.setex(key, ttl, value)
         logger.debug(
             "auth_cache_set",
@@ -578,6 +695,8 @@ class AuthorizationCache:
             return
 
         key = self._make_key(org_id, user_id, permission)
+        _local_allowed.pop(key)
+        _local_denied.pop(key)
         await self.redis.delete(key)
         logger.debug("auth_cache_invalidate", key=key)
 
@@ -692,6 +811,35 @@ class AuthorizationService:
             required_permission
         )
 
+    async def prefetch(
+        self,
+        auth_context: AuthContext,
+        permission: str,
+        buckets: Iterable[str]
+    ) -> None:
+        """Load cached group decisions for several buckets with one MGET.
+
+        Later `check_access` calls for these buckets are then answered from
+        the in-process tier. Invalid buckets are skipped; `check_access`
+        reports them.
+
+        Args:
+            auth_context: Authenticated user context from JWT
+            permission: Base permission (e.g., "image:read")
+            buckets: Bucket identifiers about to be checked
+        """
+        permissions = []
+        for bucket in buckets:
+            try:
+                bucket_info = self.validator.parse(bucket)
+            except HTTPException:
+                continue
+            if bucket_info.bucket_type == "group":
+                permissions.append(self._build_permission(permission, bucket_info))
+
+        if len(permissions) > 1:
+            await self.cache.get_many(auth_context.org_id, auth_context.user_id, permissions)
+
     def _build_permission(
         self,
         base_permission: str,
@@ -735,6 +883,32 @@ class AuthorizationService:
         Raises:
             HTTPException: 403 if denied, 503 if auth-api unavailable
         """
+        flight_key = (auth_context.org_id, auth_context.user_id, permission)
+        allowed = await _permission_checks.do(
+            flight_key, lambda: self._resolve_permission(auth_context, permission)
+        )
+
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied"
+            )
+
+        return True
+
+    async def _resolve_permission(
+        self,
+        auth_context: AuthContext,
+        permission: str
+    ) -> bool:
+        """Look up a permission in the cache, asking auth-api on a miss.
+
+        Returns:
+            bool: Whether the permission is granted
+
+        Raises:
+            HTTPException: 503 if auth-api unavailable (circuit breaker)
+        """
         # Check cache first
         cached = await self.cache.get(
             auth_context.org_id,
@@ -743,12 +917,7 @@ class AuthorizationService:
         )
 
         if cached is not None:
-            if not cached:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Permission denied (cached)"
-                )
-            return True
+            return cached
 
         # Cache miss - call auth-api with circuit breaker protection
         async def _check():
@@ -765,21 +934,30 @@ class AuthorizationService:
             # Fail-closed: deny access
             raise
 
-        # Cache result
-        await self.cache.set(
-            auth_context.org_id,
-            auth_context.user_id,
-            permission,
-            allowed
-        )
+        # Cache the result off the request path; a lost write only costs a
+        # repeat auth-api call
+        task = asyncio.create_task(self._store_decision(auth_context, permission, allowed))
+        _pending_cache_writes.add(task)
+        task.add_done_callback(_pending_cache_writes.discard)
 
-        if not allowed:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied"
-            )
+        return allowed
 
-        return True
+    async def _store_decision(
+        self,
+        auth_context: AuthContext,
+        permission: str,
+        allowed: bool
+    ) -> None:
+        """Write an auth-api decision to the cache, logging Redis failures."""
+        try:
+            await self.cache.set(
+                auth_context.org_id,
+                auth_context.user_id,
+                permission,
+                allowed
+            )
+        except RedisError as e:
+            logger.warning("auth_cache_write_failed", permission=permission, error=str(e))
 
 
 # ============================================================================
@@ -796,6 +974,8 @@ async def get_redis_pool() -> redis.Redis:
 
     This function ensures only one Redis connection pool exists for the entire
     application lifecycle, preventing memory leaks and connection exhaustion.
+    It backs the authorization cache, circuit breaker and status caches, so
+    it is sized (REDIS_CACHE_POOL_SIZE) for their combined concurrency.
 
     Returns:
         redis.Redis: Shared async Redis client with connection pooling
@@ -805,16 +985,17 @@ async def get_redis_pool() -> redis.Redis:
     if _redis_pool is None:
         logger.info(
             "initializing_redis_pool",
-            redis_url=settings.REDIS_URL,
-            max_connections=10
+            redis_url=settings.redis_cache_url,
+            max_connections=settings.REDIS_CACHE_POOL_SIZE
         )
         _redis_pool = redis.from_url(
-            settings.REDIS_URL,
+            settings.redis_cache_url,
             encoding="utf-8",
             decode_responses=False,
-            max_connections=10,  # Connection pool size
+            max_connections=settings.REDIS_CACHE_POOL_SIZE,
             socket_keepalive=True,
             socket_connect_timeout=5,
+            health_check_interval=30,  # PING connections idle longer than this
             retry_on_timeout=True
         )
 
@@ -0,0 +1,209 @@
+"""In-process TTL caching for expensive monitoring endpoints.
+
+Health and statistics endpoints are polled by load balancers and dashboards,
+often several times per second. Each poll runs database aggregations and
+Celery/auth-api round trips whose results barely change between calls.
+`TTLCache` memoizes those payloads per key with single-flight refresh:
+
+- Fresh entries are returned without touching the database or broker.
+- On a miss, the first caller computes the payload and concurrent callers
+  await the same future instead of running the query again.
+- The TTL adapts to how long the payload took to generate: slow payloads are
+  kept longer (bounded by `max_ttl`), fast ones expire after `min_ttl`.
+
+`ExpiringLRU` is the bounded, fixed-TTL variant for hot per-item lookups
+such as job rows and presigned URLs on the retrieval endpoints.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """Async-safe TTL cache with single-flight refresh.
+
+    Entries are stored as `{key: (expires_at, ttl, payload)}` using
+    `time.monotonic()` so wall clock adjustments never extend or cut short
+    a cached entry.
+    """
+
+    def __init__(self, min_ttl: float, max_ttl: float, buffer: float = 1.0):
+        """
+        Args:
+            min_ttl: Minimum lifetime of a cached payload in seconds
+            max_ttl: Maximum lifetime of a cached payload in seconds
+            buffer: Seconds added to the generation time when deriving the TTL
+        """
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.buffer = buffer
+        self._entries: Dict[str, Tuple[float, float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _ttl_for(self, elapsed: float) -> float:
+        """Derive the freshness lifetime from the payload generation time."""
+        return max(self.min_ttl, min(self.max_ttl, elapsed + self.buffer))
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, int]:
+        """Return the cached payload for key, computing it once on a miss.
+
+        Args:
+            key: Cache key (typically the endpoint path)
+            factory: Coroutine function producing the payload
+
+        Returns:
+            Tuple of (payload, remaining lifetime in whole seconds)
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[2], int(entry[0] - now)
+
+        # The refresh runs as its own task, so a caller that is cancelled
+        # (client disconnect) stops waiting without failing the others
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._refresh(key, factory))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._refresh_done(key, done))
+
+        payload, ttl = await asyncio.shield(task)
+        return payload, int(ttl)
+
+    async def _refresh(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, float]:
+        """Compute and store the payload for key."""
+        start = time.perf_counter()
+        payload = await factory()
+        ttl = self._ttl_for(time.perf_counter() - start)
+        self._entries[key] = (time.monotonic() + ttl, ttl, payload)
+        return payload, ttl
+
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished refresh; mark its error retrieved if nobody waited."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one cached key, or every key when none is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+class SingleFlight:
+    """Coalesce concurrent identical reads into one execution.
+
+    Callers that ask for a key while a computation for it is in flight
+    await that computation instead of starting their own, so a burst of
+    overlapping requests costs one database round-trip. Nothing is kept
+    once the computation finishes; freshness is unchanged.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory for key, or join the run already in flight.
+
+        Args:
+            key: Identity of the read (e.g. endpoint plus parameters)
+            factory: Coroutine function producing the result
+
+        Returns:
+            The result shared by all callers of this flight
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            return await asyncio.shield(inflight)
+
+        task = loop.create_task(factory())
+        self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+
+
+class ExpiringLRU:
+    """Bounded in-process cache with a fixed per-entry lifetime.
+
+    Used for hot lookups (job rows, presigned URLs) where many distinct keys
+    are read repeatedly. Entries expire `ttl` seconds after being stored and
+    the least recently used entry is evicted once `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop key if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+_timestamp_second = -1
+_timestamp_iso = ""
+
+
+def cached_utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string at one-second resolution.
+
+    The string is rebuilt only when the wall-clock second changes, so
+    endpoints polled many times per second (health probes) share one
+    formatted value instead of allocating a datetime and string per call.
+    """
+    global _timestamp_second, _timestamp_iso
+    second = int(time.time())
+    if second != _timestamp_second:
+        _timestamp_iso = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _timestamp_second = second
+    return _timestamp_iso
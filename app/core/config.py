@@ -3,7 +3,7 @@
 import re
 from pydantic import BaseModel, field_validator, model_validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
 
 
@@ -49,6 +49,8 @@ class Settings(BaseSettings):
     # Database
     # Use a local file path relative to the project root for development default
     DATABASE_PATH: str = os.path.join(os.getcwd(), "processor.db")
+    DATABASE_POOL_SIZE: int = 5  # Long-lived connections kept per process
+    DATABASE_READ_POOL_SIZE: int = 8  # Read-only SQLite connections for GET endpoints
 
     # Storage Backend Configuration
     STORAGE_BACKEND: str = "local"  # Options: "local" or "s3"
@@ -60,7 +62,21 @@ class Settings(BaseSettings):
     AWS_ENDPOINT_URL: Optional[str] = None  # For MinIO or S3-compatible services
 
     # Celery & Redis
+    # Redis roles (see docker-compose.yml for the matching server configuration):
+    # - REDIS_URL DB 0: Celery broker. Runs with maxmemory-policy noeviction so
+    #   queued tasks are never dropped under memory pressure. Also holds the
+    #   upload rate-limit windows (app/core/rate_limit.py): they are
+    #   enforcement state, and eviction or a cache restart would reset quotas.
+    # - REDIS_URL DB 1: Celery result backend (derived in app/tasks/celery_app.py).
+    # - REDIS_CACHE_URL: authorization cache, circuit breaker state and
+    #   dashboard/status caches. Eviction policy is per server, so this is a
+    #   separate instance with maxmemory 512mb + allkeys-lru: short-lived cache
+    #   entries are evicted instead of failing writes or starving the broker.
+    #   Unset: falls back to REDIS_URL (see `redis_cache_url`).
     REDIS_URL: str = "redis://redis:6379/0"
+    REDIS_CACHE_URL: Optional[str] = None
+    REDIS_CACHE_POOL_SIZE: int = 50  # Connections to REDIS_CACHE_URL per process
+    REDIS_RATE_LIMIT_POOL_SIZE: int = 20  # Rate-limiter connections to REDIS_URL per process
 
     # Security - OAuth 2.0 Resource Server Configuration
     # The image-api acts as an OAuth 2.0 Resource Server
@@ -91,6 +107,13 @@ class Settings(BaseSettings):
     AUTH_CACHE_ENABLED: bool = True
     AUTH_CACHE_TTL_ALLOWED: int = 60  # Cache allowed permissions for 60s
     AUTH_CACHE_TTL_DENIED: int = 120  # Cache denied permissions for 120s
+    # Allowed-decision TTL per base permission, overriding AUTH_CACHE_TTL_ALLOWED
+    # (env as JSON, e.g. '{"image:read": 300, "image:delete": 15}')
+    AUTH_CACHE_TTL_BY_PERMISSION: Dict[str, int] = {}
+    # In-process tier in front of the Redis cache (per API process)
+    AUTH_LOCAL_CACHE_SIZE: int = 50_000
+    AUTH_LOCAL_CACHE_TTL_ALLOWED: int = 10
+    AUTH_LOCAL_CACHE_TTL_DENIED: int = 5
 
     # Circuit Breaker
     CIRCUIT_BREAKER_ENABLED: bool = True
@@ -124,6 +147,7 @@ class Settings(BaseSettings):
     CELERY_TASK_ACKS_LATE: bool = True  # Acknowledge after completion
     CELERY_WORKER_PREFETCH_MULTIPLIER: int = 1  # One task at a time
     CELERY_WORKER_MAX_TASKS_PER_CHILD: int = 50  # Restart for memory cleanup
+    CELERY_STATS_REFRESH_SECONDS: int = 10  # Background worker inspection interval for /stats
 
     @field_validator('AWS_S3_BUCKET_NAME')
     @classmethod
@@ -194,6 +218,11 @@ class Settings(BaseSettings):
         """Check if application is in debug mode."""
         return self.DEBUG or self.LOG_LEVEL.upper() == "DEBUG"
 
+    @property
+    def redis_cache_url(self) -> str:
+        """Redis URL for caches, the broker's when no cache instance is set."""
+        return self.REDIS_CACHE_URL or self.REDIS_URL
+
     @property
     def use_json_logs(self) -> bool:
         """Determine if JSON logging should be used.
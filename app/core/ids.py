@@ -0,0 +1,46 @@
+"""Random identifier generation for request hot paths.
+
+`uuid.uuid4()` makes one getrandom() call per UUID, and every upload needs
+several (job, image, event and trace IDs). `new_uuid()` draws randomness
+for `_POOL_SIZE` UUIDs with a single `os.urandom` call and hands them out
+one by one.
+"""
+
+import os
+import threading
+import uuid
+from typing import List
+
+
+_POOL_SIZE = 128
+
+_pool: List[str] = []
+_refill_lock = threading.Lock()
+
+# A forked child (Celery prefork, preloading servers) would otherwise hand
+# out the same UUIDs as its parent and siblings
+os.register_at_fork(after_in_child=_pool.clear)
+
+
+def _refill() -> None:
+    """Generate _POOL_SIZE random (version 4) UUID strings at once."""
+    buf = os.urandom(16 * _POOL_SIZE)
+    _pool.extend(
+        str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+        for i in range(0, len(buf), 16)
+    )
+
+
+def new_uuid() -> str:
+    """Return a random UUID4 string, equivalent to `str(uuid.uuid4())`.
+
+    Safe to call from worker threads: list.pop() is atomic and refills are
+    serialized, so no UUID is ever handed out twice.
+    """
+    while True:
+        try:
+            return _pool.pop()
+        except IndexError:
+            with _refill_lock:
+                if not _pool:
+                    _refill()
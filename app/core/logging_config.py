@@ -78,6 +78,11 @@ get_correlation_id = get_trace_id
 clear_correlation_id = clear_trace_id
 
 
+# Service/version/environment never change at runtime; built on first use
+# (settings are imported lazily to avoid an import cycle) and reused per event
+_static_app_context: Optional[Dict[str, str]] = None
+
+
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add application context to all log records.
 
@@ -87,11 +92,17 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     - trace_id: Request tracking ID (if available)
     - correlation_id: Alias for trace_id (backward compatibility)
     """
-    from app.core.config import settings
+    global _static_app_context
 
-    event_dict["service"] = settings.SERVICE_NAME
-    event_dict["version"] = settings.VERSION
-    event_dict["environment"] = settings.ENVIRONMENT
+    if _static_app_context is None:
+        from app.core.config import settings
+
+        _static_app_context = {
+            "service": settings.SERVICE_NAME,
+            "version": settings.VERSION,
+            "environment": settings.ENVIRONMENT,
+        }
+    event_dict.update(_static_app_context)
 
     # Add trace ID if available (primary field for observability stack)
     trace_id = get_trace_id()
@@ -125,6 +136,21 @@ def filter_by_level(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
+class LevelCheckingBoundLogger(structlog.stdlib.BoundLogger):
+    """stdlib BoundLogger that skips disabled debug calls up front.
+
+    The stock wrapper copies the bound context and runs the processor chain
+    before filter_by_level drops the event. Debug calls sit on every
+    request path (auth cache, job polling), so when debug is off they
+    return after one cached `isEnabledFor` check instead.
+    """
+
+    def debug(self, event: Optional[str] = None, *args: Any, **kw: Any) -> Any:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return None
+        return super().debug(event, *args, **kw)
+
+
 def configure_structlog(debug: bool = False, json_logs: bool = True) -> None:
     """Configure structlog for structured logging.
 
@@ -132,8 +158,11 @@ def configure_structlog(debug: bool = False, json_logs: bool = True) -> None:
         debug: Enable debug mode with pretty console output
         json_logs: Use JSON formatting (True) or console (False)
     """
-    # Shared processors for all configurations
+    # Shared processors for all configurations. filter_by_level comes first
+    # so events below the stdlib logger's level (debug in production) are
+    # dropped before any timestamping, context or rendering work.
     shared_processors = [
+        structlog.stdlib.filter_by_level,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -160,7 +189,7 @@ def configure_structlog(debug: bool = False, json_logs: bool = True) -> None:
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=LevelCheckingBoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
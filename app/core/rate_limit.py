@@ -0,0 +1,183 @@
+"""Redis-backed sliding-window upload rate limiting.
+
+Each user has a sorted set `rl:{<user_id>}` holding one member per accepted
+upload, scored by its timestamp in milliseconds. The braces are a Redis
+Cluster hash tag, so everything keyed on a user stays on one shard. A single Lua script trims
+members older than the window, counts the rest and records the new upload,
+so the check-and-increment is atomic across all API replicas and costs one
+Redis round-trip. Denials are remembered in-process until the window
+frees up, so a user flooding uploads is rejected without touching Redis.
+The SQLite-backed `ProcessorService.check_rate_limit`
+remains the fallback when Redis is unavailable.
+"""
+
+import math
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.cache import ExpiringLRU
+from app.core.config import settings
+from app.core.ids import new_uuid
+from app.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# KEYS[1] = rl:{<user_id>}
+# ARGV = window_ms, max_uploads, now_ms, member
+# Returns {allowed (0/1), remaining, reset_at_ms}
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    allowed = 1
+    count = count + 1
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local reset_at = now + window
+if oldest[2] then
+    reset_at = tonumber(oldest[2]) + window
+end
+return {allowed, math.max(limit - count, 0), reset_at}
+"""
+
+
+class UploadRateLimiter:
+    """Atomic sliding-window rate limiter on Redis.
+
+    The script is registered once; redis-py runs it with EVALSHA and loads
+    it transparently if the server does not have it cached yet (NOSCRIPT
+    after a restart or SCRIPT FLUSH). `preload()` loads it up front so the
+    first upload does not pay for that round-trip.
+
+    Example:
+        >>> limiter = UploadRateLimiter(redis_client, window_seconds=3600)
+        >>> result = await limiter.hit("user-123", max_uploads=50)
+    """
+
+    KEY_PREFIX = "rl:"
+    DENY_CACHE_SIZE = 100_000
+
+    def __init__(self, redis_client: redis.Redis, window_seconds: int):
+        self.redis = redis_client
+        self.window_ms = window_seconds * 1000
+        self._script = redis_client.register_script(SLIDING_WINDOW_LUA)
+        # user_id -> (monotonic deadline, reset_at) for users currently over
+        # the limit; no entry can outlive the window itself
+        self._denied = ExpiringLRU(maxsize=self.DENY_CACHE_SIZE, ttl=window_seconds)
+
+    def key_for(self, user_id: str) -> str:
+        """Redis key of user_id's window, hash-tagged on the user ID."""
+        return f"{self.KEY_PREFIX}{{{user_id}}}"
+
+    async def preload(self) -> None:
+        """Load the script into the Redis script cache (SCRIPT LOAD)."""
+        await self.redis.script_load(SLIDING_WINDOW_LUA)
+
+    async def hit(self, user_id: str, max_uploads: int) -> dict:
+        """Record an upload attempt for user_id if it fits in the window.
+
+        Args:
+            user_id: User identifier
+            max_uploads: Maximum uploads allowed per window
+
+        Returns:
+            dict: 'allowed', 'remaining', 'reset_at' (ISO 8601, when the
+            oldest counted upload leaves the window) and 'retry_after'
+            (whole seconds until then); allowed results also carry the
+            'token' accepted by `release`
+
+        Raises:
+            redis.RedisError: If Redis is unreachable or the script fails
+        """
+        denied = self._denied.get(user_id)
+        if denied is not None:
+            until, reset_at = denied
+            wait = until - time.monotonic()
+            if wait > 0:
+                return {"allowed": False, "remaining": 0, "reset_at": reset_at, "retry_after": math.ceil(wait)}
+            self._denied.pop(user_id)
+
+        now_ms = int(time.time() * 1000)
+        token = new_uuid()
+        allowed, remaining, reset_ms = await self._script(
+            keys=[self.key_for(user_id)],
+            args=[self.window_ms, max_uploads, now_ms, token],
+        )
+
+        wait_ms = max(0, int(reset_ms) - now_ms)
+        result = {
+            "allowed": bool(allowed),
+            "remaining": int(remaining),
+            "reset_at": datetime.fromtimestamp(int(reset_ms) / 1000, timezone.utc).isoformat(),
+            "retry_after": math.ceil(wait_ms / 1000),
+        }
+        if allowed:
+            result["token"] = token
+        elif wait_ms:
+            self._denied.set(user_id, (time.monotonic() + wait_ms / 1000, result["reset_at"]))
+        return result
+
+    async def release(self, user_id: str, token: str) -> None:
+        """Give back the slot recorded by a `hit` that returned token.
+
+        Used when an upload is rejected after its slot was taken, so the
+        attempt does not count against the user.
+        """
+        await self.redis.zrem(self.key_for(user_id), token)
+
+
+_rate_limiter: Optional[UploadRateLimiter] = None
+
+
+def _create_rate_limit_client() -> redis.Redis:
+    """Client for the rate-limit windows on REDIS_URL.
+
+    The windows are enforcement state, so they live on the persistent
+    noeviction instance rather than the evicting REDIS_CACHE_URL cache,
+    where LRU eviction or a restart would silently reset users' quotas.
+    """
+    return redis.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=False,
+        max_connections=settings.REDIS_RATE_LIMIT_POOL_SIZE,
+        socket_keepalive=True,
+        socket_connect_timeout=5,
+        health_check_interval=30,
+        retry_on_timeout=True
+    )
+
+
+async def get_rate_limiter() -> UploadRateLimiter:
+    """Get the process-wide rate limiter on the REDIS_URL instance."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        limiter = UploadRateLimiter(
+            _create_rate_limit_client(),
+            window_seconds=settings.RATE_LIMIT_WINDOW_MINUTES * 60,
+        )
+        try:
+            await limiter.preload()
+        except RedisError as e:
+            # Not fatal: EVALSHA falls back to loading the script on first use
+            logger.warning("rate_limit_script_preload_failed", error=str(e))
+        _rate_limiter = limiter
+
+    return _rate_limiter
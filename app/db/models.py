@@ -2,13 +2,38 @@
 
 from datetime import datetime, timezone
 from typing import Optional, Any
-from sqlalchemy import String, Integer, JSON, DateTime, Text
+from sqlalchemy import String, Integer, JSON, DateTime, Text, DDL, Index, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 from app.db.base import Base
 
 
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware UTC datetime on every dialect.
+
+    Postgres stores timestamptz natively, but SQLite has no timezone support
+    and returns naive datetimes. Values are normalized to UTC when bound and
+    tagged as UTC when loaded, so callers always receive aware datetimes and
+    never need per-row tzinfo fixups. Naive inputs are assumed to be UTC.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+            if dialect.name == "sqlite":
+                value = value.replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
 class ProcessingJob(Base):
     """Model for processing jobs."""
     __tablename__ = "processing_jobs"
@@ -33,16 +58,34 @@ class ProcessingJob(Base):
     last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Timestamps
-    # Using DateTime with timezone=True is best practice for Postgres,
-    # but SQLite doesn't support it natively. SQLAlchemy handles the conversion.
-    # For SQLite, use CURRENT_TIMESTAMP instead of func.now()
+    # UTCDateTime stores timezone-aware values on Postgres and UTC wall time
+    # on SQLite; both load as aware UTC datetimes.
+    # For SQLite, use CURRENT_TIMESTAMP (UTC) instead of func.now()
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.current_timestamp(),
         nullable=False
     )
-    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(UTCDateTime(), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(UTCDateTime(), nullable=True)
+
+    __table_args__ = (
+        # Partial indexes: /failed lists failed jobs newest first, and the 24h
+        # performance stats filter completed jobs by creation time. Each
+        # index only covers the rows its query can match.
+        Index(
+            "ix_jobs_failed_completed",
+            completed_at.desc(),
+            sqlite_where=text("status = 'failed'"),
+            postgresql_where=text("status = 'failed'"),
+        ),
+        Index(
+            "ix_jobs_completed_created",
+            "created_at",
+            sqlite_where=text("status = 'completed'"),
+            postgresql_where=text("status = 'completed'"),
+        ),
+    )
 
 
 class ImageUploadEvent(Base):
@@ -57,7 +100,7 @@ class ImageUploadEvent(Base):
     # or we can use a different name. The DB column can remain 'metadata' if we specify it in mapped_column.
     metadata_: Mapped[Optional[dict[str, Any]]] = mapped_column("metadata", JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         server_default=func.current_timestamp(),
         nullable=False
     )
@@ -73,3 +116,76 @@ class UploadRateLimit(Base):
     # Code used: window_start = datetime.utcnow().replace(minute=0, second=0, microsecond=0).isoformat()
     window_start: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     upload_count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class JobStat(Base):
+    """Incrementally maintained job counters (total, distinct images, per status).
+
+    Keys are 'total_jobs', 'distinct_images' and 'status:<status>'. On SQLite
+    the rows are kept current by triggers on processing_jobs so statistics
+    endpoints read a handful of rows instead of scanning the jobs table.
+    """
+    __tablename__ = "job_stats_cache"
+
+    k: Mapped[str] = mapped_column(String, primary_key=True)
+    v: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ImageRefcount(Base):
+    """Number of jobs per image_id, used to maintain the distinct image count."""
+    __tablename__ = "image_refcount"
+
+    image_id: Mapped[str] = mapped_column(String, primary_key=True)
+    n: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+# SQLite triggers keeping job_stats_cache/image_refcount in sync with
+# processing_jobs. Shared with the Alembic migration that introduces them.
+JOB_STATS_SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_insert
+    AFTER INSERT ON processing_jobs
+    BEGIN
+        INSERT INTO image_refcount (image_id, n) VALUES (NEW.image_id, 1)
+            ON CONFLICT(image_id) DO UPDATE SET n = n + 1;
+        INSERT INTO job_stats_cache (k, v) VALUES ('total_jobs', 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+        INSERT INTO job_stats_cache (k, v)
+            SELECT 'distinct_images', 1
+            WHERE (SELECT n FROM image_refcount WHERE image_id = NEW.image_id) = 1
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+        INSERT INTO job_stats_cache (k, v) VALUES ('status:' || NEW.status, 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_delete
+    AFTER DELETE ON processing_jobs
+    BEGIN
+        UPDATE image_refcount SET n = n - 1 WHERE image_id = OLD.image_id;
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'total_jobs';
+        UPDATE job_stats_cache SET v = v - 1
+            WHERE k = 'distinct_images'
+            AND (SELECT n FROM image_refcount WHERE image_id = OLD.image_id) = 0;
+        DELETE FROM image_refcount WHERE image_id = OLD.image_id AND n <= 0;
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'status:' || OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_job_stats_update_status
+    AFTER UPDATE OF status ON processing_jobs
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE job_stats_cache SET v = v - 1 WHERE k = 'status:' || OLD.status;
+        INSERT INTO job_stats_cache (k, v) VALUES ('status:' || NEW.status, 1)
+            ON CONFLICT(k) DO UPDATE SET v = v + 1;
+    END
+    """,
+)
+
+for _trigger_sql in JOB_STATS_SQLITE_TRIGGERS:
+    event.listen(
+        ProcessingJob.__table__,
+        "after_create",
+        DDL(_trigger_sql).execute_if(dialect="sqlite"),
+    )
@@ -1,8 +1,15 @@
 """Database session management."""
 
+import asyncio
 from typing import AsyncGenerator
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.logging_config import get_logger
+
+
+logger = get_logger(__name__)
 
 # Determine database URL based on configuration
 # If DATABASE_PATH is provided and no other URL is set, default to SQLite
@@ -17,14 +24,99 @@ else:
     database_url = getattr(settings, 'DATABASE_URL', f"sqlite+aiosqlite:///{settings.DATABASE_PATH}")
 
 
-engine = create_async_engine(
-    database_url,
-    echo=settings.is_debug_mode,
-    future=True,
-    # SQLite specific args for concurrency
-    connect_args={"check_same_thread": False} if "sqlite" in database_url else {}
+# SQLite connection PRAGMAs applied once per pooled connection:
+# WAL lets readers proceed while a writer commits, busy_timeout waits for the
+# write lock instead of failing with "database is locked", and the remaining
+# settings trade fsync frequency for throughput, keep temp data in memory and
+# serve hot pages through a 256MB memory map instead of read() syscalls.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
 )
 
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _apply_sqlite_query_only(dbapi_connection, connection_record):
+    """Reject writes on connections from the read-only pool."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=1")
+    cursor.close()
+
+
+if "sqlite" in database_url:
+    # aiosqlite defaults to NullPool, which opens a new connection (and
+    # worker thread) for every session. Keep a small pool of long-lived
+    # connections instead.
+    engine = create_async_engine(
+        database_url,
+        echo=settings.is_debug_mode,
+        future=True,
+        # SQLite specific args for concurrency
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_POOL_SIZE,
+    )
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+    # Read-only GETs (job polling, image lookups) get their own pool so they
+    # never queue behind writers for a connection. Under WAL they read the
+    # last committed snapshot concurrently with the single SQLite writer;
+    # query_only makes an accidental write fail instead of taking the lock.
+    read_engine = create_async_engine(
+        database_url,
+        echo=settings.is_debug_mode,
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+        max_overflow=0,
+    )
+    event.listen(read_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(read_engine.sync_engine, "connect", _apply_sqlite_query_only)
+else:
+    engine = create_async_engine(
+        database_url,
+        echo=settings.is_debug_mode,
+        future=True,
+        pool_size=settings.DATABASE_POOL_SIZE,
+    )
+    # Servers handle concurrent readers themselves; share the one pool
+    read_engine = engine
+
+
+async def optimize_sqlite() -> None:
+    """Run PRAGMA optimize so planner statistics follow the data (SQLite only)."""
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.connect() as conn:
+        await conn.execute(text("PRAGMA optimize"))
+
+
+async def sqlite_optimizer(interval: float) -> None:
+    """Background loop running `optimize_sqlite` every `interval` seconds.
+
+    Started from the application lifespan and cancelled on shutdown.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await optimize_sqlite()
+        except Exception as e:
+            logger.warning("sqlite_optimize_failed", error=str(e))
+
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -33,6 +125,14 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session."""
@@ -41,3 +141,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting a read-only async database session."""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -1,17 +1,22 @@
 """Main FastAPI application for Image Processor Service."""
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
-from app.db.session import engine
+from app.db.session import engine, read_engine, AsyncSessionLocal, optimize_sqlite, sqlite_optimizer
 from app.db.base import Base
+from app.repositories.job_stats_repository import JobStatsRepository
+from app.core.authorization import close_auth_api_http_client
+from app.core.rate_limit import get_rate_limiter
 from app.api.v1 import upload, retrieval, health, dashboard, metrics
 from app.api.middleware import (
     RequestLoggingMiddleware,
@@ -59,6 +64,18 @@ async def lifespan(app: FastAPI):
             await conn.run_sync(Base.metadata.create_all)
             logger.info("database_initialized", database_path=settings.DATABASE_PATH)
 
+    # Backfill trigger-maintained job counters (no-op outside SQLite)
+    async with AsyncSessionLocal() as session:
+        await JobStatsRepository(session).rebuild()
+        await session.commit()
+
+    # Refresh SQLite planner statistics so the partial job indexes are chosen
+    # (analysis_limit bounds the cost on large databases)
+    if engine.dialect.name == "sqlite":
+        async with engine.begin() as conn:
+            await conn.execute(text("PRAGMA analysis_limit=1000"))
+            await conn.execute(text("ANALYZE"))
+
     # OAuth 2.0 configuration
     logger.info(
         "oauth2_resource_server_initialized",
@@ -68,11 +85,32 @@ async def lifespan(app: FastAPI):
         jwt_algorithm=settings.JWT_ALGORITHM,
     )
 
+    # Keep Celery worker stats fresh in the background for /stats
+    celery_refresher = asyncio.create_task(
+        health.celery_stats_refresher(settings.CELERY_STATS_REFRESH_SECONDS)
+    )
+
+    # Keep SQLite planner statistics tuned (hourly PRAGMA optimize)
+    db_optimizer = asyncio.create_task(sqlite_optimizer(3600))
+
+    # Open the first rate-limit connection and load its script now,
+    # so the first upload after a deploy does not pay for them
+    redis_warmup = asyncio.create_task(get_rate_limiter())
+
     yield
 
     # Shutdown - cleanup resources
     logger.info("application_shutdown_initiated")
+    for task in (celery_refresher, db_optimizer, redis_warmup):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await health.close_health_http_client()
+    await close_auth_api_http_client()
+    await optimize_sqlite()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
     logger.info("application_shutdown", graceful=True)
 
 
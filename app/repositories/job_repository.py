@@ -1,8 +1,8 @@
 """Repository for ProcessingJob models."""
 
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import select, update, delete
+from typing import AsyncIterator, Dict, Iterable, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import Row, select, update, delete, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ProcessingJob
@@ -19,6 +19,33 @@ class JobRepository(BaseRepository[ProcessingJob]):
         """Get job by job_id."""
         return await self.get(job_id)
 
+    async def get_summary_row(self, job_id: str) -> Optional[Row]:
+        """Get the columns served to polling clients for one job.
+
+        Selects plain columns instead of loading a ProcessingJob entity, so
+        no ORM instance or identity-map entry is built per poll.
+
+        Returns:
+            Row with job_id, image_id, status, created_at, completed_at,
+            last_error, attempt_count, processed_paths and
+            processing_metadata; None if the job does not exist
+        """
+        job = self.model
+        stmt = select(
+            job.job_id,
+            job.image_id,
+            job.status,
+            job.created_at,
+            job.completed_at,
+            job.last_error,
+            job.attempt_count,
+            job.processed_paths,
+            job.processing_metadata,
+        ).where(job.job_id == job_id)
+
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
     async def get_latest_completed_by_image_id(self, image_id: str) -> Optional[ProcessingJob]:
         """Get most recent completed job for an image_id."""
         stmt = select(self.model).where(
@@ -29,6 +56,32 @@ class JobRepository(BaseRepository[ProcessingJob]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_latest_completed_by_image_ids(
+        self,
+        image_ids: Iterable[str]
+    ) -> Dict[str, ProcessingJob]:
+        """Get the most recent completed job for each of several image_ids.
+
+        Fetches all candidates with a single `WHERE image_id IN (...)` query
+        instead of one query per image.
+
+        Returns:
+            dict mapping image_id -> job; image_ids without a completed job
+            are absent
+        """
+        image_ids = list(dict.fromkeys(image_ids))
+        if not image_ids:
+            return {}
+
+        stmt = select(self.model).where(
+            self.model.image_id.in_(image_ids),
+            self.model.status == 'completed'
+        ).order_by(self.model.completed_at.asc())
+
+        result = await self.session.execute(stmt)
+        # Ascending order: later completions overwrite earlier ones
+        return {job.image_id: job for job in result.scalars()}
+
     async def update_status(
         self,
         job_id: str,
@@ -84,3 +137,50 @@ class JobRepository(BaseRepository[ProcessingJob]):
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_failure_summary(self) -> dict:
+        """Count failed jobs for the last hour, last 24h and overall.
+
+        Computed with SUM(CASE ...) so all three counts come from a single
+        scan of the failed rows instead of three separate COUNT queries.
+        """
+        now = datetime.now(timezone.utc)
+        cutoff_1h = now - timedelta(hours=1)
+        cutoff_24h = now - timedelta(hours=24)
+
+        stmt = select(
+            func.sum(case((self.model.created_at > cutoff_1h, 1), else_=0)),
+            func.sum(case((self.model.created_at > cutoff_24h, 1), else_=0)),
+            func.count(),
+        ).where(self.model.status == 'failed')
+
+        row = (await self.session.execute(stmt)).one()
+        return {
+            "last_hour": row[0] or 0,
+            "last_24h": row[1] or 0,
+            "total": row[2] or 0,
+        }
+
+    async def iter_recent_failures(self, limit: int = 10) -> AsyncIterator[Tuple]:
+        """Yield the most recently failed jobs, newest first.
+
+        Only the columns needed for failure reporting are selected and
+        yielded as plain tuples of
+        (job_id, image_id, last_error, attempt_count, created_at, completed_at)
+        so no ORM objects are built for these read-only rows. Rows are
+        streamed in batches of 64: one fetch for the usual small limits,
+        bounded memory for large ones.
+        """
+        stmt = select(
+            self.model.job_id,
+            self.model.image_id,
+            self.model.last_error,
+            self.model.attempt_count,
+            self.model.created_at,
+            self.model.completed_at,
+        ).where(
+            self.model.status == 'failed'
+        ).order_by(self.model.completed_at.desc()).limit(limit)
+        result = await self.session.stream(stmt.execution_options(yield_per=64))
+        async for row in result.tuples():
+            yield row
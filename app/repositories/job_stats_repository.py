@@ -0,0 +1,200 @@
+"""Repository for incrementally maintained job counters."""
+
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import Select, select, delete, insert, func, literal, null, union_all, and_, case
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import JobStat, ImageRefcount, ProcessingJob
+from app.repositories.base import BaseRepository
+
+
+def processing_seconds(dialect_name: str, start: Any, end: Any) -> ColumnElement:
+    """SQL expression for the number of seconds between two timestamps.
+
+    SQLite has no interval type, so the difference is computed with julianday();
+    other dialects (Postgres) use EXTRACT(EPOCH FROM ...).
+    """
+    if dialect_name == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 86400.0
+    return func.extract("epoch", end - start)
+
+
+class JobStatsRepository(BaseRepository[JobStat]):
+    """Repository for reading job counters.
+
+    On SQLite the counters are maintained by triggers (see
+    `JOB_STATS_SQLITE_TRIGGERS`), so reading them is a single small
+    SELECT. Other dialects have no triggers and fall back to aggregating
+    processing_jobs directly.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(JobStat, session)
+
+    @property
+    def _has_triggers(self) -> bool:
+        return self.session.bind.dialect.name == "sqlite"
+
+    def _counter_selects(self, use_triggers: bool = True) -> List[Select]:
+        """SELECTs yielding (k, v, x) counter rows for this dialect."""
+        if use_triggers and self._has_triggers:
+            return [select(self.model.k, self.model.v, null())]
+
+        return [
+            select(literal("status:") + ProcessingJob.status, func.count(), null())
+            .group_by(ProcessingJob.status),
+            select(literal("distinct_images"), func.count(func.distinct(ProcessingJob.image_id)), null()),
+        ]
+
+    @staticmethod
+    def _parse_counter_rows(rows) -> Dict[str, Any]:
+        """Dispatch (k, v, x) rows into counters, status counts and extras."""
+        counters: Dict[str, Any] = {"distinct_images": 0}
+        status_counts: Dict[str, int] = {}
+        for key, value, extra in rows:
+            if key.startswith("status:"):
+                if value > 0:
+                    status_counts[key[len("status:"):]] = value
+            elif extra is not None:
+                counters[key] = (value, extra)
+            else:
+                counters[key] = value
+
+        counters.setdefault("total_jobs", sum(status_counts.values()))
+        counters["status"] = status_counts
+        return counters
+
+    async def get_counters(self) -> dict:
+        """Get total jobs, distinct images and per-status job counts.
+
+        Returns:
+            dict with keys 'total_jobs', 'distinct_images' and 'status'
+            (mapping status -> count, zero counts omitted)
+        """
+        result = await self.session.execute(union_all(*self._counter_selects()))
+        return self._parse_counter_rows(result.all())
+
+    async def get_stats_snapshot(self, completed_since: datetime) -> dict:
+        """Get counters plus completed-job performance in one round-trip.
+
+        The counter rows and the performance aggregate are combined with
+        UNION ALL and told apart by their key column.
+
+        Args:
+            completed_since: Only completed jobs created after this count
+                towards the performance figures
+
+        Returns:
+            dict with the keys of `get_counters` plus 'completed' and
+            'avg_processing_time_seconds'
+        """
+        duration = processing_seconds(
+            self.session.bind.dialect.name,
+            ProcessingJob.created_at,
+            ProcessingJob.completed_at,
+        )
+        perf = select(
+            literal("perf"),
+            func.count(),
+            func.coalesce(func.sum(duration), 0.0),
+        ).where(
+            ProcessingJob.status == 'completed',
+            ProcessingJob.created_at > completed_since
+        )
+
+        result = await self.session.execute(union_all(*self._counter_selects(), perf))
+        counters = self._parse_counter_rows(result.all())
+
+        completed, total_duration = counters.pop("perf", (0, 0.0))
+        counters["completed"] = completed
+        counters["avg_processing_time_seconds"] = (
+            round(float(total_duration) / completed, 2) if completed > 0 else None
+        )
+        return counters
+
+    async def get_window_metrics(self, cutoffs: Dict[str, datetime]) -> Dict[str, dict]:
+        """Get job totals and average processing time for several time windows.
+
+        All windows are aggregated in a single query with SUM(CASE ...),
+        scanning only jobs created after the oldest cutoff.
+
+        Args:
+            cutoffs: Mapping of window name -> jobs created after this count
+
+        Returns:
+            dict mapping window name -> {'total', 'completed', 'failed',
+            'avg_processing_time_seconds'}
+        """
+        job = ProcessingJob
+        duration = processing_seconds(self.session.bind.dialect.name, job.created_at, job.completed_at)
+        timed = and_(job.status == 'completed', job.completed_at.is_not(None))
+
+        columns = []
+        for cutoff in cutoffs.values():
+            in_window = job.created_at > cutoff
+            columns += [
+                func.sum(case((in_window, 1), else_=0)),
+                func.sum(case((and_(in_window, job.status == 'completed'), 1), else_=0)),
+                func.sum(case((and_(in_window, job.status == 'failed'), 1), else_=0)),
+                func.sum(case((and_(in_window, timed), duration), else_=0.0)),
+                func.sum(case((and_(in_window, timed), 1), else_=0)),
+            ]
+
+        stmt = select(*columns).where(job.created_at > min(cutoffs.values()))
+        row = (await self.session.execute(stmt)).one()
+
+        metrics = {}
+        for i, name in enumerate(cutoffs):
+            total, completed, failed, total_duration, timed_count = row[i * 5:(i + 1) * 5]
+            metrics[name] = {
+                "total": total or 0,
+                "completed": completed or 0,
+                "failed": failed or 0,
+                "avg_processing_time_seconds": (
+                    round(float(total_duration) / timed_count, 2) if timed_count else None
+                ),
+            }
+        return metrics
+
+    async def _aggregate_counters(self) -> dict:
+        """Compute the counters from processing_jobs, bypassing the triggers."""
+        result = await self.session.execute(union_all(*self._counter_selects(use_triggers=False)))
+        return self._parse_counter_rows(result.all())
+
+    async def rebuild(self) -> None:
+        """Backfill the counter tables from the current processing_jobs rows.
+
+        Runs at startup so counters are correct for rows that predate the
+        triggers. No-op on dialects without trigger support.
+        """
+        if not self._has_triggers:
+            return
+
+        await self.session.execute(delete(ImageRefcount))
+        await self.session.execute(delete(JobStat))
+
+        await self.session.execute(
+            insert(ImageRefcount).from_select(
+                ["image_id", "n"],
+                select(ProcessingJob.image_id, func.count()).group_by(ProcessingJob.image_id),
+            )
+        )
+        await self.session.execute(
+            insert(JobStat).from_select(
+                ["k", "v"],
+                select(literal("status:") + ProcessingJob.status, func.count())
+                .group_by(ProcessingJob.status),
+            )
+        )
+        await self.session.execute(
+            insert(JobStat).from_select(
+                ["k", "v"],
+                select(literal("total_jobs"), func.count()).select_from(ProcessingJob)
+                .union_all(
+                    select(literal("distinct_images"), func.count()).select_from(ImageRefcount)
+                ),
+            )
+        )
+        await self.session.flush()
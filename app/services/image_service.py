@@ -8,20 +8,30 @@ Benefits:
 - Clear responsibility boundaries
 - Easy to reason about and maintain
 """
-import json
-from uuid import uuid4
-from datetime import datetime
-from typing import Dict, Any
-from fastapi import UploadFile
+import asyncio
+import hashlib
+import time
+from typing import AsyncIterator, Dict, Any, Optional
+import orjson
+from fastapi import BackgroundTasks, UploadFile, status
 
 from app.services.processor_service import ProcessorService
 from app.storage.protocol import StorageBackend
 from app.core.logging_config import get_logger
 from app.core.errors import ServiceError, ErrorCode, processing_error, not_found_error
 from app.core.config import settings
+from app.core.ids import new_uuid
 
 logger = get_logger(__name__)
 
+# Uploads are forwarded to storage in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Staging writes running after their 202 was sent; bounds the spooled
+# uploads and open sessions held by background work under a burst
+MAX_BACKGROUND_UPLOADS = 256
+_background_uploads = asyncio.Semaphore(MAX_BACKGROUND_UPLOADS)
+
 
 class ImageService:
     """
@@ -43,6 +53,32 @@ class ImageService:
         self.processor_service = processor_service
         self.storage = storage
 
+    @staticmethod
+    async def _read_chunks(file: UploadFile, hasher: Any) -> AsyncIterator[bytes]:
+        """Yield the upload in UPLOAD_CHUNK_SIZE pieces, enforcing the size limit.
+
+        The limit is checked against the bytes actually received, so it holds
+        even when the client sent no (or a wrong) Content-Length header. Each
+        chunk is fed to hasher on the way through, so the content hash costs
+        no second pass over the file.
+
+        Raises:
+            ServiceError: 413 once the upload exceeds MAX_UPLOAD_SIZE_MB
+        """
+        max_size = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        received = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_size:
+                raise ServiceError(
+                    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    ErrorCode.UPLOAD_FILE_TOO_LARGE,
+                    f"File too large. Maximum allowed: {settings.MAX_UPLOAD_SIZE_MB}MB",
+                    {"max_size_mb": settings.MAX_UPLOAD_SIZE_MB},
+                )
+            hasher.update(chunk)
+            yield chunk
+
     async def process_new_upload(
         self,
         file: UploadFile,
@@ -51,7 +87,8 @@ class ImageService:
         auth_org_id: str,
         metadata_json: str,
         content_length: int,
-        detected_mime: str
+        detected_mime: str,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Dict[str, Any]:
         """
         Orchestrates the complete upload flow.
@@ -63,6 +100,10 @@ class ImageService:
         4. Save to staging storage
         5. Queue async processing task
 
+        Steps 4-5 (`stage_and_enqueue`) run after the response is sent when
+        background_tasks is given; their failures then mark the job failed
+        instead of raising.
+
         Args:
             file: The uploaded file object
             bucket: Logical storage bucket (e.g., "org-123/groups/abc")
@@ -71,6 +112,7 @@ class ImageService:
             metadata_json: JSON string with additional metadata
             content_length: File size in bytes
             detected_mime: MIME type detected via magic bytes
+            background_tasks: Request background tasks to defer staging to
 
         Returns:
             Dict with job_id, image_id, status, and status_url
@@ -81,16 +123,16 @@ class ImageService:
 
         # 1. Parse Metadata
         try:
-            meta = json.loads(metadata_json)
-        except json.JSONDecodeError as e:
+            meta = orjson.loads(metadata_json)
+        except orjson.JSONDecodeError as e:
             logger.warning("metadata_parse_failed", raw=metadata_json, error=str(e))
             # Graceful degradation: use empty dict instead of failing
             meta = {}
 
         # 2. Generate Identifiers
-        job_id = str(uuid4())
-        image_id = str(uuid4())
-        timestamp = int(datetime.utcnow().timestamp())
+        job_id = new_uuid()
+        image_id = new_uuid()
+        timestamp = int(time.time())
         staging_path = f"staging/{image_id}_{timestamp}"
 
         # 3. Prepare Processing Metadata
@@ -133,7 +175,37 @@ class ImageService:
                 details={"job_id": job_id}
             )
 
-        # 5. Storage Operation (Save to Staging)
+        if background_tasks is not None:
+            background_tasks.add_task(self._finish_upload, file, bucket, job_id, staging_path)
+        else:
+            await self.stage_and_enqueue(file, bucket, job_id, staging_path)
+
+        # Success: Return job details
+        return {
+            "job_id": job_id,
+            "image_id": image_id,
+            "status": "pending",
+            "status_url": f"/api/v1/images/jobs/{job_id}"
+        }
+
+    async def stage_and_enqueue(
+        self,
+        file: UploadFile,
+        bucket: str,
+        job_id: str,
+        staging_path: str
+    ) -> None:
+        """
+        Save an accepted upload to staging and queue its processing task.
+
+        On failure the job is marked failed (and the staging file removed if
+        it was written) before the error is raised.
+
+        Raises:
+            ServiceError: STAGING_FAILED / TASK_QUEUE_FAILED, or 413 if the
+            streamed upload exceeds the size limit
+        """
+        # Storage Operation (Save to Staging)
         try:
             # Reset file pointer to beginning (safety measure)
             try:
@@ -142,8 +214,10 @@ class ImageService:
                 # File stream might be closed or unseekable, log but continue
                 logger.warning("file_seek_failed", job_id=job_id, error=str(seek_error))
 
-            await self.storage.save(file.file, bucket, staging_path)
-            logger.debug("file_saved_to_staging", job_id=job_id, path=staging_path)
+            hasher = hashlib.sha256()
+            await self.storage.save_stream(self._read_chunks(file, hasher), bucket, staging_path)
+            sha256 = hasher.hexdigest()
+            logger.debug("file_saved_to_staging", job_id=job_id, path=staging_path, sha256=sha256)
         except Exception as e:
             # CRITICAL RACE CONDITION FIX: Rollback database state
             # Job exists in DB but file not saved - mark as failed to prevent zombie jobs
@@ -172,17 +246,24 @@ class ImageService:
                     original_error=str(e)
                 )
 
+            if isinstance(e, ServiceError):
+                raise
             raise processing_error(
                 code=ErrorCode.STAGING_FAILED,
                 message="Could not save file to staging storage",
                 details={"job_id": job_id, "bucket": bucket}
             )
 
-        # 6. Task Queue Operation (Trigger Async Processing)
+        # Task Queue Operation (Trigger Async Processing)
         try:
             # Lazy import to avoid circular dependency
             from app.tasks.celery_app import process_image_task
-            process_image_task.delay(job_id)
+            # The broker publish is blocking network I/O: run it off the event
+            # loop, and shield it so a client disconnect cannot drop the
+            # enqueue halfway through
+            await asyncio.shield(
+                asyncio.to_thread(process_image_task.delay, job_id, sha256=sha256)
+            )
             logger.info("processing_task_queued", job_id=job_id)
         except Exception as e:
             # CRITICAL RACE CONDITION FIX: Rollback database state and cleanup file
@@ -223,13 +304,25 @@ class ImageService:
                 details={"job_id": job_id}
             )
 
-        # Success: Return job details
-        return {
-            "job_id": job_id,
-            "image_id": image_id,
-            "status": "pending",
-            "status_url": f"/api/v1/images/jobs/{job_id}"
-        }
+    async def _finish_upload(
+        self,
+        file: UploadFile,
+        bucket: str,
+        job_id: str,
+        staging_path: str
+    ) -> None:
+        """Background variant of `stage_and_enqueue`: errors are logged, not raised."""
+        async with _background_uploads:
+            try:
+                await self.stage_and_enqueue(file, bucket, job_id, staging_path)
+            except ServiceError as e:
+                # The job is already marked failed; clients see it when polling
+                logger.error(
+                    "background_upload_failed",
+                    job_id=job_id,
+                    code=e.code,
+                    error=e.user_message,
+                )
 
     async def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """
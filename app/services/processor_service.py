@@ -2,12 +2,13 @@
 
 import json
 import time
-import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.ids import new_uuid
 from app.core.logging_config import get_logger
 from app.repositories.job_repository import JobRepository
 from app.repositories.event_repository import EventRepository
@@ -17,6 +18,23 @@ from app.db.models import ProcessingJob, ImageUploadEvent
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class JobSummary:
+    """The fields of a job exposed by the job status/result endpoints.
+
+    Timestamps stay datetimes; ORJSONResponse serializes them natively.
+    """
+    job_id: str
+    image_id: str
+    status: str
+    created_at: datetime
+    completed_at: Optional[datetime]
+    last_error: Optional[str]
+    attempt_count: int
+    processed_paths: Optional[dict]
+    processing_metadata: Optional[dict]
+
+
 class ProcessorService:
     """Service for image processing business logic."""
 
@@ -37,7 +55,7 @@ class ProcessorService:
         organization_id: str
     ) -> dict:
         """Create a new processing job."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.debug(
             "service_create_job_started",
@@ -60,7 +78,7 @@ class ProcessorService:
             )
 
             # Log event
-            event_id = str(uuid.uuid4())
+            event_id = new_uuid()
             await self.event_repo.create(
                 id=event_id,
                 event_type='upload_initiated',
@@ -71,7 +89,7 @@ class ProcessorService:
 
             await self.session.commit()
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "service_create_job_success",
                 job_id=job_id,
@@ -83,7 +101,7 @@ class ProcessorService:
 
         except Exception as exc:
             await self.session.rollback()
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_create_job_failed",
                 job_id=job_id,
@@ -104,7 +122,7 @@ class ProcessorService:
         error: Optional[str] = None
     ):
         """Update job processing status."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         now = datetime.now(timezone.utc)
 
@@ -142,7 +160,7 @@ class ProcessorService:
 
             await self.session.commit()
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "service_update_job_status_success",
                 job_id=job_id,
@@ -153,7 +171,7 @@ class ProcessorService:
 
         except Exception as exc:
             await self.session.rollback()
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_update_job_status_failed",
                 job_id=job_id,
@@ -165,34 +183,38 @@ class ProcessorService:
             )
             raise
 
+    @staticmethod
+    def _job_to_dict(job: ProcessingJob) -> dict:
+        """Convert a job model to the dict shape returned by the service."""
+        return {
+            "job_id": job.job_id,
+            "image_id": job.image_id,
+            "status": job.status,
+            "storage_bucket": job.storage_bucket,
+            "staging_path": job.staging_path,
+            "processed_paths": job.processed_paths,
+            "processing_metadata": job.processing_metadata,
+            "user_id": job.user_id,
+            "organization_id": job.organization_id,
+            "attempt_count": job.attempt_count,
+            "max_retries": job.max_retries,
+            "last_error": job.last_error,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+
     async def get_job(self, job_id: str) -> Optional[dict]:
         """Get job details."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.debug("service_get_job_started", job_id=job_id)
 
         try:
             job = await self.job_repo.get_by_job_id(job_id)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             if job:
-                # Convert model to dict
-                result = {
-                    "job_id": job.job_id,
-                    "image_id": job.image_id,
-                    "status": job.status,
-                    "storage_bucket": job.storage_bucket,
-                    "staging_path": job.staging_path,
-                    "processed_paths": job.processed_paths,
-                    "processing_metadata": job.processing_metadata,
-                    "user_id": job.user_id,
-                    "organization_id": job.organization_id,
-                    "attempt_count": job.attempt_count,
-                    "max_retries": job.max_retries,
-                    "last_error": job.last_error,
-                    "created_at": job.created_at.isoformat() if job.created_at else None,
-                    "started_at": job.started_at.isoformat() if job.started_at else None,
-                    "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                }
+                result = self._job_to_dict(job)
 
                 logger.debug(
                     "service_get_job_found",
@@ -210,7 +232,7 @@ class ProcessorService:
                 return None
 
         except Exception as exc:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_get_job_failed",
                 job_id=job_id,
@@ -221,33 +243,22 @@ class ProcessorService:
             )
             raise
 
+    async def get_job_summary(self, job_id: str) -> Optional[JobSummary]:
+        """Get the status fields of a job for polling clients."""
+        row = await self.job_repo.get_summary_row(job_id)
+        return JobSummary(*row) if row is not None else None
+
     async def get_job_by_image_id(self, image_id: str) -> Optional[dict]:
         """Get most recent completed job for an image_id."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.debug("service_get_job_by_image_id_started", image_id=image_id)
 
         try:
             job = await self.job_repo.get_latest_completed_by_image_id(image_id)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             if job:
-                result = {
-                    "job_id": job.job_id,
-                    "image_id": job.image_id,
-                    "status": job.status,
-                    "storage_bucket": job.storage_bucket,
-                    "staging_path": job.staging_path,
-                    "processed_paths": job.processed_paths,
-                    "processing_metadata": job.processing_metadata,
-                    "user_id": job.user_id,
-                    "organization_id": job.organization_id,
-                    "attempt_count": job.attempt_count,
-                    "max_retries": job.max_retries,
-                    "last_error": job.last_error,
-                    "created_at": job.created_at.isoformat() if job.created_at else None,
-                    "started_at": job.started_at.isoformat() if job.started_at else None,
-                    "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                }
+                result = self._job_to_dict(job)
 
                 logger.debug(
                     "service_get_job_by_image_id_found",
@@ -265,7 +276,7 @@ class ProcessorService:
                 return None
 
         except Exception as exc:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_get_job_by_image_id_failed",
                 image_id=image_id,
@@ -276,9 +287,41 @@ class ProcessorService:
             )
             raise
 
+    async def get_jobs_by_image_ids(self, image_ids: List[str]) -> Dict[str, dict]:
+        """Get the most recent completed job for several image_ids in one query.
+
+        Returns:
+            dict mapping image_id -> job dict; unknown image_ids are absent
+        """
+        start_time = time.perf_counter()
+
+        try:
+            jobs = await self.job_repo.get_latest_completed_by_image_ids(image_ids)
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            logger.debug(
+                "service_get_jobs_by_image_ids_completed",
+                requested_count=len(image_ids),
+                found_count=len(jobs),
+                duration_ms=round(duration_ms, 2),
+            )
+            return {image_id: self._job_to_dict(job) for image_id, job in jobs.items()}
+
+        except Exception as exc:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.error(
+                "service_get_jobs_by_image_ids_failed",
+                requested_count=len(image_ids),
+                duration_ms=round(duration_ms, 2),
+                error_type=type(exc).__name__,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise
+
     async def check_rate_limit(self, user_id: str, max_uploads: int = 50) -> dict:
         """Check and increment rate limit for a user."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Calculate current hourly window
         window_start = datetime.now(timezone.utc).replace(
@@ -297,7 +340,7 @@ class ProcessorService:
             current_count = rate_limit.upload_count if rate_limit else 0
 
             if current_count >= max_uploads:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 logger.warning(
                     "service_rate_limit_exceeded",
                     user_id=user_id,
@@ -314,7 +357,7 @@ class ProcessorService:
             new_count = await self.rate_limit_repo.increment_usage(user_id, window_start)
             await self.session.commit()
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "service_rate_limit_incremented",
                 user_id=user_id,
@@ -331,7 +374,7 @@ class ProcessorService:
 
         except Exception as exc:
             await self.session.rollback()
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_rate_limit_check_failed",
                 user_id=user_id,
@@ -344,12 +387,12 @@ class ProcessorService:
 
     async def can_retry(self, job_id: str) -> bool:
         """Check if a job can be retried."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.debug("service_can_retry_check_started", job_id=job_id)
 
         try:
             job = await self.job_repo.get_by_job_id(job_id)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             if job:
                 can_retry = job.attempt_count < job.max_retries
@@ -371,7 +414,7 @@ class ProcessorService:
                 return False
 
         except Exception as exc:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_can_retry_check_failed",
                 job_id=job_id,
@@ -384,7 +427,7 @@ class ProcessorService:
 
     async def delete_job(self, job_id: str):
         """Delete a job record."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.debug("service_delete_job_started", job_id=job_id)
 
         try:
@@ -392,7 +435,7 @@ class ProcessorService:
             if success:
                 await self.session.commit()
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "service_delete_job_success",
                 job_id=job_id,
@@ -401,7 +444,7 @@ class ProcessorService:
 
         except Exception as exc:
             await self.session.rollback()
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
                 "service_delete_job_failed",
                 job_id=job_id,
@@ -1,14 +1,26 @@
 """Local filesystem storage backend."""
 
+import asyncio
+import shutil
 import aiofiles
 from pathlib import Path
-from typing import BinaryIO
+from typing import AsyncIterator, BinaryIO, List
 
 from app.core.logging_config import get_logger
 
 
 logger = get_logger(__name__)
 
+# Copy buffer for save(); one worker-thread hop covers the whole file
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _copy_to_path(file: BinaryIO, full_path: Path) -> int:
+    """Copy file into full_path (blocking); returns the bytes written."""
+    with open(full_path, 'wb') as out:
+        shutil.copyfileobj(file, out, _COPY_BUFFER_SIZE)
+        return out.tell()
+
 
 class LocalStorageBackend:
     """Local filesystem storage implementation.
@@ -48,12 +60,9 @@ class LocalStorageBackend:
         )
 
         try:
-            # Write file in chunks for memory efficiency
-            bytes_written = 0
-            async with aiofiles.open(full_path, 'wb') as f:
-                while chunk := file.read(8192):
-                    await f.write(chunk)
-                    bytes_written += len(chunk)
+            # The source is an in-memory or spooled file, so do the whole
+            # copy in one worker thread instead of hopping per chunk
+            bytes_written = await asyncio.to_thread(_copy_to_path, file, full_path)
 
             logger.info(
                 "local_storage_save_success",
@@ -76,6 +85,57 @@ class LocalStorageBackend:
             )
             raise
 
+    async def save_stream(self, chunks: AsyncIterator[bytes], bucket: str, path: str) -> str:
+        """Write a stream of chunks to local filesystem.
+
+        A partially written file is removed if the stream or a write fails.
+
+        Args:
+            chunks: Async iterator yielding the file contents
+            bucket: Bucket name (becomes subdirectory)
+            path: File path within bucket
+
+        Returns:
+            str: Storage path in format "bucket/path"
+        """
+        full_path = self.base_path / bucket / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.debug(
+            "local_storage_save_started",
+            bucket=bucket,
+            path=path,
+            full_path=str(full_path),
+        )
+
+        bytes_written = 0
+        try:
+            async with aiofiles.open(full_path, 'wb') as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    bytes_written += len(chunk)
+
+        except BaseException as exc:
+            full_path.unlink(missing_ok=True)
+            logger.error(
+                "local_storage_save_failed",
+                bucket=bucket,
+                path=path,
+                bytes_written=bytes_written,
+                error_type=type(exc).__name__,
+                error=str(exc),
+            )
+            raise
+
+        logger.info(
+            "local_storage_save_success",
+            bucket=bucket,
+            path=path,
+            bytes_written=bytes_written,
+            storage_path=f"{bucket}/{path}",
+        )
+        return f"{bucket}/{path}"
+
     async def load(self, bucket: str, path: str) -> bytes:
         """Load file from local filesystem.
 
@@ -170,6 +230,27 @@ class LocalStorageBackend:
             )
             raise
 
+    async def delete_many(self, bucket: str, paths: List[str]) -> List[str]:
+        """Delete several files from local filesystem.
+
+        Local deletes are cheap, so this simply calls delete() per path;
+        failures are logged by delete() and reported back.
+
+        Args:
+            bucket: Bucket name
+            paths: File paths within bucket
+
+        Returns:
+            List[str]: Paths that could not be deleted
+        """
+        failed = []
+        for path in paths:
+            try:
+                await self.delete(bucket, path)
+            except Exception:
+                failed.append(path)
+        return failed
+
     async def get_url(self, bucket: str, path: str) -> str:
         """Get URL for static file serving.
 
@@ -1,6 +1,6 @@
 """Storage backend protocol definition."""
 
-from typing import Protocol, BinaryIO
+from typing import AsyncIterator, List, Protocol, BinaryIO
 
 
 class StorageBackend(Protocol):
@@ -23,6 +23,19 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def save_stream(self, chunks: AsyncIterator[bytes], bucket: str, path: str) -> str:
+        """Save a stream of chunks to storage without buffering it whole.
+
+        Args:
+            chunks: Async iterator yielding the file contents in order
+            bucket: Storage bucket/container name
+            path: Relative path within bucket
+
+        Returns:
+            str: Storage path identifier
+        """
+        ...
+
     async def load(self, bucket: str, path: str) -> bytes:
         """Load file from storage.
 
@@ -44,6 +57,18 @@ class StorageBackend(Protocol):
         """
         ...
 
+    async def delete_many(self, bucket: str, paths: List[str]) -> List[str]:
+        """Delete several files from one bucket.
+
+        Args:
+            bucket: Storage bucket/container name
+            paths: Relative paths within bucket
+
+        Returns:
+            List[str]: Paths that could not be deleted
+        """
+        ...
+
     async def get_url(self, bucket: str, path: str) -> str:
         """Get access URL for a file.
 
@@ -1,7 +1,8 @@
 """AWS S3 storage backend."""
 
 import aioboto3
-from typing import BinaryIO, Optional
+from contextlib import suppress
+from typing import AsyncIterator, BinaryIO, List, Optional
 from botocore.exceptions import ClientError, BotoCoreError
 
 from app.core.logging_config import get_logger
@@ -9,6 +10,13 @@ from app.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# DeleteObjects accepts at most 1000 keys per request
+_DELETE_OBJECTS_MAX_KEYS = 1000
+
+# Multipart parts must be at least 5 MiB (except the last); larger parts mean
+# fewer requests at the cost of more memory held per upload
+_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class S3StorageBackend:
     """AWS S3 storage implementation using a single bucket with prefixes.
@@ -233,6 +241,121 @@ class S3StorageBackend:
             # Convert to enriched exception
             raise self._handle_s3_error(exc, "upload", bucket, path)
 
+    async def save_stream(self, chunks: AsyncIterator[bytes], bucket: str, path: str) -> str:
+        """Upload a stream of chunks to S3 as a multipart upload.
+
+        At most one part (`_MULTIPART_PART_SIZE`) is held in memory. Streams
+        smaller than one part are sent with a single PutObject instead, and
+        an unfinished multipart upload is aborted if the stream fails.
+
+        Args:
+            chunks: Async iterator yielding the file contents
+            bucket: Logical bucket (used as prefix, e.g., "org-123/groups/abc")
+            path: File path within the logical bucket
+
+        Returns:
+            str: Storage path in format "bucket/path" (logical path preserved)
+
+        Raises:
+            ValueError: If bucket or path are invalid
+            FileNotFoundError: If S3 bucket doesn't exist
+            PermissionError: If access is denied
+        """
+        s3_key = self._normalize_path(bucket, path)
+
+        logger.debug(
+            "s3_storage_save_started",
+            physical_bucket=self.bucket_name,
+            logical_bucket=bucket,
+            path=path,
+            s3_key=s3_key,
+            region=self.region,
+        )
+
+        bytes_written = 0
+        try:
+            async with self._get_s3_client() as s3:
+                upload_id = None
+                parts = []
+                buffer = bytearray()
+
+                async def upload_part():
+                    response = await s3.upload_part(
+                        Bucket=self.bucket_name,
+                        Key=s3_key,
+                        UploadId=upload_id,
+                        PartNumber=len(parts) + 1,
+                        Body=bytes(buffer),
+                    )
+                    parts.append({'PartNumber': len(parts) + 1, 'ETag': response['ETag']})
+                    buffer.clear()
+
+                try:
+                    async for chunk in chunks:
+                        buffer += chunk
+                        bytes_written += len(chunk)
+                        if len(buffer) < _MULTIPART_PART_SIZE:
+                            continue
+                        if upload_id is None:
+                            response = await s3.create_multipart_upload(
+                                Bucket=self.bucket_name,
+                                Key=s3_key,
+                                ServerSideEncryption='AES256',
+                            )
+                            upload_id = response['UploadId']
+                        await upload_part()
+
+                    if upload_id is None:
+                        await s3.put_object(
+                            Bucket=self.bucket_name,
+                            Key=s3_key,
+                            Body=bytes(buffer),
+                            ServerSideEncryption='AES256',
+                        )
+                    else:
+                        if buffer:
+                            await upload_part()
+                        await s3.complete_multipart_upload(
+                            Bucket=self.bucket_name,
+                            Key=s3_key,
+                            UploadId=upload_id,
+                            MultipartUpload={'Parts': parts},
+                        )
+                except BaseException:
+                    if upload_id is not None:
+                        with suppress(Exception):
+                            await s3.abort_multipart_upload(
+                                Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id
+                            )
+                    raise
+
+        except (ClientError, BotoCoreError) as exc:
+            logger.error(
+                "s3_storage_save_failed",
+                physical_bucket=self.bucket_name,
+                logical_bucket=bucket,
+                path=path,
+                region=self.region,
+                bytes_written=bytes_written,
+                error_type=type(exc).__name__,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise self._handle_s3_error(exc, "upload", bucket, path)
+
+        logger.info(
+            "s3_storage_save_success",
+            physical_bucket=self.bucket_name,
+            logical_bucket=bucket,
+            path=path,
+            s3_key=s3_key,
+            region=self.region,
+            encryption="AES256",
+            bytes_written=bytes_written,
+            storage_path=s3_key,
+        )
+        return s3_key
+
     async def load(self, bucket: str, path: str) -> bytes:
         """Download file from S3.
 
@@ -351,6 +474,84 @@ class S3StorageBackend:
             # Convert to enriched exception
             raise self._handle_s3_error(exc, "delete", bucket, path)
 
+    async def delete_many(self, bucket: str, paths: List[str]) -> List[str]:
+        """Delete several objects with one DeleteObjects request.
+
+        Args:
+            bucket: Logical bucket (used as prefix, e.g., "org-123/groups/abc")
+            paths: File paths within the logical bucket
+
+        Returns:
+            List[str]: Paths that could not be deleted (invalid paths and
+            per-key errors reported by S3)
+
+        Raises:
+            Exception: Enriched S3 error if the request itself fails
+        """
+        failed: List[str] = []
+        keys = {}
+        for path in paths:
+            try:
+                keys[self._normalize_path(bucket, path)] = path
+            except ValueError as exc:
+                logger.warning(
+                    "s3_storage_delete_invalid_path",
+                    logical_bucket=bucket,
+                    path=path,
+                    error=str(exc),
+                )
+                failed.append(path)
+
+        if not keys:
+            return failed
+
+        key_list = list(keys)
+        key_errors = 0
+        try:
+            async with self._get_s3_client() as s3:
+                for start in range(0, len(key_list), _DELETE_OBJECTS_MAX_KEYS):
+                    chunk = key_list[start:start + _DELETE_OBJECTS_MAX_KEYS]
+                    response = await s3.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+                    )
+                    for error in response.get("Errors", []):
+                        path = keys.get(error.get("Key"))
+                        if path is not None:
+                            logger.warning(
+                                "s3_storage_delete_key_failed",
+                                physical_bucket=self.bucket_name,
+                                logical_bucket=bucket,
+                                path=path,
+                                error_code=error.get("Code"),
+                                error=error.get("Message"),
+                            )
+                            failed.append(path)
+                            key_errors += 1
+
+        except Exception as exc:
+            logger.error(
+                "s3_storage_delete_many_failed",
+                physical_bucket=self.bucket_name,
+                logical_bucket=bucket,
+                paths_count=len(paths),
+                region=self.region,
+                error_type=type(exc).__name__,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise self._handle_s3_error(exc, "delete", bucket, ", ".join(paths))
+
+        logger.info(
+            "s3_storage_delete_many_success",
+            physical_bucket=self.bucket_name,
+            logical_bucket=bucket,
+            deleted_count=len(keys) - key_errors,
+            failed_count=len(failed),
+            region=self.region,
+        )
+        return failed
+
     async def get_url(self, bucket: str, path: str, expires_in: int = 3600) -> str:
         """Generate presigned URL for S3 object.
 
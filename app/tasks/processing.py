@@ -4,12 +4,12 @@ from celery import shared_task
 from PIL import Image
 import io
 import asyncio
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 from pydantic import BaseModel
 
 from app.services.processor_service import ProcessorService
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, engine
 from app.storage import get_storage
 from app.core.config import settings
 from app.core.logging_config import get_logger
@@ -137,7 +137,22 @@ def process_variant(
     return buffer.read(), metadata
 
 
-async def _process_image_task_async(job_id: str, retry_func=None):
+def _run_async(coro):
+    """Run a coroutine on a fresh event loop for a Celery task.
+
+    The engine's pooled connections are disposed before the loop closes so
+    the next task never picks up a connection bound to a dead loop.
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(runner())
+
+
+async def _process_image_task_async(job_id: str, retry_func=None, sha256: Optional[str] = None):
     """Async implementation of processing task."""
     async with AsyncSessionLocal() as session:
         service = ProcessorService(session)
@@ -234,6 +249,9 @@ async def _process_image_task_async(job_id: str, retry_func=None):
             total_metadata = processing_result.model_dump()
             if job.get('processing_metadata'):
                 total_metadata = {**job['processing_metadata'], **total_metadata}
+            if sha256:
+                # Hashed by the API while streaming the upload to staging
+                total_metadata['sha256'] = sha256
 
             # Update job status: completed with paths and metadata
             await service.update_job_status(
@@ -295,7 +313,7 @@ async def _process_image_task_async(job_id: str, retry_func=None):
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def process_image_task(self, job_id: str):
+def process_image_task(self, job_id: str, sha256: Optional[str] = None):
     """Main image processing task.
 
     Performs:
@@ -310,6 +328,8 @@ def process_image_task(self, job_id: str):
     Args:
         self: Celery task instance (for retry)
         job_id: Processing job identifier
+        sha256: Hex SHA-256 of the original upload, recorded in the job's
+            processing_metadata on completion
 
     Returns:
         dict: Result with job_id, image_id, status
@@ -318,7 +338,7 @@ def process_image_task(self, job_id: str):
         Exception: Re-raises after max retries
     """
     logger.info("job_processing_started", job_id=job_id)
-    return asyncio.run(_process_image_task_async(job_id, self.retry))
+    return _run_async(_process_image_task_async(job_id, self.retry, sha256=sha256))
 
 
 @shared_task
@@ -353,7 +373,7 @@ def cleanup_old_staging_files():
                         )
             return cleaned
 
-    cleaned = asyncio.run(do_cleanup())
+    cleaned = _run_async(do_cleanup())
     logger.info("staging_cleanup_completed", files_cleaned=cleaned)
     return cleaned
 
@@ -373,7 +393,7 @@ def cleanup_old_rate_limits():
              cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
              return await service.cleanup_old_rate_limits(cutoff)
 
-    deleted = asyncio.run(do_cleanup())
+    deleted = _run_async(do_cleanup())
     logger.info("rate_limits_cleanup_completed", records_deleted=deleted)
     return deleted
 
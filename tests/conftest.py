@@ -21,11 +21,17 @@ from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+# The module-level engines in app.db.session are bound to DATABASE_PATH at
+# import time; keep them (and the app lifespan's schema setup) out of the
+# working tree.
+_APP_DB_DIR = tempfile.TemporaryDirectory(prefix="image-api-tests-")
+os.environ.setdefault("DATABASE_PATH", os.path.join(_APP_DB_DIR.name, "processor.db"))
+
 # Import the FastAPI app
 from app.main import app
 from app.core.config import settings
 from app.db.base import Base
-from app.db.session import get_session
+from app.db.session import get_session, get_read_session
 from app.storage.local import LocalStorageBackend
 from app.api.dependencies import get_processor_service
 
@@ -136,6 +142,7 @@ def client(test_db_session) -> TestClient:
         yield test_db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
 
     with TestClient(app) as c:
         yield c
@@ -157,6 +164,7 @@ async def async_client(test_db_session) -> AsyncGenerator[AsyncClient, None]:
         yield test_db_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session] = override_get_session
 
     from httpx import ASGITransport
     # AsyncClient(app=...) is deprecated. Use AsyncClient(transport=ASGITransport(app=...))
@@ -33,6 +33,62 @@ def test_health_check(client: TestClient):
     assert_iso_timestamp(data["timestamp"])
 
 
+@pytest.mark.unit
+def test_liveness_probe(client: TestClient):
+    """Test liveness probe returns a static JSON body."""
+    response = client.get("/api/v1/health/healthz")
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.unit
+def test_auth_health_skips_probe_while_breaker_open(client: TestClient):
+    """Test /auth reuses the last auth-api probe while the breaker is open."""
+    from app.api.v1 import health
+
+    breaker = AsyncMock()
+    breaker.get_state.return_value = "open"
+    breaker.get_failure_count.return_value = 5
+    service = AsyncMock(circuit_breaker=breaker)
+    http_client = AsyncMock()
+
+    health._stats_cache.invalidate()
+    with patch("app.core.authorization.get_authorization_service", AsyncMock(return_value=service)), \
+         patch.object(health, "_last_auth_api_probe", (0.0, False, "connection refused")), \
+         patch.object(health, "_get_health_http_client", return_value=http_client):
+        response = client.get("/api/v1/health/auth")
+    health._stats_cache.invalidate()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["circuit_breaker"]["state"] == "open"
+    assert data["auth_api"]["probe"]["skipped"] is True
+    assert data["auth_api"]["error"] == "connection refused"
+    http_client.get.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_shared_stats_serves_stale_copy_when_db_fails():
+    """Test /stats falls back to the stale Redis copy on database errors."""
+    import orjson
+    from sqlalchemy.exc import OperationalError
+    from app.api.v1 import health
+
+    redis_client = AsyncMock()
+    redis_client.get.return_value = orjson.dumps(
+        {"generated_at": 0, "payload": {"storage": {"total_jobs": 3}}}
+    )
+    failing = AsyncMock(side_effect=OperationalError("SELECT 1", {}, Exception("db down")))
+
+    with patch.object(health, "get_redis_pool", AsyncMock(return_value=redis_client)), \
+         patch.object(health, "_collect_statistics", failing):
+        payload = await health._get_shared_statistics()
+
+    assert payload == {"storage": {"total_jobs": 3}, "stale": True}
+    redis_client.set.assert_not_called()
+
+
 # ============================================================================
 # Configuration endpoint tests
 # ============================================================================
@@ -105,24 +161,22 @@ async def test_upload_image_success(
 
         mock_check.return_value = True
 
-        # Override rate limit dependency
-        from app.main import app
-        from app.api.dependencies import check_rate_limit
-        async def override_rate_limit():
-            return {"remaining": 50, "reset_at": "2025-01-01T00:00:00"}
-        app.dependency_overrides[check_rate_limit] = override_rate_limit
+        # Stub the Redis rate limiter
+        limiter = AsyncMock()
+        limiter.hit.return_value = {
+            "allowed": True, "remaining": 50, "reset_at": "2025-01-01T00:00:00", "token": "t"
+        }
 
         files = {"file": ("test.jpg", sample_image_bytes, "image/jpeg")}
         data = {"bucket": "system"}
 
-        response = await async_client.post(
-            "/api/v1/images/upload",
-            files=files,
-            data=data,
-            headers=auth_headers,
-        )
-
-        app.dependency_overrides.clear()
+        with patch("app.api.dependencies.get_rate_limiter", AsyncMock(return_value=limiter)):
+            response = await async_client.post(
+                "/api/v1/images/upload",
+                files=files,
+                data=data,
+                headers=auth_headers,
+            )
 
         if response.status_code == 401:
             print("DEBUG 401 Response:", response.json())
@@ -133,6 +187,263 @@ async def test_upload_image_success(
         assert result["job_id"] == "test-job-id"
         assert result["image_id"] == "test-image-id"
         assert result["status_url"] == "/api/v1/images/jobs/test-job-id"
+        assert response.headers["X-RateLimit-Remaining"] == "50"
+
+
+
+@pytest.mark.unit
+async def test_rate_limiter_reports_retry_after_and_caches_denial():
+    """Test sliding-window denials map to the limit dict and skip Redis after."""
+    import time
+    from unittest.mock import MagicMock
+    from app.core.rate_limit import UploadRateLimiter
+
+    reset_ms = int(time.time() * 1000) + 90_500
+    redis_client = MagicMock()
+    redis_client.register_script.return_value = AsyncMock(return_value=[0, 0, reset_ms])
+
+    limiter = UploadRateLimiter(redis_client, window_seconds=3600)
+    result = await limiter.hit("user-1", 50)
+
+    assert result["allowed"] is False
+    assert result["remaining"] == 0
+    assert 90 <= result["retry_after"] <= 91
+    assert redis_client.register_script.return_value.await_args.kwargs["keys"] == ["rl:{user-1}"]
+
+    # Denial is remembered locally: no second script call until reset
+    again = await limiter.hit("user-1", 50)
+    assert again["allowed"] is False
+    assert again["reset_at"] == result["reset_at"]
+    redis_client.register_script.return_value.assert_awaited_once()
+
+
+@pytest.mark.unit
+async def test_rate_limit_falls_back_to_database_without_redis():
+    """Test the upload rate limit uses SQLite counters when Redis is down."""
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from app.api.dependencies import AuthContext, check_rate_limit
+
+    limiter = AsyncMock()
+    limiter.hit.side_effect = RedisConnectionError("redis down")
+    service = AsyncMock()
+    service.check_rate_limit.return_value = {
+        "allowed": True, "remaining": 7, "reset_at": "2025-01-01T00:00:00+00:00"
+    }
+
+    with patch("app.api.dependencies.get_rate_limiter", AsyncMock(return_value=limiter)):
+        result = await check_rate_limit(AuthContext(user_id="user-1", org_id="org-1"), service)
+
+    assert result["remaining"] == 7
+    service.check_rate_limit.assert_awaited_once()
+
+
+@pytest.mark.unit
+async def test_upload_preflight_releases_slot_when_access_denied():
+    """Test a denied bucket check hands back the rate-limit slot taken in parallel."""
+    from fastapi import HTTPException
+    from app.api.dependencies import AuthContext, upload_preflight
+
+    limiter = AsyncMock()
+    limiter.hit.return_value = {
+        "allowed": True, "remaining": 4, "reset_at": "2025-01-01T00:00:00+00:00", "token": "slot-1"
+    }
+    auth_service = AsyncMock()
+    auth_service.check_access.side_effect = HTTPException(status_code=403, detail="denied")
+    auth = AuthContext(user_id="user-1", org_id="org-1")
+
+    with patch("app.api.dependencies.get_rate_limiter", AsyncMock(return_value=limiter)):
+        with pytest.raises(HTTPException) as exc_info:
+            await upload_preflight(auth, "org-org-1/groups/g1/", auth_service, AsyncMock())
+
+        assert exc_info.value.status_code == 403
+        limiter.release.assert_awaited_once_with("user-1", "slot-1")
+
+        auth_service.check_access.side_effect = None
+        preflight = await upload_preflight(auth, "org-org-1/groups/g1/", auth_service, AsyncMock())
+
+    assert preflight.auth is auth
+    assert preflight.rate_limit["remaining"] == 4
+    limiter.release.assert_awaited_once()
+
+
+@pytest.mark.unit
+async def test_group_permission_checks_share_one_auth_api_call():
+    """Test concurrent misses share one auth-api call and repeats stay in-process."""
+    import asyncio
+    from unittest.mock import MagicMock
+    from app.core import authorization
+    from app.core.authorization import AuthContext, AuthorizationService
+
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value=None)
+    redis_client.setex = AsyncMock()
+    service = AuthorizationService(redis_client)
+
+    async def slow_check(**kwargs):
+        await asyncio.sleep(0.01)
+        return True
+
+    service.auth_client.check_permission = AsyncMock(side_effect=slow_check)
+    service.circuit_breaker.execute = lambda func: func()
+    auth = AuthContext(user_id="user-1", org_id="org1", permissions=[])
+    authorization._local_allowed.clear()
+
+    results = await asyncio.gather(*[
+        service.check_access(auth, "image:upload", "org-org1/groups/g1/") for _ in range(5)
+    ])
+    assert results == [True] * 5
+    service.auth_client.check_permission.assert_awaited_once()
+
+    assert await service.check_access(auth, "image:upload", "org-org1/groups/g1/")
+    redis_client.get.assert_awaited_once()
+    authorization._local_allowed.clear()
+
+
+@pytest.mark.unit
+async def test_auth_cache_write_failure_does_not_fail_check():
+    """Test the decision cache write runs detached and Redis errors are only logged."""
+    import asyncio
+    from unittest.mock import MagicMock
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from app.core import authorization
+    from app.core.authorization import AuthContext, AuthorizationService
+
+    redis_client = MagicMock()
+    redis_client.get = AsyncMock(return_value=None)
+    redis_client.setex = AsyncMock(side_effect=RedisConnectionError("down"))
+    service = AuthorizationService(redis_client)
+    service.auth_client.check_permission = AsyncMock(return_value=True)
+    service.circuit_breaker.execute = lambda func: func()
+    auth = AuthContext(user_id="user-2", org_id="org1", permissions=[])
+
+    assert await service.check_access(auth, "image:upload", "org-org1/groups/g1/")
+    await asyncio.gather(*authorization._pending_cache_writes)
+    redis_client.setex.assert_awaited_once()
+    authorization._local_allowed.clear()
+
+
+@pytest.mark.unit
+async def test_closed_circuit_breaker_state_is_cached_locally():
+    """Test a closed breaker is read from Redis once and clean successes write nothing."""
+    from unittest.mock import MagicMock
+    from app.core import authorization
+    from app.core.authorization import CircuitBreaker
+
+    redis_client = MagicMock()
+    redis_client.mget = AsyncMock(return_value=[None, None, None])
+    redis_client.delete = AsyncMock()
+    redis_client.incr = AsyncMock(return_value=1)
+    authorization._breaker_closed.clear()
+
+    for _ in range(3):
+        assert await CircuitBreaker(redis_client).execute(AsyncMock(return_value=True)) is True
+
+    redis_client.mget.assert_awaited_once()
+    redis_client.delete.assert_not_awaited()
+
+    breaker = CircuitBreaker(redis_client)
+    await breaker.record_failure()
+    await breaker.record_success()
+    redis_client.delete.assert_awaited_once_with(CircuitBreaker.REDIS_KEY_FAILURES)
+
+    # An open circuit is read, opened_at included, with the same single MGET
+    from datetime import datetime, timezone
+    redis_client.mget = AsyncMock(return_value=[b"OPEN", b"5", datetime.now(timezone.utc).isoformat().encode()])
+    redis_client.get = AsyncMock()
+    authorization._breaker_closed.clear()
+    assert await CircuitBreaker(redis_client).is_open() is True
+    redis_client.mget.assert_awaited_once()
+    redis_client.get.assert_not_awaited()
+    authorization._breaker_closed.clear()
+
+
+@pytest.mark.unit
+def test_bucket_parse_is_memoized_for_valid_buckets():
+    """Test valid buckets are parsed once and invalid ones keep raising 400."""
+    from fastapi import HTTPException
+    from app.core.authorization import BucketValidator
+
+    first = BucketValidator().parse("org-org1/groups/g1/")
+    assert BucketValidator().parse("org-org1/groups/g1/") is first
+    assert (first.bucket_type, first.org_id, first.resource_id) == ("group", "org1", "g1")
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            BucketValidator().parse("not a bucket")
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.unit
+async def test_allowed_decision_ttl_per_base_permission():
+    """Test allowed decisions use the per-permission TTL, denials the denied TTL."""
+    from unittest.mock import MagicMock
+    from app.core import authorization
+    from app.core.authorization import AuthorizationCache
+
+    redis_client = MagicMock()
+    redis_client.setex = AsyncMock()
+    cache = AuthorizationCache(redis_client)
+    cache.ttl_by_permission = {"image:read": 300}
+
+    await cache.set("org1", "user-1", "image:read:group:g1", True)
+    await cache.set("org1", "user-1", "image:upload:group:g1", True)
+    await cache.set("org1", "user-1", "image:read:system", False)
+
+    ttls = [call.args[1] for call in redis_client.setex.await_args_list]
+    assert ttls == [300, cache.ttl_allowed, cache.ttl_denied]
+    authorization._local_allowed.clear()
+    authorization._local_denied.clear()
+
+
+@pytest.mark.unit
+async def test_prefetch_loads_group_decisions_with_one_mget():
+    """Test several bucket decisions are read in one MGET and then served in-process."""
+    from unittest.mock import MagicMock
+    from fastapi import HTTPException
+    from app.core import authorization
+    from app.core.authorization import AuthContext, AuthorizationService
+
+    redis_client = MagicMock()
+    redis_client.mget = AsyncMock(return_value=[b"1", b"0"])
+    redis_client.get = AsyncMock(return_value=None)
+    service = AuthorizationService(redis_client)
+    auth = AuthContext(user_id="user-1", org_id="org1", permissions=[])
+    authorization._local_allowed.clear()
+    authorization._local_denied.clear()
+
+    await service.prefetch(auth, "image:read", ["org-org1/groups/g1/", "org-org1/groups/g2/", "bad bucket"])
+
+    redis_client.mget.assert_awaited_once_with([
+        "auth:permission:org1:user-1:image:read:group:g1",
+        "auth:permission:org1:user-1:image:read:group:g2",
+    ])
+    assert await service.check_access(auth, "image:read", "org-org1/groups/g1/")
+    with pytest.raises(HTTPException) as exc_info:
+        await service.check_access(auth, "image:read", "org-org1/groups/g2/")
+    assert exc_info.value.status_code == 403
+    redis_client.get.assert_not_awaited()
+    authorization._local_allowed.clear()
+    authorization._local_denied.clear()
+
+
+@pytest.mark.unit
+async def test_validate_image_file_sniffs_signatures(sample_image_bytes: bytes):
+    """Test known image signatures are detected from the header and rewound."""
+    from io import BytesIO
+    from fastapi import HTTPException, UploadFile
+    from app.api.dependencies import validate_image_file
+
+    webp = b"RIFF\x24\x00\x00\x00WEBPVP8 " + bytes(32)
+    for data, expected in ((sample_image_bytes, "image/jpeg"), (webp, "image/webp")):
+        upload = UploadFile(BytesIO(data))
+        with patch("app.api.dependencies.magic.from_buffer") as from_buffer:
+            assert await validate_image_file(upload) == expected
+        from_buffer.assert_not_called()
+        assert await upload.read() == data
+
+    with pytest.raises(HTTPException) as exc_info:
+        await validate_image_file(UploadFile(BytesIO(b"WEBP is not at offset 8")))
+    assert exc_info.value.status_code == 415
 
 
 @pytest.mark.api
@@ -184,24 +495,21 @@ async def test_get_job_status_success(
     auth_headers: dict,
 ):
     """Test getting job status (mocked)."""
-    with patch("app.services.processor_service.ProcessorService.get_job") as mock_get_job:
-        mock_get_job.return_value = {
-            "job_id": "test-job-id",
-            "image_id": "test-image-id",
-            "status": "completed",
-            "storage_bucket": "system",
-            "staging_path": None,
-            "processed_paths": {},
-            "processing_metadata": {},
-            "user_id": "user",
-            "organization_id": "org",
-            "attempt_count": 0,
-            "max_retries": 3,
-            "last_error": None,
-            "created_at": "2025-11-19T12:00:00",
-            "started_at": None,
-            "completed_at": "2025-11-19T12:05:00"
-        }
+    from datetime import datetime, timezone
+    from app.services.processor_service import JobSummary
+
+    with patch("app.services.processor_service.ProcessorService.get_job_summary") as mock_get_job:
+        mock_get_job.return_value = JobSummary(
+            job_id="test-job-id",
+            image_id="test-image-id",
+            status="completed",
+            created_at=datetime(2025, 11, 19, 12, 0, tzinfo=timezone.utc),
+            completed_at=datetime(2025, 11, 19, 12, 5, tzinfo=timezone.utc),
+            last_error=None,
+            attempt_count=0,
+            processed_paths={},
+            processing_metadata={},
+        )
 
         response = await async_client.get(
             "/api/v1/images/jobs/test-job-id",
@@ -212,6 +520,7 @@ async def test_get_job_status_success(
 
         assert result["job_id"] == "test-job-id"
         assert result["status"] == "completed"
+        assert result["completed_at"] == "2025-11-19T12:05:00+00:00"
 
 
 @pytest.mark.api
@@ -221,7 +530,7 @@ async def test_get_job_status_not_found(
     auth_headers: dict,
 ):
     """Test getting non-existent job returns 404."""
-    with patch("app.services.processor_service.ProcessorService.get_job") as mock_get_job:
+    with patch("app.services.processor_service.ProcessorService.get_job_summary") as mock_get_job:
         mock_get_job.return_value = None
 
         response = await async_client.get(
@@ -231,6 +540,114 @@ async def test_get_job_status_not_found(
         assert response.status_code == 404
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_job_polls_share_one_lookup():
+    """Test concurrent polls for one job run a single summary query."""
+    import asyncio
+    from datetime import datetime, timezone
+    from app.api.v1 import upload
+    from app.services.processor_service import JobSummary
+
+    summary = JobSummary(
+        job_id="poll-job",
+        image_id="poll-image",
+        status="processing",
+        created_at=datetime(2025, 11, 19, 12, 0, tzinfo=timezone.utc),
+        completed_at=None,
+        last_error=None,
+        attempt_count=1,
+        processed_paths=None,
+        processing_metadata=None,
+    )
+    calls = 0
+
+    async def get_job_summary(job_id):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return summary
+
+    upload._recent_summaries.pop("poll-job")
+
+    with patch.object(upload, "_load_job_summary", get_job_summary):
+        results = await asyncio.gather(*(upload._get_job_summary("poll-job") for _ in range(5)))
+        assert await upload._get_job_summary("poll-job") is summary
+
+    assert results == [summary] * 5
+    assert calls == 1
+
+
+@pytest.mark.unit
+def test_image_delete_invalidates_job_status_cache():
+    """Test deleting an image drops its job's cached polling summary."""
+    from app.api.v1 import upload
+    from app.api.v1.retrieval import _invalidate_image
+
+    upload._completed_summaries.set("deleted-job", object())
+    upload._recent_summaries.set("deleted-job", object())
+
+    _invalidate_image("deleted-image", {
+        "job_id": "deleted-job",
+        "storage_bucket": "system",
+        "processed_paths": None,
+    })
+
+    assert upload._completed_summaries.get("deleted-job") is None
+    assert upload._recent_summaries.get("deleted-job") is None
+
+
+# ============================================================================
+# Retrieval endpoint tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_batch_retrieval_not_shadowed_by_image_route(client: TestClient):
+    """Test /images/batch reaches the batch handler, not /{image_id}."""
+    response = client.get("/api/v1/images/batch?image_ids=missing-1,missing-2")
+    assert response.status_code == 200
+    assert response.json() == {"images": [], "requested": 2, "found": 0}
+
+    response = client.get("/api/v1/images/batch?image_ids=" + ",".join(["x"] * 51))
+    assert response.status_code == 400
+
+
+
+@pytest.mark.unit
+def test_image_info_conditional_request(client: TestClient):
+    """Test image info carries an ETag and revalidates with 304."""
+    from app.api.v1.retrieval import _job_cache
+    _job_cache.clear()
+    job = {
+        "job_id": "test-job-id",
+        "storage_bucket": "system",
+        "processed_paths": {"medium": "processed/medium/test.webp"},
+        "processing_metadata": {"dominant_color": "#ffffff"},
+        "completed_at": "2025-11-19T12:05:00",
+    }
+    with patch(
+        "app.services.processor_service.ProcessorService.get_job_by_image_id",
+        new=AsyncMock(return_value=job),
+    ):
+        response = client.get("/api/v1/images/test-image-id")
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/v1/images/test-image-id", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get("/api/v1/images/test-image-id?size=thumbnail", headers={"If-None-Match": etag})
+        assert response.status_code == 404
+
+        # A re-signed URL invalidates the client's copy
+        from app.api.v1.retrieval import _url_cache
+        _url_cache.set(("system", "processed/medium/test.webp"), "https://example.test/resigned")
+        response = client.get("/api/v1/images/test-image-id", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["url"] == "https://example.test/resigned"
+        _url_cache.clear()
+
 # ============================================================================
 # Metrics endpoint tests
 # ============================================================================
@@ -244,3 +661,58 @@ def test_metrics_endpoint(client: TestClient):
 
     content = response.text
     assert "python_info" in content or "process_virtual_memory_bytes" in content
+
+    response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "http_requests_total" in response.text
+
+
+
+@pytest.mark.unit
+def test_metrics_label_route_templates(client: TestClient):
+    """Test request metrics use route templates instead of raw paths."""
+    from app.api.v1.metrics import _exposition_cache
+
+    client.get("/api/v1/images/metrics-label-probe")
+    _exposition_cache.invalidate()
+    content = client.get("/metrics").text
+
+    assert 'endpoint="/api/v1/images/{image_id}"' in content
+    assert "metrics-label-probe" not in content
+
+# ============================================================================
+# Dashboard tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_dashboard_ui_conditional_request(client: TestClient):
+    """Test dashboard page carries an ETag and revalidates with 304."""
+    response = client.get("/dashboard/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    etag = response.headers["etag"]
+
+    response = client.get("/dashboard/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.unit
+def test_failed_jobs_streams_large_limits(client: TestClient):
+    """Test /failed returns the same JSON document when streamed."""
+    response = client.get("/api/v1/health/failed?limit=1000")
+    assert response.status_code == 200
+    assert response.json() == {"failed_jobs": [], "total": 0}
+
+
+@pytest.mark.unit
+def test_failed_summary_and_recent(client: TestClient):
+    """Test failure summary counts and recent failure detail endpoints."""
+    response = client.get("/api/v1/health/failed/summary")
+    assert response.status_code == 200
+    assert set(response.json()) == {"last_hour", "last_24h", "total"}
+
+    response = client.get("/api/v1/health/failed/recent?limit=10")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == len(data["failed_jobs"]) <= 10
@@ -0,0 +1,152 @@
+"""
+Tests for the in-process TTL cache used by monitoring endpoints.
+
+Verifies single-flight refresh and TTL bounds.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from app.core.cache import ExpiringLRU, SingleFlight, TTLCache, cached_utc_timestamp
+
+
+# ============================================================================
+# TTLCache tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_ttl_cache_single_flight():
+    """Test concurrent misses share one computation."""
+    cache = TTLCache(min_ttl=5, max_ttl=15)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(
+        *(cache.get_or_compute("stats", factory) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert all(payload == {"value": 1} for payload, _ in results)
+
+    # Fresh entry is served without recomputing
+    payload, ttl = await cache.get_or_compute("stats", factory)
+    assert payload == {"value": 1}
+    assert calls == 1
+    assert 0 <= ttl <= 15
+
+
+@pytest.mark.unit
+async def test_ttl_cache_errors_are_not_cached():
+    """Test a failing computation propagates and is retried next call."""
+    cache = TTLCache(min_ttl=5, max_ttl=15)
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def working():
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("key", failing)
+
+    payload, _ = await cache.get_or_compute("key", working)
+    assert payload == "ok"
+
+
+@pytest.mark.unit
+async def test_ttl_cache_cancelled_caller_does_not_fail_waiters():
+    """Test cancelling the first caller leaves the shared refresh running."""
+    cache = TTLCache(min_ttl=5, max_ttl=15)
+    started = asyncio.Event()
+
+    async def factory():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "payload"
+
+    leader = asyncio.create_task(cache.get_or_compute("stats", factory))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_compute("stats", factory))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    payload, _ = await waiter
+    assert payload == "payload"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.unit
+def test_ttl_cache_ttl_bounds():
+    """Test TTL is derived from generation time within policy bounds."""
+    cache = TTLCache(min_ttl=5, max_ttl=15, buffer=1.0)
+    assert cache._ttl_for(0.01) == 5
+    assert cache._ttl_for(8.0) == 9.0
+    assert cache._ttl_for(60.0) == 15
+
+
+@pytest.mark.unit
+def test_cached_utc_timestamp_reuses_string_within_second():
+    """Test cached timestamp is ISO formatted and shared within a second."""
+    with patch("app.core.cache.time.time", return_value=1_700_000_000.2):
+        first = cached_utc_timestamp()
+    with patch("app.core.cache.time.time", return_value=1_700_000_000.9):
+        second = cached_utc_timestamp()
+    with patch("app.core.cache.time.time", return_value=1_700_000_001.0):
+        third = cached_utc_timestamp()
+
+    assert first is second
+    assert datetime.fromisoformat(first).timestamp() == 1_700_000_000
+    assert datetime.fromisoformat(third).timestamp() == 1_700_000_001
+
+
+# ============================================================================
+# ExpiringLRU tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_expiring_lru_expires_and_evicts():
+    """Test entries expire after ttl and the least recently used is evicted."""
+    cache = ExpiringLRU(maxsize=2, ttl=10)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    with patch("app.core.cache.time.monotonic", return_value=110.0):
+        assert cache.get("a", "miss") == "miss"
+    assert len(cache) == 1
+
+
+# ============================================================================
+# SingleFlight tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_single_flight_coalesces_overlapping_calls():
+    """Test overlapping calls share one execution and nothing is retained."""
+    flight = SingleFlight()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("key", factory) for _ in range(5)))
+    assert results == [1] * 5
+
+    # A later call starts a fresh execution
+    assert await flight.do("key", factory) == 2
@@ -138,3 +138,13 @@ def test_settings_image_sizes_type_safe():
     assert isinstance(settings.IMAGE_SIZES.medium, int)
     assert isinstance(settings.IMAGE_SIZES.large, int)
     assert isinstance(settings.IMAGE_SIZES.original, int)
+
+
+@pytest.mark.unit
+def test_redis_cache_url_falls_back_to_redis_url():
+    """Test cache Redis defaults to REDIS_URL unless REDIS_CACHE_URL is set."""
+    settings = Settings(REDIS_URL="redis://broker:6379/0", REDIS_CACHE_URL=None)
+    assert settings.redis_cache_url == "redis://broker:6379/0"
+
+    settings = Settings(REDIS_URL="redis://broker:6379/0", REDIS_CACHE_URL="redis://cache:6379/0")
+    assert settings.redis_cache_url == "redis://cache:6379/0"
@@ -192,3 +192,28 @@ def test_backward_compatibility_aliases():
     clear_correlation_id()
     assert get_correlation_id() is None
     assert get_trace_id() is None
+
+
+# ============================================================================
+# Level filtering tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_disabled_debug_skips_event_processing():
+    """Test debug calls below the logger level never reach the processor chain."""
+    import logging
+    from unittest.mock import patch
+    from app.core.logging_config import LevelCheckingBoundLogger
+
+    stdlib_logger = logging.getLogger("test.level_filtering")
+    stdlib_logger.setLevel(logging.INFO)
+    logger = LevelCheckingBoundLogger(stdlib_logger, processors=[], context={})
+
+    with patch.object(LevelCheckingBoundLogger, "_process_event") as process_event:
+        assert logger.debug("skipped", key="value") is None
+        process_event.assert_not_called()
+
+        stdlib_logger.setLevel(logging.DEBUG)
+        process_event.return_value = ((), {"msg": "processed"})
+        logger.debug("processed", key="value")
+        process_event.assert_called_once()
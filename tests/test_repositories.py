@@ -0,0 +1,143 @@
+"""
+Repository layer tests for image-api.
+
+Tests query helpers and database-maintained counters against a fresh
+SQLite database.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import update
+
+from app.db.models import ProcessingJob
+from app.repositories.job_repository import JobRepository
+from app.repositories.job_stats_repository import JobStatsRepository
+
+
+def _job(image_id: str, status: str = "pending") -> ProcessingJob:
+    return ProcessingJob(
+        job_id=str(uuid4()),
+        image_id=image_id,
+        status=status,
+        storage_bucket="test-bucket",
+    )
+
+
+# ============================================================================
+# JobRepository tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_latest_completed_by_image_ids_single_query(test_db_session):
+    """Test batch lookup returns the newest completed job per image_id."""
+    repo = JobRepository(test_db_session)
+    image_a, image_b, image_c = str(uuid4()), str(uuid4()), str(uuid4())
+    now = datetime.now(timezone.utc)
+
+    older, newer = _job(image_a, "completed"), _job(image_a, "completed")
+    older.completed_at = now - timedelta(minutes=5)
+    newer.completed_at = now
+    only_b = _job(image_b, "completed")
+    only_b.completed_at = now
+    test_db_session.add_all([newer, older, only_b, _job(image_c, "failed")])
+    await test_db_session.commit()
+
+    jobs = await repo.get_latest_completed_by_image_ids([image_a, image_b, image_c, image_a])
+
+    assert set(jobs) == {image_a, image_b}
+    assert jobs[image_a].job_id == newer.job_id
+    assert jobs[image_b].job_id == only_b.job_id
+    assert await repo.get_latest_completed_by_image_ids([]) == {}
+
+
+@pytest.mark.unit
+async def test_summary_row_selects_polling_columns(test_db_session):
+    """Test the polling lookup returns the job's status columns without an entity."""
+    repo = JobRepository(test_db_session)
+    job = _job(str(uuid4()), "completed")
+    job.processed_paths = {"thumbnail": "processed/thumbnail/x.webp"}
+    test_db_session.add(job)
+    await test_db_session.commit()
+
+    row = await repo.get_summary_row(job.job_id)
+
+    assert row.job_id == job.job_id
+    assert row.status == "completed"
+    assert row.processed_paths == job.processed_paths
+    assert row.created_at.tzinfo is not None
+    assert await repo.get_summary_row(str(uuid4())) is None
+
+
+# ============================================================================
+# JobStatsRepository tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_job_counters_follow_inserts_updates_deletes(test_db_session):
+    """Test trigger-maintained counters track job lifecycle changes."""
+    repo = JobStatsRepository(test_db_session)
+    image_a, image_b = str(uuid4()), str(uuid4())
+    first = _job(image_a)
+    test_db_session.add_all([first, _job(image_a), _job(image_b, "failed")])
+    await test_db_session.commit()
+
+    counters = await repo.get_counters()
+    assert counters["total_jobs"] == 3
+    assert counters["distinct_images"] == 2
+    assert counters["status"] == {"pending": 2, "failed": 1}
+
+    await test_db_session.execute(
+        update(ProcessingJob).where(ProcessingJob.job_id == first.job_id).values(status="completed")
+    )
+    await test_db_session.delete(await test_db_session.get(ProcessingJob, first.job_id))
+    await test_db_session.commit()
+
+    counters = await repo.get_counters()
+    assert counters["total_jobs"] == 2
+    assert counters["distinct_images"] == 2
+    assert counters["status"] == {"pending": 1, "failed": 1}
+
+
+@pytest.mark.unit
+async def test_job_counters_rebuild_matches_table(test_db_session):
+    """Test startup backfill recomputes counters from processing_jobs."""
+    repo = JobStatsRepository(test_db_session)
+    test_db_session.add_all([_job(str(uuid4()), "completed") for _ in range(3)])
+    await test_db_session.commit()
+
+    expected = await repo._aggregate_counters()
+    await repo.rebuild()
+    await test_db_session.commit()
+
+    assert await repo.get_counters() == expected
+
+
+# ============================================================================
+# Session pool tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_read_engine_connections_are_query_only(tmp_path):
+    """Test the read-only pool rejects writes on SQLite."""
+    from sqlalchemy import event, text
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.db.session import _apply_sqlite_pragmas, _apply_sqlite_query_only
+    from app.db.session import engine, read_engine as app_read_engine
+
+    # Pool wiring only; connections are checked on a throwaway database below
+    if engine.dialect.name == "sqlite":
+        assert app_read_engine is not engine
+
+    read_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'read.db'}")
+    event.listen(read_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(read_engine.sync_engine, "connect", _apply_sqlite_query_only)
+
+    try:
+        async with read_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+            with pytest.raises(OperationalError):
+                await conn.execute(text("CREATE TABLE read_pool_probe (x INTEGER)"))
+    finally:
+        await read_engine.dispose()
@@ -5,12 +5,20 @@ Tests business logic in the service layer without HTTP concerns.
 This demonstrates the testability benefits of the service layer pattern.
 """
 
+import io
 import pytest
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from fastapi import BackgroundTasks, UploadFile
+
+from app.services import image_service
 from app.services.image_service import ImageService
+from app.services.processor_service import ProcessorService
+from app.core.config import settings
 from app.core.errors import ServiceError, ErrorCode
+from app.tasks import celery_app as celery_module
 
 
 # ============================================================================
@@ -212,3 +220,171 @@ async def test_get_job_status_not_found(test_db):
     assert error.code == ErrorCode.JOB_NOT_FOUND
     assert error.http_status == 404
     assert "nonexistent-job-id" in error.message
+
+
+# ============================================================================
+# Upload streaming tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_read_chunks_enforces_limit_on_received_bytes():
+    """Test _read_chunks raises 413 once the bytes received exceed the limit."""
+    import hashlib
+
+    def upload(size: int) -> UploadFile:
+        return UploadFile(file=io.BytesIO(b"x" * size), filename="upload.jpg")
+
+    limit = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    with patch.object(image_service, "UPLOAD_CHUNK_SIZE", limit // 4):
+        hasher = hashlib.sha256()
+        chunks = [c async for c in ImageService._read_chunks(upload(limit), hasher)]
+        assert sum(map(len, chunks)) == limit
+        assert hasher.hexdigest() == hashlib.sha256(b"x" * limit).hexdigest()
+
+        received = []
+        with pytest.raises(ServiceError) as exc_info:
+            async for chunk in ImageService._read_chunks(upload(limit + 1), hashlib.sha256()):
+                received.append(chunk)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.code == ErrorCode.UPLOAD_FILE_TOO_LARGE
+    assert sum(map(len, received)) == limit
+
+
+# ============================================================================
+# Background staging tests
+# ============================================================================
+
+class _BrokenFile(io.BytesIO):
+    """Upload body whose connection drops after the first read."""
+
+    def read(self, size=-1):
+        if self.tell():
+            raise OSError("client disconnected")
+        return super().read(size)
+
+
+async def _accept_upload(service: ImageService, file) -> tuple:
+    """Run process_new_upload the way the endpoint does, deferring staging."""
+    background_tasks = BackgroundTasks()
+    result = await service.process_new_upload(
+        file=file,
+        bucket="test-bucket",
+        auth_user_id="user-123",
+        auth_org_id="org-456",
+        metadata_json="{}",
+        content_length=0,
+        detected_mime="image/jpeg",
+        background_tasks=background_tasks,
+    )
+    return result, background_tasks
+
+
+def _staged_files(storage_path: str) -> list:
+    return list((Path(storage_path) / "test-bucket" / "staging").glob("*"))
+
+
+@pytest.mark.unit
+async def test_upload_is_accepted_before_staging_runs(test_db_session, test_storage, test_env):
+    """Test the job is created and returned before the staging write runs."""
+    service = ImageService(ProcessorService(test_db_session), test_storage)
+    file = UploadFile(file=io.BytesIO(b"image-bytes"), filename="upload.jpg")
+
+    with patch.object(celery_module, "process_image_task") as mock_task:
+        result, background_tasks = await _accept_upload(service, file)
+
+        job = await service.processor_service.get_job(result["job_id"])
+        assert job["status"] == "pending"
+        assert _staged_files(test_env["storage_path"]) == []
+        mock_task.delay.assert_not_called()
+
+        await background_tasks()
+
+    assert [f.read_bytes() for f in _staged_files(test_env["storage_path"])] == [b"image-bytes"]
+    mock_task.delay.assert_called_once()
+
+
+@pytest.mark.unit
+async def test_background_staging_failure_marks_job_failed(test_db_session, test_storage, test_env):
+    """Test a stream that breaks during staging fails the job and leaves no file."""
+    service = ImageService(ProcessorService(test_db_session), test_storage)
+    file = UploadFile(file=_BrokenFile(b"x" * 16), filename="upload.jpg")
+
+    with patch.object(image_service, "UPLOAD_CHUNK_SIZE", 4), \
+         patch.object(celery_module, "process_image_task") as mock_task:
+        result, background_tasks = await _accept_upload(service, file)
+        await background_tasks()
+
+    job = await service.processor_service.get_job(result["job_id"])
+    assert job["status"] == "failed"
+    assert "Storage save failed" in job["last_error"]
+    assert _staged_files(test_env["storage_path"]) == []
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_background_queue_failure_marks_job_failed(test_db_session, test_storage, test_env):
+    """Test a task queue failure fails the job and removes the staged file."""
+    service = ImageService(ProcessorService(test_db_session), test_storage)
+    file = UploadFile(file=io.BytesIO(b"image-bytes"), filename="upload.jpg")
+
+    with patch.object(celery_module, "process_image_task") as mock_task:
+        mock_task.delay.side_effect = ConnectionError("broker unavailable")
+        result, background_tasks = await _accept_upload(service, file)
+        await background_tasks()
+
+    job = await service.processor_service.get_job(result["job_id"])
+    assert job["status"] == "failed"
+    assert "Task queue failed" in job["last_error"]
+    assert _staged_files(test_env["storage_path"]) == []
+
+
+@pytest.mark.unit
+async def test_background_oversized_stream_marks_job_failed(test_db_session, test_storage, test_env):
+    """Test a body over MAX_UPLOAD_SIZE_MB ends as a failed job, not an exception."""
+    service = ImageService(ProcessorService(test_db_session), test_storage)
+    file = UploadFile(file=io.BytesIO(b"x" * (1024 * 1024 + 1)), filename="upload.jpg")
+
+    with patch.object(settings, "MAX_UPLOAD_SIZE_MB", 1), \
+         patch.object(celery_module, "process_image_task") as mock_task:
+        result, background_tasks = await _accept_upload(service, file)
+        await background_tasks()
+
+    job = await service.processor_service.get_job(result["job_id"])
+    assert job["status"] == "failed"
+    assert _staged_files(test_env["storage_path"]) == []
+    mock_task.delay.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_staging_digest_reaches_processed_metadata(test_db_session, test_storage):
+    """Test the digest hashed while staging is queued and stored by the task."""
+    import hashlib
+    from PIL import Image
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.tasks import processing
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format="JPEG")
+    content = buffer.getvalue()
+
+    service = ImageService(ProcessorService(test_db_session), test_storage)
+    file = UploadFile(file=io.BytesIO(content), filename="upload.jpg")
+
+    with patch.object(image_service, "UPLOAD_CHUNK_SIZE", 64), \
+         patch.object(celery_module, "process_image_task") as mock_task:
+        result, background_tasks = await _accept_upload(service, file)
+        await background_tasks()
+
+    job_id = result["job_id"]
+    mock_task.delay.assert_called_once_with(job_id, sha256=hashlib.sha256(content).hexdigest())
+
+    sessions = async_sessionmaker(test_db_session.bind, expire_on_commit=False)
+    with patch.object(processing, "AsyncSessionLocal", sessions), \
+         patch.object(processing, "get_storage", return_value=test_storage):
+        await processing._process_image_task_async(job_id, **mock_task.delay.call_args.kwargs)
+
+    async with sessions() as session:
+        job = await ProcessorService(session).get_job(job_id)
+    assert job["status"] == "completed"
+    assert job["processing_metadata"]["sha256"] == hashlib.sha256(content).hexdigest()
@@ -0,0 +1,159 @@
+"""
+Storage backend tests for image-api.
+
+S3 calls go to a mocked client; the local backend writes under tmp_path.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+from app.storage.local import LocalStorageBackend
+from app.storage.s3 import S3StorageBackend
+
+
+def _s3_backend(client: AsyncMock) -> S3StorageBackend:
+    """S3 backend whose client context yields the given mock."""
+    backend = S3StorageBackend(region="eu-west-1", bucket_name="test-bucket")
+
+    @asynccontextmanager
+    async def get_client():
+        yield client
+
+    backend._get_s3_client = get_client
+    return backend
+
+
+# ============================================================================
+# delete_many tests
+# ============================================================================
+
+@pytest.mark.unit
+async def test_s3_delete_many_maps_key_errors_to_paths():
+    """Test per-key DeleteObjects errors come back as the caller's paths."""
+    client = AsyncMock()
+    client.delete_objects.return_value = {
+        "Errors": [{"Key": "org-1/b.webp", "Code": "AccessDenied", "Message": "denied"}]
+    }
+    backend = _s3_backend(client)
+
+    with patch("app.storage.s3.logger") as log:
+        failed = await backend.delete_many("org-1", ["a.webp", "b.webp", "../escape"])
+
+    assert failed == ["../escape", "b.webp"]
+    request = client.delete_objects.await_args.kwargs
+    assert request["Delete"]["Objects"] == [{"Key": "org-1/a.webp"}, {"Key": "org-1/b.webp"}]
+    summary = log.info.call_args.kwargs
+    assert summary["deleted_count"] == 1
+    assert summary["failed_count"] == 2
+
+
+@pytest.mark.unit
+async def test_s3_delete_many_chunks_at_1000_keys():
+    """Test large deletes are split into DeleteObjects requests of 1000 keys."""
+    client = AsyncMock()
+    client.delete_objects.return_value = {}
+    backend = _s3_backend(client)
+
+    failed = await backend.delete_many("org-1", [f"{i}.webp" for i in range(2500)])
+
+    assert failed == []
+    sizes = [len(call.kwargs["Delete"]["Objects"]) for call in client.delete_objects.await_args_list]
+    assert sizes == [1000, 1000, 500]
+
+
+@pytest.mark.unit
+async def test_local_delete_many_reports_failed_paths(tmp_path):
+    """Test local delete_many removes files and returns the paths it could not delete."""
+    storage = LocalStorageBackend(base_path=str(tmp_path))
+    (tmp_path / "bucket").mkdir()
+    (tmp_path / "bucket" / "a.webp").write_bytes(b"a")
+    (tmp_path / "bucket" / "b.webp").write_bytes(b"b")
+    (tmp_path / "bucket" / "dir.webp").mkdir()
+
+    failed = await storage.delete_many("bucket", ["a.webp", "b.webp", "dir.webp"])
+
+    assert failed == ["dir.webp"]
+    assert not (tmp_path / "bucket" / "a.webp").exists()
+    assert not (tmp_path / "bucket" / "b.webp").exists()
+
+
+# ============================================================================
+# save_stream tests
+# ============================================================================
+
+async def _stream(*chunks: bytes, error: Exception = None):
+    for chunk in chunks:
+        yield chunk
+    if error is not None:
+        raise error
+
+
+@pytest.mark.unit
+async def test_s3_save_stream_small_upload_uses_put_object():
+    """Test a stream smaller than one part is sent with a single PutObject."""
+    client = AsyncMock()
+    backend = _s3_backend(client)
+
+    path = await backend.save_stream(_stream(b"abc", b"def"), "org-1", "staging/small")
+
+    assert path == "org-1/staging/small"
+    assert client.put_object.await_args.kwargs["Body"] == b"abcdef"
+    client.create_multipart_upload.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_s3_save_stream_uploads_parts_and_completes():
+    """Test a stream larger than one part goes through a multipart upload."""
+    client = AsyncMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.side_effect = [{"ETag": "etag-1"}, {"ETag": "etag-2"}, {"ETag": "etag-3"}]
+    backend = _s3_backend(client)
+
+    with patch("app.storage.s3._MULTIPART_PART_SIZE", 4):
+        await backend.save_stream(_stream(b"abcd", b"efgh", b"ij"), "org-1", "staging/large")
+
+    bodies = [call.kwargs["Body"] for call in client.upload_part.await_args_list]
+    assert bodies == [b"abcd", b"efgh", b"ij"]
+    client.put_object.assert_not_called()
+    client.complete_multipart_upload.assert_awaited_once()
+    assert client.complete_multipart_upload.await_args.kwargs["MultipartUpload"] == {"Parts": [
+        {"PartNumber": 1, "ETag": "etag-1"},
+        {"PartNumber": 2, "ETag": "etag-2"},
+        {"PartNumber": 3, "ETag": "etag-3"},
+    ]}
+
+
+@pytest.mark.unit
+async def test_s3_save_stream_aborts_multipart_upload_on_stream_error():
+    """Test a failing stream aborts the unfinished multipart upload."""
+    client = AsyncMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.return_value = {"ETag": "etag-1"}
+    backend = _s3_backend(client)
+
+    with patch("app.storage.s3._MULTIPART_PART_SIZE", 4), pytest.raises(RuntimeError):
+        await backend.save_stream(
+            _stream(b"abcd", error=RuntimeError("client went away")), "org-1", "staging/broken"
+        )
+
+    client.abort_multipart_upload.assert_awaited_once_with(
+        Bucket="test-bucket", Key="org-1/staging/broken", UploadId="upload-1"
+    )
+    client.complete_multipart_upload.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_local_save_stream_removes_partial_file_on_error(tmp_path):
+    """Test a failing stream leaves no partial file behind."""
+    storage = LocalStorageBackend(base_path=str(tmp_path))
+
+    with pytest.raises(RuntimeError):
+        await storage.save_stream(
+            _stream(b"partial", error=RuntimeError("client went away")), "bucket", "staging/broken"
+        )
+
+    assert not (tmp_path / "bucket" / "staging" / "broken").exists()
+
+    await storage.save_stream(_stream(b"abc", b"def"), "bucket", "staging/ok")
+    assert (tmp_path / "bucket" / "staging" / "ok").read_bytes() == b"abcdef"